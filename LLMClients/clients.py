@@ -1,27 +1,205 @@
+import asyncio
+import atexit
+import inspect
 import os
-from openai import OpenAI
+import threading
+import weakref
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from google import genai
 from dotenv import load_dotenv
 
 load_dotenv()
+
+OPENAI_MODEL = "gpt-5-mini"
+GEMINI_MODEL = "gemini-2.5-pro"
+
+# Connection pool / fan-out settings shared by every Model instance
+MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "60"))
+BATCH_CONCURRENCY = int(os.getenv("LLM_BATCH_CONCURRENCY", "8"))
+
+# Process-wide client registry: one sync client per provider, and one async
+# client per provider per event loop (async connections cannot cross loops).
+_clients = {}
+_async_clients = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+# Synchronous batch calls all run on one long-lived loop in a daemon thread, so its
+# async clients (and their keep-alive connections) are reused across batches
+_batch_loop = None
+_batch_loop_lock = threading.Lock()
+
+
+def _pool_limits():
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def _create_client(LLM_name, asynchronous=False):
+    if LLM_name == "OPENAI":
+        if asynchronous:
+            return AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                http_client=DefaultAsyncHttpxClient(limits=_pool_limits()),
+            )
+        return OpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=DefaultHttpxClient(limits=_pool_limits()),
+        )
+    elif LLM_name == "GEMINI":
+        return genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+    raise ValueError(f"Unsupported LLM provider: {LLM_name}")
+
+
+def get_client(LLM_name):
+    """Return the shared sync client for a provider, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(LLM_name)
+        if client is None:
+            client = _clients[LLM_name] = _create_client(LLM_name)
+        return client
+
+
+def get_async_client(LLM_name):
+    """Return the shared async client for a provider on the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(LLM_name)
+        if client is None:
+            client = loop_clients[LLM_name] = _create_client(LLM_name, asynchronous=True)
+        return client
+
+
+async def _aclose_clients(clients):
+    for client in clients:
+        # google-genai keeps its async API (and connections) on client.aio
+        aio = getattr(client, "aio", None)
+        close = getattr(aio, "aclose", None) if aio is not None else getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            print(f"⚠️ Failed to close LLM client: {e}")
+
+
+def _close_async_clients(loop, clients):
+    """Close async clients on the loop that owns their connections."""
+    if loop.is_closed():
+        return
+    coro = _aclose_clients(clients)
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is running:
+        loop.create_task(coro)
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=30)
+    else:
+        loop.run_until_complete(coro)
+
+
+def reset_clients():
+    """Close and drop all cached clients (e.g. after changing API keys or base URLs)."""
+    with _clients_lock:
+        for client in _clients.values():
+            close = getattr(client, "close", None)
+            if close:
+                close()
+        _clients.clear()
+        async_clients = [(loop, list(clients.values())) for loop, clients in _async_clients.items()]
+        _async_clients.clear()
+    for loop, clients in async_clients:
+        _close_async_clients(loop, clients)
+
+
+def _get_batch_loop():
+    global _batch_loop
+    with _batch_loop_lock:
+        if _batch_loop is None or _batch_loop.is_closed():
+            _batch_loop = asyncio.new_event_loop()
+            threading.Thread(target=_batch_loop.run_forever, name="llm-batch-loop", daemon=True).start()
+        return _batch_loop
+
+
+def run_batch(coro):
+    """Run a coroutine on the shared batch loop from synchronous code and return its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_batch_loop()).result()
+
+
+@atexit.register
+def _shutdown_clients():
+    global _batch_loop
+    reset_clients()
+    with _batch_loop_lock:
+        loop, _batch_loop = _batch_loop, None
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
+
+
 class Model:
     def __init__(self, LLM_name, prompt):
         self.LLM_name = LLM_name
         self.prompt = prompt
 
     def get_response_from_client(self):
+        client = get_client(self.LLM_name)
         if self.LLM_name == "OPENAI":
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
             response = client.chat.completions.create(
-                model="gpt-5-mini",   # you can adjust model
+                model=OPENAI_MODEL,   # you can adjust model
                 messages=[{"role": "user", "content": self.prompt}],
             )
             return response.choices[0].message.content.strip()
-        
+
         elif self.LLM_name == "GEMINI":
-            client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
             response = client.models.generate_content(
-                model="gemini-2.5-pro", contents=self.prompt
+                model=GEMINI_MODEL, contents=self.prompt
+            )
+            return response.candidates[0].content.parts[0].text.strip()
+
+    async def agenerate(self):
+        """Async variant of get_response_from_client using the pooled async client."""
+        client = get_async_client(self.LLM_name)
+        if self.LLM_name == "OPENAI":
+            response = await client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[{"role": "user", "content": self.prompt}],
             )
-            return response.candidates[0].content.parts[0].text.strip()   
-        
\ No newline at end of file
+            return response.choices[0].message.content.strip()
+
+        elif self.LLM_name == "GEMINI":
+            response = await client.aio.models.generate_content(
+                model=GEMINI_MODEL, contents=self.prompt
+            )
+            return response.candidates[0].content.parts[0].text.strip()
+
+
+async def agenerate_many(prompts, LLM_name="GEMINI", max_concurrency=BATCH_CONCURRENCY):
+    """
+    Fan prompts out over the shared connection pool.
+    Returns responses in prompt order; a failed prompt yields None.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(prompt):
+        async with semaphore:
+            try:
+                return await Model(LLM_name, prompt).agenerate()
+            except Exception as e:
+                print(f"⚠️ LLM call failed: {e}")
+                return None
+
+    return list(await asyncio.gather(*(run(prompt) for prompt in prompts)))
+
+
+def generate_many(prompts, LLM_name="GEMINI", max_concurrency=BATCH_CONCURRENCY):
+    """Blocking wrapper around agenerate_many for synchronous callers."""
+    return run_batch(agenerate_many(prompts, LLM_name, max_concurrency))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark AppliedTracker.is_applied against a synthetic tracker.
+
+Usage: python benchmarks/bench_applied_tracker.py [rows]
+"""
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from job_fit_analysis.applied_tracker import AppliedTracker, TrackerEntry
+
+TITLES = [
+    "software developer", "frontend developer", "backend engineer", "full stack developer",
+    "qa automation engineer", "react developer", "node.js developer", "cloud engineer",
+    "devops engineer", "associate software engineer",
+]
+WORDS = "react node typescript python aws docker kubernetes sql api testing agile cloud java".split()
+
+
+def synthetic_entries(rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    companies = [f"company {i}" for i in range(max(1, rows // 25))]
+    entries = []
+    for i in range(rows):
+        title = rng.choice(TITLES)
+        if rng.random() < 0.3:
+            title += f" ({rng.choice(['hybrid', 'remote', 'contract'])})"
+        description = " ".join(rng.choice(WORDS) for _ in range(150))
+        entries.append(TrackerEntry(rng.choice(companies), title, description, datetime.now()))
+    return entries
+
+
+def bench(tracker: AppliedTracker, queries, label: str) -> None:
+    start = time.perf_counter()
+    hits = sum(tracker.is_applied(c, p, job_description=d) for c, p, d in queries)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {len(queries)} lookups, {hits} hits, {elapsed / len(queries) * 1000:.3f} ms/lookup")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    entries = synthetic_entries(rows)
+
+    start = time.perf_counter()
+    tracker = AppliedTracker(entries=entries)
+    print(f"Indexed {rows} tracker rows in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rng = random.Random(11)
+    sample = rng.sample(entries, 500)
+    bench(tracker, [(e.company, e.position, e.description) for e in sample], "exact hits")
+    bench(tracker, [(e.company, e.position + " (hybrid)", e.description) for e in sample], "near-duplicate titles")
+    bench(tracker, [(f"unknown {i}", "software developer", "python") for i in range(500)], "misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark LinkedIn job card extraction on the local results-page fixture.
+
+Compares the old per-card round trips (query_selector + inner_text per field)
+with the single page.evaluate used by LinkedInAdapter.extract_card_summaries.
+Needs a Playwright Chromium (`playwright install chromium`).
+
+Usage: python benchmarks/bench_card_extraction.py [repeats]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from playwright.async_api import async_playwright
+
+from linkedin_scraper import (
+    CARD_COMPANY_SELECTOR,
+    CARD_LINK_SELECTOR,
+    CARD_LOCATION_SELECTOR,
+    CARD_SELECTOR,
+    CARD_TITLE_SELECTOR,
+    LinkedInJobScraper,
+)
+from checkpoint import ScrapeCheckpoint
+from seen_jobs import SeenJobIndex
+from job_store.store import JobStore
+
+FIXTURE = PROJECT_ROOT / "tests" / "fixtures" / "linkedin_search_results.html"
+
+
+async def per_card(page):
+    cards = []
+    for element in await page.query_selector_all(CARD_SELECTOR):
+        title_el = await element.query_selector(CARD_TITLE_SELECTOR)
+        company_el = await element.query_selector(CARD_COMPANY_SELECTOR)
+        location_el = await element.query_selector(CARD_LOCATION_SELECTOR)
+        link_el = await element.query_selector(CARD_LINK_SELECTOR)
+        cards.append((
+            await title_el.inner_text() if title_el else "N/A",
+            await company_el.inner_text() if company_el else "N/A",
+            await location_el.inner_text() if location_el else "N/A",
+            await link_el.get_attribute("href") if link_el else None,
+        ))
+    return cards
+
+
+async def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = LinkedInJobScraper(
+            seen_index=SeenJobIndex(Path(tmp) / "seen.sqlite3"),
+            checkpoint=ScrapeCheckpoint(Path(tmp) / "checkpoint.sqlite3"),
+            job_store=JobStore(Path(tmp) / "jobs.sqlite3"),
+        )
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            page = await browser.new_page()
+            await page.set_content(FIXTURE.read_text(encoding="utf-8"))
+
+            for label, extract in (("per-card round trips", per_card), ("single evaluate", scraper.adapter.extract_card_summaries)):
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    cards = await extract(page)
+                elapsed = (time.perf_counter() - start) / repeats
+                print(f"{label:<22} {len(cards)} cards in {elapsed * 1000:.1f} ms/page "
+                      f"({elapsed / len(cards) * 1000:.2f} ms/card)")
+            await browser.close()
+        scraper.seen_index.close()
+        scraper.checkpoint.close()
+        scraper.job_store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-job orchestration overhead: one interpreter per stage vs. one long-lived process.
+
+"subprocess" spawns a fresh interpreter per job that imports the pipeline's heavy
+dependencies and loads the applied-jobs tracker, as main.py used to do for every
+test.py run. "in-process" pays those costs once and then reuses them for every job.
+
+Usage: python benchmarks/bench_pipeline_overhead.py [jobs] [tracker_rows]
+"""
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+HEAVY_IMPORTS = "import openai, google.genai, google.generativeai, docx, openpyxl"
+JOB_SNIPPET = f"""
+import sys
+sys.path.insert(0, {str(PROJECT_ROOT)!r})
+{HEAVY_IMPORTS}
+from job_fit_analysis.applied_tracker import AppliedTracker
+tracker = AppliedTracker(excel_path=sys.argv[1])
+tracker.is_applied("company 1", "software developer")
+"""
+
+
+def write_tracker(path: Path, rows: int, seed: int = 7) -> None:
+    from openpyxl import Workbook
+
+    rng = random.Random(seed)
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Job Tracker"
+    ws.append(["Company", "Position", "Applied Date", "Job Description"])
+    today = datetime.today().strftime("%B %d, %Y")
+    for i in range(rows):
+        description = " ".join(rng.choice("react node python aws docker sql api".split()) for _ in range(150))
+        ws.append([f"company {i % 500}", f"software developer {i}", today, description])
+    wb.save(path)
+
+
+def bench_subprocess(jobs: int, tracker_path: Path) -> float:
+    start = time.perf_counter()
+    for _ in range(jobs):
+        subprocess.run([sys.executable, "-c", JOB_SNIPPET, str(tracker_path)], check=True)
+    return time.perf_counter() - start
+
+
+def bench_in_process(jobs: int, tracker_path: Path) -> float:
+    start = time.perf_counter()
+    exec(HEAVY_IMPORTS)
+    from job_fit_analysis.applied_tracker import AppliedTracker
+
+    tracker = AppliedTracker(excel_path=tracker_path)
+    for _ in range(jobs):
+        tracker.is_applied("company 1", "software developer")
+    return time.perf_counter() - start
+
+
+def main():
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker_path = Path(tmp) / "Job Tracker.xlsx"
+        write_tracker(tracker_path, rows)
+
+        # The subprocess runs go first so the in-process run cannot warm their imports
+        sub = bench_subprocess(jobs, tracker_path)
+        inproc = bench_in_process(jobs, tracker_path)
+
+    print(f"{'subprocess per job':<20} {sub:.2f}s total, {sub / jobs * 1000:.0f} ms/job")
+    print(f"{'in-process':<20} {inproc:.2f}s total, {inproc / jobs * 1000:.0f} ms/job")
+    print(f"Overhead saved: {(sub - inproc) / jobs * 1000:.0f} ms/job ({sub / max(inproc, 1e-9):.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
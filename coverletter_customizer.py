@@ -1,6 +1,9 @@
 import os
 import subprocess
 import shutil
+import sys
+import tempfile
+import threading
 from pathlib import Path
 from docx import Document
 from LLMClients.clients import Model
@@ -113,6 +116,8 @@ def convert_docx_to_pdf(docx_path: str) -> str:
             cmd = [
                 libreoffice_cmd,
                 "--headless",
+                # Per-worker profile so concurrent application workers (processes or threads) can convert in parallel
+                f"-env:UserInstallation={Path(tempfile.gettempdir(), f'lo_profile_{os.getpid()}_{threading.get_ident()}').as_uri()}",
                 "--convert-to", "pdf",
                 "--outdir", str(output_dir),
                 str(docx_path_obj)
@@ -158,24 +163,25 @@ def convert_docx_to_pdf(docx_path: str) -> str:
     return None
 
 # === Step 2: get cover letter template path ===
-cover_letter_path_file = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/cover_letter_path.txt"
-with open(cover_letter_path_file, "r") as f:
-    cover_letter_template_path = f.read().strip()
+COVER_LETTER_PATH_FILE = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/cover_letter_path.txt"
 
-resume_folder = os.path.dirname(cover_letter_template_path)
-resume_path = get_resume_from_folder(resume_folder)
 
-# === Step 3: read job description ===
-jd_path = os.path.join(os.path.dirname(cover_letter_template_path), "job_description.txt")
-with open(jd_path, "r") as f:
-    job_description = f.read()
+def customize_cover_letter(cover_letter_template_path):
+    """Generate the cover letter (DOCX + PDF) next to its template and return the DOCX path."""
+    resume_folder = os.path.dirname(cover_letter_template_path)
+    resume_path = get_resume_from_folder(resume_folder)
 
-# === Step 4: prepare prompt ===
-with open(resume_path, "rb") as f:
-    resume_doc = Document(f)
-    resume_text = "\n".join([p.text for p in resume_doc.paragraphs])
+    # === Step 3: read job description ===
+    jd_path = os.path.join(os.path.dirname(cover_letter_template_path), "job_description.txt")
+    with open(jd_path, "r") as f:
+        job_description = f.read()
 
-prompt = f"""
+    # === Step 4: prepare prompt ===
+    with open(resume_path, "rb") as f:
+        resume_doc = Document(f)
+        resume_text = "\n".join([p.text for p in resume_doc.paragraphs])
+
+    prompt = f"""
 You are an assistant that writes professional job application cover letters.
 Use the resume and job description below to generate only the **body text**
 of the cover letter (no greeting like "Hi Hiring Team" and no ending with my name).
@@ -188,34 +194,45 @@ Job Description:
 {job_description}
 """
 
-llm = Model("GEMINI", prompt)
+    llm = Model("GEMINI", prompt)
+
+    # # response = client.chat.completions.create(
+    # #     model="gpt-5-mini",   # you can adjust model
+    # #     messages=[{"role": "user", "content": prompt}],
+    # # )
+    # response = client.models.generate_content(
+    #     model="gemini-2.5-pro", contents=prompt
+    # )
 
-# # response = client.chat.completions.create(
-# #     model="gpt-5-mini",   # you can adjust model
-# #     messages=[{"role": "user", "content": prompt}],
-# # )
-# response = client.models.generate_content(
-#     model="gemini-2.5-pro", contents=prompt
-# )
+    # # cover_letter_body = response.choices[0].message.content.strip()
+    # cover_letter_body = response.candidates[0].content.parts[0].text
+    cover_letter_body = llm.get_response_from_client()
 
-# # cover_letter_body = response.choices[0].message.content.strip()
-# cover_letter_body = response.candidates[0].content.parts[0].text
-cover_letter_body = llm.get_response_from_client()
+    # === Step 5: insert into template ===
+    doc = Document(cover_letter_template_path)
+
+    for para in doc.paragraphs:
+        if "{{COVER_LETTER_BODY}}" in para.text:
+            para.text = cover_letter_body
+            para.style = "NewCoverLetterStyle"  # Apply your custom style
+            break
 
-# === Step 5: insert into template ===
-doc = Document(cover_letter_template_path)
+    output_path = cover_letter_template_path.replace("_Template.docx", ".docx")
+    doc.save(output_path)
 
-for para in doc.paragraphs:
-    if "{{COVER_LETTER_BODY}}" in para.text:
-        para.text = cover_letter_body
-        para.style = "NewCoverLetterStyle"  # Apply your custom style
-        break
+    print(f"✅ Cover letter generated: {output_path}")
 
-output_path = cover_letter_template_path.replace("_Template.docx", ".docx")
-doc.save(output_path)
+    # Export cover letter as PDF
+    print("📄 Exporting cover letter to PDF...")
+    convert_docx_to_pdf(output_path)
+    return output_path
 
-print(f"✅ Cover letter generated: {output_path}")
 
-# Export cover letter as PDF
-print("📄 Exporting cover letter to PDF...")
-convert_docx_to_pdf(output_path)
+if __name__ == "__main__":
+    # Passed explicitly by test.py so concurrent workers don't race on the shared record file
+    if len(sys.argv) > 1:
+        template_path = sys.argv[1]
+    else:
+        with open(COVER_LETTER_PATH_FILE, "r") as f:
+            template_path = f.read().strip()
+    customize_cover_letter(template_path)
@@ -1,10 +1,27 @@
-from LLMClients.clients import Model
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
 
-def clean_job_description(job_description):
-    """
-    Clean job description using LLM to remove fluff and keep only relevant technical information.
-    """
-    prompt = f"""You are a professional job data cleaner for an automated resume-matching system.
+from LLMClients.clients import BATCH_CONCURRENCY, Model, agenerate_many, run_batch
+from job_store.store import JobStore
+
+# Bump whenever the cleaning prompt changes so stale cache entries are ignored
+CLEANING_PROMPT_VERSION = "1"
+# Bump whenever description_fingerprint changes so entries keyed the old way are ignored
+FINGERPRINT_VERSION = "2"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / "jd_cache.sqlite3"
+CACHE_PATH = os.getenv("JD_CLEANING_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+DEFAULT_JOBS_PATH = Path(__file__).resolve().parents[1] / "job_fit_analysis" / "linkedin_jobs.json"
+
+
+def build_cleaning_prompt(job_description):
+    return f"""You are a professional job data cleaner for an automated resume-matching system.
 
 Your goal is to clean the following job description by keeping only the core technical and role-relevant information.
 
@@ -29,13 +46,248 @@ The goal is to make the text concise and focused for an LLM-based resume-to-job
 JOB DESCRIPTION TO CLEAN:
 {job_description}"""
 
+
+def description_fingerprint(job_description):
+    """
+    Hash of the description with case, punctuation and whitespace normalized, so reposts
+    that only differ in formatting collide. Digits are kept: salaries, years of experience
+    and versions end up in the cleaned text.
+    """
+    normalized = re.sub(r"[\W_]+", " ", (job_description or "").lower()).strip()
+    digest = hashlib.sha256(f"{FINGERPRINT_VERSION}\x00{CLEANING_PROMPT_VERSION}\x00{normalized}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CleanedDescriptionCache:
+    """SQLite cache of cleaned descriptions keyed by description_fingerprint."""
+
+    def __init__(self, db_path=CACHE_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cleaned_descriptions ("
+            "fingerprint TEXT PRIMARY KEY, cleaned TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, fingerprint):
+        row = self._conn.execute(
+            "SELECT cleaned FROM cleaned_descriptions WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, fingerprint, cleaned):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cleaned_descriptions (fingerprint, cleaned, created_at) VALUES (?, ?, ?)",
+            (fingerprint, cleaned, time.time()),
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def clean_job_description(job_description, cache=None):
+    """
+    Clean job description using LLM to remove fluff and keep only relevant technical information.
+    """
+    if cache is None:
+        with CleanedDescriptionCache() as cache:
+            return clean_job_description(job_description, cache)
+
+    fingerprint = description_fingerprint(job_description)
+    cached = cache.get(fingerprint)
+    if cached:
+        print("♻️ Using cached cleaned job description")
+        return cached
+
     # Use the LLMClients class to get cleaned job description
-    llm = Model("GEMINI", prompt)
+    llm = Model("GEMINI", build_cleaning_prompt(job_description))
     print(f"Cleaning job description...")
-    try:    
+    try:
         cleaned_description = llm.get_response_from_client()
     except Exception as e:
         print(f"Error cleaning job description: {e}")
         return job_description.strip()
     print(f"Job description cleaned successfully")
-    return cleaned_description.strip()
\ No newline at end of file
+    cache.set(fingerprint, cleaned_description.strip())
+    return cleaned_description.strip()
+
+
+async def clean_jobs(jobs, max_concurrency=BATCH_CONCURRENCY, cache=None):
+    """
+    Batch-clean job descriptions in place (job["cleaned_description"]).
+    Near-identical descriptions are cleaned once, cached results are reused and
+    the remaining descriptions are cleaned concurrently. Returns run statistics.
+    """
+    if cache is None:
+        with CleanedDescriptionCache() as cache:
+            return await clean_jobs(jobs, max_concurrency, cache)
+
+    groups = {}
+    for job in jobs:
+        description = job.get("description", "")
+        if not description.strip():
+            continue
+        groups.setdefault(description_fingerprint(description), []).append(job)
+
+    cleaned_by_fingerprint = {}
+    misses = []
+    for fingerprint, group in groups.items():
+        cached = cache.get(fingerprint)
+        if cached:
+            cleaned_by_fingerprint[fingerprint] = cached
+        else:
+            misses.append(fingerprint)
+
+    print(f"🧹 Cleaning {len(misses)} descriptions ({len(groups) - len(misses)} cached, "
+          f"{sum(len(g) for g in groups.values()) - len(groups)} duplicates)...")
+    prompts = [build_cleaning_prompt(groups[fp][0]["description"]) for fp in misses]
+    responses = await agenerate_many(prompts, LLM_name="GEMINI", max_concurrency=max_concurrency)
+    failed = 0
+    for fingerprint, response in zip(misses, responses):
+        if response:
+            cleaned_by_fingerprint[fingerprint] = response.strip()
+            cache.set(fingerprint, response.strip())
+        else:
+            failed += 1
+
+    # Failed descriptions stay without cleaned_description, so the next run retries them
+    # (the analyzer and customizer fall back to the raw description meanwhile)
+    for fingerprint, group in groups.items():
+        if fingerprint in cleaned_by_fingerprint:
+            for job in group:
+                job["cleaned_description"] = cleaned_by_fingerprint[fingerprint]
+
+    stats = {
+        "jobs": len(jobs),
+        "unique_descriptions": len(groups),
+        "duplicates": sum(len(g) for g in groups.values()) - len(groups),
+        "cache_hits": len(groups) - len(misses),
+        "llm_calls": len(misses),
+        "failed": failed,
+    }
+    stats["cache_hit_rate"] = stats["cache_hits"] / stats["unique_descriptions"] if groups else 0.0
+    print(
+        f"✅ JD cleaning done: {stats['unique_descriptions']} unique / {stats['jobs']} jobs, "
+        f"cache hit rate {stats['cache_hit_rate']:.0%}, {stats['llm_calls']} LLM calls, {failed} failed"
+    )
+    return stats
+
+
+async def clean_job_stream(in_queue, out_queue, max_concurrency=BATCH_CONCURRENCY, cache=None, end=None, store=None):
+    """
+    Streaming variant of clean_jobs: clean each job from in_queue as it arrives and
+    forward it to out_queue, then forward the `end` sentinel once everything is done.
+    Descriptions that are already being cleaned are awaited instead of sent again.
+    Cleaned descriptions are saved to the job store (if given) so later runs reuse them.
+    Returns run statistics like clean_jobs.
+    """
+    own_cache = cache is None
+    cache = CleanedDescriptionCache() if own_cache else cache
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    in_flight = {}
+    tasks = []
+    cleaned_jobs = []
+    stats = {"duplicates": 0, "cache_hits": 0, "llm_calls": 0, "failed": 0}
+
+    async def clean(fingerprint, description):
+        cached = cache.get(fingerprint)
+        if cached:
+            stats["cache_hits"] += 1
+            return cached
+        async with semaphore:
+            stats["llm_calls"] += 1
+            try:
+                cleaned = (await Model("GEMINI", build_cleaning_prompt(description)).agenerate()).strip()
+            except Exception as e:
+                # Left uncleaned so the next run retries it; consumers fall back to the raw description
+                print(f"⚠️ JD cleaning failed, using raw description: {e}")
+                stats["failed"] += 1
+                return None
+        cache.set(fingerprint, cleaned)
+        return cleaned
+
+    async def forward(job):
+        description = job.get("description", "")
+        if description.strip():
+            fingerprint = description_fingerprint(description)
+            if fingerprint in in_flight:
+                stats["duplicates"] += 1
+            else:
+                in_flight[fingerprint] = asyncio.ensure_future(clean(fingerprint, description))
+            cleaned = await in_flight[fingerprint]
+            if cleaned:
+                job["cleaned_description"] = cleaned
+                cleaned_jobs.append(job)
+        await out_queue.put(job)
+
+    try:
+        while True:
+            job = await in_queue.get()
+            if job is end:
+                break
+            tasks.append(asyncio.create_task(forward(job)))
+        await asyncio.gather(*tasks)
+        if store is not None:
+            store.set_cleaned_descriptions(cleaned_jobs)
+    finally:
+        if own_cache:
+            cache.close()
+        await out_queue.put(end)
+
+    stats["jobs"] = len(tasks)
+    stats["unique_descriptions"] = len(in_flight)
+    stats["cache_hit_rate"] = stats["cache_hits"] / stats["unique_descriptions"] if in_flight else 0.0
+    print(
+        f"✅ Streamed JD cleaning: {stats['unique_descriptions']} unique / {stats['jobs']} jobs, "
+        f"cache hit rate {stats['cache_hit_rate']:.0%}, {stats['llm_calls']} LLM calls, {stats['failed']} failed"
+    )
+    return stats
+
+
+async def aclean_jobs_file(jobs_path=DEFAULT_JOBS_PATH, max_concurrency=BATCH_CONCURRENCY):
+    """Clean every job in a scraped jobs JSON file and write the result back."""
+    with open(jobs_path, "r", encoding="utf-8") as f:
+        jobs = json.load(f)
+    stats = await clean_jobs(jobs, max_concurrency)
+    with open(jobs_path, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, ensure_ascii=False, indent=2)
+    return stats
+
+
+def clean_jobs_file(jobs_path=DEFAULT_JOBS_PATH, max_concurrency=BATCH_CONCURRENCY):
+    return run_batch(aclean_jobs_file(jobs_path, max_concurrency))
+
+
+async def aclean_store_jobs(store=None, max_concurrency=BATCH_CONCURRENCY):
+    """Clean the pending jobs of the job store that have no cleaned description yet."""
+    own_store = store is None
+    store = store or JobStore()
+    try:
+        jobs = [job for job in store.pending_jobs() if not job.get("cleaned_description")]
+        stats = await clean_jobs(jobs, max_concurrency)
+        store.set_cleaned_descriptions(jobs)
+        return stats
+    finally:
+        if own_store:
+            store.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch-clean scraped job descriptions")
+    parser.add_argument("jobs_path", nargs="?", default=str(DEFAULT_JOBS_PATH))
+    parser.add_argument("--store", action="store_true", help="clean the pending jobs of the job store instead of a file")
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY)
+    args = parser.parse_args()
+    if args.store:
+        run_batch(aclean_store_jobs(max_concurrency=args.concurrency))
+    else:
+        clean_jobs_file(args.jobs_path, args.concurrency)
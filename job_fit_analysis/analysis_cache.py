@@ -0,0 +1,110 @@
+"""
+Persistent, content-addressed cache for job-fit analysis results.
+
+Entries are keyed by a hash of (resume text, job description, prompt
+version, model name), so a job is only re-scored when one of those inputs
+actually changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / "analysis_cache.sqlite3"
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_ENTRIES = 5000
+# Inserts between evictions, so long (streaming) runs stay bounded too
+EVICT_EVERY = 100
+
+
+def make_cache_key(resume_text: str, job_description: str, prompt_version: str, model_name: str) -> str:
+    digest = hashlib.sha256()
+    for part in (resume_text, job_description, prompt_version, model_name):
+        digest.update(part.strip().encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_CACHE_PATH,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._sets_since_evict = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                analysis TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed ON analysis_cache (accessed_at)"
+        )
+        self._conn.commit()
+        self.evict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis dict, or None on a miss or expired entry."""
+        row = self._conn.execute(
+            "SELECT analysis, created_at FROM analysis_cache WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self._conn.execute("UPDATE analysis_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, analysis: Dict[str, Any]) -> None:
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO analysis_cache (key, analysis, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(analysis, ensure_ascii=False), now, now),
+        )
+        self._conn.commit()
+        self._sets_since_evict += 1
+        if self._sets_since_evict >= EVICT_EVERY:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then the least recently used ones above max_entries."""
+        cutoff = time.time() - self.ttl_seconds
+        removed = self._conn.execute("DELETE FROM analysis_cache WHERE created_at < ?", (cutoff,)).rowcount
+        removed += self._conn.execute(
+            """
+            DELETE FROM analysis_cache WHERE key IN (
+                SELECT key FROM analysis_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        self._conn.commit()
+        self._sets_since_evict = 0
+        return removed
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+    def close(self) -> None:
+        self.evict()
+        self._conn.close()
@@ -0,0 +1,170 @@
+"""
+Append-only journal of submitted applications.
+
+Every application is appended to a SQLite database in WAL mode, which is
+the system of record. The Job Tracker workbook is updated from the journal
+in one batch per run (`export_to_excel`) instead of being rewritten for
+every single application. Standalone callers use `schedule_export`, which
+exports each workbook once when the process exits (or on `flush_exports`).
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from openpyxl import Workbook, load_workbook
+
+
+JOURNAL_SUFFIX = ".journal.sqlite3"
+TRACKER_HEADERS = ["Company", "Position", "Applied Date", "Job Description"]
+
+
+def journal_path_for(excel_path: Path) -> Path:
+    """The journal lives next to the tracker workbook it feeds."""
+    return Path(excel_path).with_suffix(JOURNAL_SUFFIX)
+
+
+class ApplicationJournal:
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS applications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company TEXT NOT NULL,
+                position TEXT NOT NULL,
+                applied_date TEXT NOT NULL,
+                applied_at TEXT NOT NULL,
+                job_description TEXT NOT NULL DEFAULT '',
+                exported_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_applied_at ON applications (applied_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_exported ON applications (exported_at)")
+
+    def append(self, company: str, position: str, applied_date: str, job_description: Optional[str] = None) -> int:
+        """Durably record one application and return its journal id."""
+        cursor = self._conn.execute(
+            "INSERT INTO applications (company, position, applied_date, applied_at, job_description) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (company, position, applied_date, datetime.now().isoformat(), job_description or ""),
+        )
+        return cursor.lastrowid
+
+    def entries_since(self, cutoff: datetime) -> List[Tuple[str, str, str, str]]:
+        """(company, position, job_description, applied_at) for applications after cutoff."""
+        return self._conn.execute(
+            "SELECT company, position, job_description, applied_at FROM applications WHERE applied_at >= ?",
+            (cutoff.isoformat(),),
+        ).fetchall()
+
+    def export_to_excel(self, excel_path: Path, sheet_name: str) -> int:
+        """Append all not-yet-exported applications to the workbook in a single save."""
+        excel_path = Path(excel_path)
+        # BEGIN IMMEDIATE serializes exporters so overlapping runs never export a row twice
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            pending = self._conn.execute(
+                "SELECT id, company, position, applied_date, job_description FROM applications "
+                "WHERE exported_at IS NULL ORDER BY id"
+            ).fetchall()
+            if not pending:
+                self._conn.execute("COMMIT")
+                return 0
+
+            if excel_path.exists():
+                wb = load_workbook(excel_path)
+                if sheet_name in wb.sheetnames:
+                    ws = wb[sheet_name]
+                else:
+                    ws = wb.create_sheet(sheet_name)
+                    ws.append(TRACKER_HEADERS)
+            else:
+                wb = Workbook()
+                ws = wb.active
+                ws.title = sheet_name
+                ws.append(TRACKER_HEADERS)
+
+            for _, company, position, applied_date, job_description in pending:
+                ws.append([company, position, applied_date, job_description])
+
+            tmp_path = excel_path.with_name(excel_path.stem + ".tmp" + excel_path.suffix)
+            wb.save(tmp_path)
+            os.replace(tmp_path, excel_path)
+
+            self._conn.executemany(
+                "UPDATE applications SET exported_at = ? WHERE id = ?",
+                [(time.time(), row[0]) for row in pending],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        print(f"💾 Exported {len(pending)} journaled applications to {excel_path}")
+        return len(pending)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# (workbook, sheet) pairs with journaled applications to export before the process exits
+_scheduled_exports: Set[Tuple[str, str]] = set()
+_scheduled_exports_lock = threading.Lock()
+
+
+def schedule_export(excel_path: Path, sheet_name: str) -> None:
+    """Export the journal to the workbook once, at exit or on the next flush_exports()"""
+    with _scheduled_exports_lock:
+        _scheduled_exports.add((str(excel_path), sheet_name))
+
+
+@atexit.register
+def flush_exports() -> int:
+    """Run the scheduled exports, one workbook save each; returns the number of rows exported"""
+    with _scheduled_exports_lock:
+        pending = sorted(_scheduled_exports)
+        _scheduled_exports.clear()
+    exported = 0
+    for excel_path, sheet_name in pending:
+        journal = ApplicationJournal(journal_path_for(excel_path))
+        try:
+            exported += journal.export_to_excel(excel_path, sheet_name)
+        except Exception as e:
+            # Rows stay unexported in the journal and go out with the next export
+            print(f"⚠️ Failed to export the application journal to {excel_path}: {e}")
+        finally:
+            journal.close()
+    return exported
+
+
+def main():
+    from job_fit_analysis.applied_tracker import DEFAULT_SHEET_NAME, DEFAULT_TRACKER_PATH
+
+    parser = argparse.ArgumentParser(description="Sync the application journal into the Job Tracker workbook")
+    parser.add_argument("--excel-path", default=os.getenv("JOB_TRACKER_PATH", str(DEFAULT_TRACKER_PATH)))
+    parser.add_argument("--sheet", default=os.getenv("JOB_TRACKER_SHEET", DEFAULT_SHEET_NAME))
+    args = parser.parse_args()
+
+    journal = ApplicationJournal(journal_path_for(args.excel_path))
+    try:
+        exported = journal.export_to_excel(args.excel_path, args.sheet)
+        if not exported:
+            print("ℹ️ No pending applications to export")
+    finally:
+        journal.close()
+
+
+if __name__ == "__main__":
+    main()
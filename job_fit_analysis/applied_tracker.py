@@ -1,24 +1,37 @@
 """
 Utility for checking whether a job has already been applied to,
 based on entries stored in the Job Tracker Excel workbook.
+
+The workbook is only parsed when it changes; a compact SQLite snapshot
+(truncated, pre-hashed descriptions) next to it serves all other loads.
+Applications recorded in the append-only journal are picked up immediately,
+before they have been exported to the workbook.
 """
 from __future__ import annotations
 
+import hashlib
 import os
 import re
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from openpyxl import load_workbook
 from rapidfuzz import fuzz
 
+from job_fit_analysis.application_journal import ApplicationJournal, journal_path_for
+
 
 DEFAULT_TRACKER_PATH = Path("/Users/Roger/Documents/FullTime-Resume/Job Tracker.xlsx")
 DEFAULT_SHEET_NAME = "Job Tracker"
 DEFAULT_LOOKBACK_DAYS = 90  # ~ 2 months
 DEFAULT_SIMILARITY_THRESHOLD = 92
+DEFAULT_TITLE_SIMILARITY_THRESHOLD = 90
+DESCRIPTION_SNIPPET_CHARS = 800
+SNAPSHOT_SUFFIX = ".snapshot.sqlite3"
+SNAPSHOT_SCHEMA_VERSION = "1"
 
 
 def _parse_tracker_date(value) -> Optional[datetime]:
@@ -47,12 +60,34 @@ def _get_cell(row: tuple, index: Optional[int]):
     return row[index] if index < len(row) else None
 
 
+def _normalize(value: Optional[str]) -> str:
+    return (value or "").strip().lower()
+
+
+def _title_tokens(position: str) -> Set[str]:
+    return set(re.findall(r"[a-z0-9]+", position))
+
+
+def _description_hash(description: str) -> str:
+    snippet = (description or "")[:DESCRIPTION_SNIPPET_CHARS]
+    return hashlib.sha1(snippet.encode("utf-8")).hexdigest() if snippet else ""
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 @dataclass
 class TrackerEntry:
     company: str
     position: str
     description: str
     applied_date: Optional[datetime]
+    description_hash: str = ""
 
 
 class AppliedTracker:
@@ -62,67 +97,198 @@ class AppliedTracker:
         sheet_name: str = DEFAULT_SHEET_NAME,
         lookback_days: int = DEFAULT_LOOKBACK_DAYS,
         similarity_threshold: int = DEFAULT_SIMILARITY_THRESHOLD,
+        title_similarity_threshold: int = DEFAULT_TITLE_SIMILARITY_THRESHOLD,
+        entries: Optional[Iterable[TrackerEntry]] = None,
+        snapshot_path: Optional[Path] = None,
+        journal_path: Optional[Path] = None,
     ):
         self.excel_path = Path(excel_path)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.excel_path.with_suffix(SNAPSHOT_SUFFIX)
+        self.journal_path = Path(journal_path) if journal_path else journal_path_for(self.excel_path)
         self.sheet_name = sheet_name
         self.lookback_days = lookback_days
         self.similarity_threshold = similarity_threshold
+        self.title_similarity_threshold = title_similarity_threshold
         self.entries: List[TrackerEntry] = []
-        self._load_entries()
+        # (company, position) -> entries, and (company, title token) -> entry indices
+        self._exact_index: Dict[Tuple[str, str], List[TrackerEntry]] = {}
+        self._blocking_index: Dict[Tuple[str, str], List[int]] = {}
+        if entries is not None:
+            self.entries = list(entries)
+        else:
+            self._load_entries()
+        self._build_index()
+
+    def _build_index(self) -> None:
+        exact_index: Dict[Tuple[str, str], List[TrackerEntry]] = {}
+        blocking_index: Dict[Tuple[str, str], List[int]] = {}
+        for idx, entry in enumerate(self.entries):
+            exact_index.setdefault((entry.company, entry.position), []).append(entry)
+            for token in _title_tokens(entry.position):
+                blocking_index.setdefault((entry.company, token), []).append(idx)
+        self._exact_index = exact_index
+        self._blocking_index = blocking_index
 
     def _load_entries(self) -> None:
+        cutoff = datetime.now() - timedelta(days=self.lookback_days)
+        self.entries = self._load_workbook_entries(cutoff) + self._load_journal_entries(cutoff)
+
+    def _load_workbook_entries(self, cutoff: datetime) -> List[TrackerEntry]:
         if not self.excel_path.exists():
             print(f"⚠️ Tracker not found at {self.excel_path}. Skipping duplicate filtering.")
-            self.entries = []
-            return
+            return []
+
+        rows = self._read_snapshot()
+        if rows is None:
+            rows = self._read_workbook_rows()
+            if rows is None:
+                return []
+            self._write_snapshot(rows)
 
+        entries: List[TrackerEntry] = []
+        for company, position, description, description_hash, applied_raw in rows:
+            applied_date = datetime.fromisoformat(applied_raw) if applied_raw else None
+            if applied_date and applied_date < cutoff:
+                continue
+            entries.append(
+                TrackerEntry(
+                    company=company,
+                    position=position,
+                    description=description,
+                    applied_date=applied_date,
+                    description_hash=description_hash,
+                )
+            )
+        return entries
+
+    def _load_journal_entries(self, cutoff: datetime) -> List[TrackerEntry]:
+        """Recent applications from the journal (exported rows may also be in the workbook)."""
+        if not self.journal_path.exists():
+            return []
         try:
-            wb = load_workbook(self.excel_path, data_only=True)
+            journal = ApplicationJournal(self.journal_path)
+            try:
+                rows = journal.entries_since(cutoff)
+            finally:
+                journal.close()
+        except sqlite3.Error as exc:
+            print(f"⚠️ Failed to read application journal {self.journal_path}: {exc}")
+            return []
+
+        entries: List[TrackerEntry] = []
+        for company, position, description, applied_at in rows:
+            snippet = (description or "")[:DESCRIPTION_SNIPPET_CHARS]
+            entries.append(
+                TrackerEntry(
+                    company=_normalize(company),
+                    position=_normalize(position),
+                    description=snippet,
+                    applied_date=datetime.fromisoformat(applied_at),
+                    description_hash=_description_hash(snippet),
+                )
+            )
+        return entries
+
+    def _read_workbook_rows(self) -> Optional[List[Tuple[str, str, str, str, Optional[str]]]]:
+        """Parse the workbook into snapshot rows (all dates, truncated descriptions)."""
+        try:
+            wb = load_workbook(self.excel_path, data_only=True, read_only=True)
         except Exception as exc:
             print(f"⚠️ Failed to open tracker {self.excel_path}: {exc}")
-            self.entries = []
-            return
+            return None
 
-        if self.sheet_name not in wb.sheetnames:
-            print(f"⚠️ Sheet '{self.sheet_name}' not found in tracker. Skipping duplicate filtering.")
-            self.entries = []
-            return
+        try:
+            if self.sheet_name not in wb.sheetnames:
+                print(f"⚠️ Sheet '{self.sheet_name}' not found in tracker. Skipping duplicate filtering.")
+                return None
 
-        ws = wb[self.sheet_name]
-        header_map = _build_header_map(ws)
+            ws = wb[self.sheet_name]
+            header_map = _build_header_map(ws)
 
-        company_idx = header_map.get("company", 0)
-        position_idx = header_map.get("position", 1)
-        date_idx = header_map.get("applied date", 2)
-        description_idx = header_map.get("job description")
+            company_idx = header_map.get("company", 0)
+            position_idx = header_map.get("position", 1)
+            date_idx = header_map.get("applied date", 2)
+            description_idx = header_map.get("job description")
 
-        cutoff = datetime.now() - timedelta(days=self.lookback_days)
-        entries: List[TrackerEntry] = []
+            rows = []
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if not row:
+                    continue
+                company_raw = _get_cell(row, company_idx)
+                position_raw = _get_cell(row, position_idx)
+                if not company_raw or not position_raw:
+                    continue
 
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if not row:
-                continue
-            company_raw = _get_cell(row, company_idx)
-            position_raw = _get_cell(row, position_idx)
-            if not company_raw or not position_raw:
-                continue
+                applied_date = _parse_tracker_date(_get_cell(row, date_idx))
+                description_val = str(_get_cell(row, description_idx) or "")[:DESCRIPTION_SNIPPET_CHARS]
 
-            applied_date = _parse_tracker_date(_get_cell(row, date_idx))
-            if applied_date and applied_date < cutoff:
-                continue
+                rows.append((
+                    str(company_raw).strip().lower(),
+                    str(position_raw).strip().lower(),
+                    description_val,
+                    _description_hash(description_val),
+                    applied_date.isoformat() if applied_date else None,
+                ))
+            return rows
+        finally:
+            wb.close()
 
-            description_val = _get_cell(row, description_idx) or ""
+    def _workbook_signature(self) -> Dict[str, str]:
+        stat = self.excel_path.stat()
+        return {
+            "schema": SNAPSHOT_SCHEMA_VERSION,
+            "sheet": self.sheet_name,
+            "mtime_ns": str(stat.st_mtime_ns),
+            "size": str(stat.st_size),
+        }
 
-            entries.append(
-                TrackerEntry(
-                    company=str(company_raw).strip().lower(),
-                    position=str(position_raw).strip().lower(),
-                    description=str(description_val),
-                    applied_date=applied_date,
-                )
-            )
+    def _read_snapshot(self) -> Optional[List[Tuple[str, str, str, str, Optional[str]]]]:
+        """Return snapshot rows if the sidecar still matches the workbook, else None."""
+        if not self.snapshot_path.exists():
+            return None
+        try:
+            conn = sqlite3.connect(str(self.snapshot_path))
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+                signature = self._workbook_signature()
+                stale_keys = [k for k, v in signature.items() if meta.get(k) != v]
+                if stale_keys:
+                    # Only mtime/size moved: fall back to the content hash before rebuilding
+                    if set(stale_keys) - {"mtime_ns", "size"} or meta.get("sha256") != _file_sha256(self.excel_path):
+                        return None
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", signature.items()
+                    )
+                    conn.commit()
+                return conn.execute(
+                    "SELECT company, position, description, description_hash, applied_date FROM entries"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            print(f"⚠️ Ignoring unreadable tracker snapshot {self.snapshot_path}: {exc}")
+            return None
 
-        self.entries = entries
+    def _write_snapshot(self, rows: List[Tuple[str, str, str, str, Optional[str]]]) -> None:
+        try:
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            conn = sqlite3.connect(str(tmp_path))
+            with conn:
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                conn.execute(
+                    "CREATE TABLE entries (company TEXT, position TEXT, description TEXT, "
+                    "description_hash TEXT, applied_date TEXT)"
+                )
+                signature = self._workbook_signature()
+                signature["sha256"] = _file_sha256(self.excel_path)
+                conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", signature.items())
+                conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            conn.close()
+            os.replace(tmp_path, self.snapshot_path)
+        except (OSError, sqlite3.Error) as exc:
+            print(f"⚠️ Could not write tracker snapshot {self.snapshot_path}: {exc}")
 
     def is_applied(
         self,
@@ -133,18 +299,41 @@ class AppliedTracker:
         if not self.entries:
             return False
 
-        company_key = (company_name or "").strip().lower()
-        position_key = (position_name or "").strip().lower()
-        snippet_current = (job_description or "")[:800]
+        company_key = _normalize(company_name)
+        position_key = _normalize(position_name)
+        snippet_current = (job_description or "")[:DESCRIPTION_SNIPPET_CHARS]
+        snippet_hash = _description_hash(snippet_current)
 
         # Check if the company and position match with job description match check
-        for entry in self.entries:
-            if entry.company == company_key and entry.position == position_key:
-                if snippet_current and entry.description:
-                    similarity = fuzz.token_set_ratio(snippet_current, entry.description[:800])
-                    if similarity >= self.similarity_threshold:
-                        return True
-                else:
+        for entry in self._exact_index.get((company_key, position_key), ()):
+            if snippet_current and entry.description:
+                if self._descriptions_match(snippet_current, snippet_hash, entry):
                     return True
+            else:
+                return True
+
+        # Near-duplicate titles at the same company (e.g. "Developer" vs "Developer (Hybrid)")
+        # only count when the descriptions also match.
+        if not snippet_current:
+            return False
+        for idx in self._near_title_candidates(company_key, position_key):
+            entry = self.entries[idx]
+            if entry.position == position_key or not entry.description:
+                continue
+            if fuzz.token_set_ratio(position_key, entry.position) < self.title_similarity_threshold:
+                continue
+            if self._descriptions_match(snippet_current, snippet_hash, entry):
+                return True
         return False
 
+    def _near_title_candidates(self, company_key: str, position_key: str) -> Set[int]:
+        candidates: Set[int] = set()
+        for token in _title_tokens(position_key):
+            candidates.update(self._blocking_index.get((company_key, token), ()))
+        return candidates
+
+    def _descriptions_match(self, snippet_current: str, snippet_hash: str, entry: TrackerEntry) -> bool:
+        if entry.description_hash and entry.description_hash == snippet_hash:
+            return True
+        similarity = fuzz.token_set_ratio(snippet_current, entry.description[:DESCRIPTION_SNIPPET_CHARS])
+        return similarity >= self.similarity_threshold
@@ -4,11 +4,14 @@ Job Fit Analysis System using Gemini 2.0 Flash
 Analyzes job matches against a resume and filters for good matches (score >= 70)
 """
 
+import argparse
+import asyncio
 import json
 import os
+import random
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -17,18 +20,75 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from job_fit_analysis.analysis_cache import (
+    AnalysisCache,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_DAYS,
+    make_cache_key,
+)
 from job_fit_analysis.applied_tracker import AppliedTracker, DEFAULT_TRACKER_PATH, DEFAULT_SHEET_NAME
+from job_fit_analysis.prefilter import DEFAULT_MIN_SCORE as DEFAULT_PREFILTER_MIN_SCORE, LexicalPrefilter
+from job_fit_analysis.rate_limiter import RateLimiter, estimate_tokens
+from job_store.near_duplicates import NEAR_DUPLICATE_SIMILARITY as DEFAULT_NEAR_DUPLICATE_SIMILARITY, NearDuplicateIndex
+from job_store.store import JobStore
 
 # Load environment variables
 load_dotenv()
 
+MODEL_NAME = "gemini-2.0-flash"
+# Bump whenever create_prompt changes so cached analyses are not reused
+PROMPT_VERSION = "1"
+
+# Concurrency and quota settings for the async scoring mode
+MAX_CONCURRENCY = int(os.getenv("JOB_FIT_MAX_CONCURRENCY", "4"))
+REQUESTS_PER_MINUTE = int(os.getenv("JOB_FIT_RPM", "15"))
+TOKENS_PER_MINUTE = int(os.getenv("JOB_FIT_TPM", "1000000"))
+MAX_RATE_LIMIT_RETRIES = int(os.getenv("JOB_FIT_MAX_RETRIES", "5"))
+BACKOFF_BASE_SECONDS = float(os.getenv("JOB_FIT_BACKOFF_BASE", "2.0"))
+
+# Persistent analysis cache
+USE_CACHE = os.getenv("JOB_FIT_CACHE", "1") != "0"
+CACHE_PATH = os.getenv("JOB_FIT_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+CACHE_TTL_DAYS = float(os.getenv("JOB_FIT_CACHE_TTL_DAYS", str(DEFAULT_TTL_DAYS)))
+CACHE_MAX_ENTRIES = int(os.getenv("JOB_FIT_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+
+# Local lexical pre-filter (0 disables it)
+PREFILTER_MIN_SCORE = float(os.getenv("JOB_FIT_PREFILTER_MIN_SCORE", str(DEFAULT_PREFILTER_MIN_SCORE)))
+PREFILTER_AUDIT_PATH = Path(__file__).resolve().parent / "prefilter_scores.json"
+
+# MinHash similarity from which a job in the same batch or stream is scored only once (0 disables)
+NEAR_DUPLICATE_SIMILARITY = float(
+    os.getenv("JOB_FIT_NEAR_DUPLICATE_SIMILARITY", str(DEFAULT_NEAR_DUPLICATE_SIMILARITY))
+)
+
+# Sentinel a producer puts on a job queue once it has no more jobs
+STREAM_END = None
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """Return True if the exception represents an HTTP 429 / quota error."""
+    for attr in ("code", "status_code"):
+        if getattr(exc, attr, None) == 429:
+            return True
+    return "429" in str(exc) or "RESOURCE_EXHAUSTED" in str(exc)
+
 class JobFitAnalyzer:
 
     def process_title_or_company_name(self, name):
         """Replace invalid characters in title/company name"""
         return name.replace("/", "_")
 
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        requests_per_minute: int = REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = TOKENS_PER_MINUTE,
+        cache: Optional[AnalysisCache] = None,
+        prefilter_min_score: float = PREFILTER_MIN_SCORE,
+        near_duplicate_similarity: float = NEAR_DUPLICATE_SIMILARITY,
+    ):
         """Initialize the Job Fit Analyzer with Gemini API key"""
         if api_key is None:
             api_key = os.getenv('GEMINI_API_KEY')
@@ -38,11 +98,34 @@ class JobFitAnalyzer:
         
         # Configure Gemini
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model = genai.GenerativeModel(MODEL_NAME)
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        if cache is None and USE_CACHE:
+            cache = AnalysisCache(CACHE_PATH, ttl_days=CACHE_TTL_DAYS, max_entries=CACHE_MAX_ENTRIES)
+        self.cache = cache
+        self.prefilter = LexicalPrefilter(prefilter_min_score) if prefilter_min_score > 0 else None
+        self.near_duplicate_similarity = near_duplicate_similarity
         tracker_path = os.getenv("JOB_TRACKER_PATH", str(DEFAULT_TRACKER_PATH))
         tracker_sheet = os.getenv("JOB_TRACKER_SHEET", DEFAULT_SHEET_NAME)
         self.applied_tracker = AppliedTracker(tracker_path, tracker_sheet)
         
+    def fit_prefilter(self, store: Optional[JobStore] = None) -> None:
+        """
+        Fit the pre-filter IDF once on every posting in the job store, so batch and stream
+        scoring share one score distribution (and one min_score)
+        """
+        if self.prefilter is None or self.prefilter.fitted:
+            return
+        reference = store or JobStore()
+        try:
+            self.prefilter.fit(reference.unique_job_texts())
+        finally:
+            if store is None:
+                reference.close()
+        print(f"Pre-filter: IDF fitted on {self.prefilter.num_documents} stored postings")
+
     def load_resume(self, resume_path: str) -> str:
         """Load resume text from file"""
         try:
@@ -65,6 +148,10 @@ class JobFitAnalyzer:
         except Exception as e:
             raise Exception(f"Error reading jobs file: {e}")
     
+    def get_job_description(self, job: Dict[str, Any]) -> str:
+        """Prefer the precomputed cleaned description written by the JD cleaning stage"""
+        return job.get('cleaned_description') or job.get('description', '')
+
     def create_prompt(self, resume_text: str, job_description: str) -> str:
         """Create the analysis prompt for Gemini"""
         prompt = f"""
@@ -95,11 +182,55 @@ Job Description:
         
         return prompt
     
+    def get_cache_key(self, resume_text: str, job: Dict[str, Any]) -> str:
+        """Content hash identifying one (resume, description, prompt, model) analysis"""
+        return make_cache_key(resume_text, self.get_job_description(job), PROMPT_VERSION, MODEL_NAME)
+
+    def get_cached_result(self, resume_text: str, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a result built from the cache, or None if the job must be scored"""
+        if self.cache is None:
+            return None
+        analysis = self.cache.get(self.get_cache_key(resume_text, job))
+        if analysis is None:
+            return None
+        print(f"♻️ Cached analysis: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
+        return {
+            'job': job,
+            'matchScore': analysis.get('matchScore', 0),
+            'analysis': analysis,
+            'status': 'success',
+            'cached': True
+        }
+
+    def store_result(self, resume_text: str, result: Dict[str, Any]) -> None:
+        """Cache a successful analysis for later runs"""
+        if self.cache is not None and result['status'] == 'success':
+            self.cache.set(self.get_cache_key(resume_text, result['job']), result['analysis'])
+
+    def new_near_duplicate_index(self) -> Optional[NearDuplicateIndex]:
+        """In-memory MinHash/LSH index for one batch or stream, so reposted copies are scored once"""
+        if self.near_duplicate_similarity <= 0:
+            return None
+        return NearDuplicateIndex(":memory:", self.near_duplicate_similarity)
+
+    def duplicate_result(self, job: Dict[str, Any], original: int) -> Dict[str, Any]:
+        return {
+            'job': job,
+            'matchScore': 0,
+            'analysis': None,
+            'status': 'duplicate',
+            'duplicateOf': original
+        }
+
     def analyze_job_fit(self, resume_text: str, job: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze job fit using Gemini and return the match score"""
+        cached = self.get_cached_result(resume_text, job)
+        if cached is not None:
+            return cached
+
         try:
             # Extract job description
-            job_description = job.get('description', '')
+            job_description = self.get_job_description(job)
             job_title = job.get('title', 'Unknown')
             company = job.get('company', 'Unknown')
             
@@ -110,42 +241,9 @@ Job Description:
             
             # Get response from Gemini
             response = self.model.generate_content(prompt)
-            
-            # Parse the response
-            response_text = response.text.strip()
-            
-            # Remove any markdown code fences if present
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]
-            if response_text.startswith('```'):
-                response_text = response_text[3:]
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]
-            
-            response_text = response_text.strip()
-            
-            # Parse JSON response
-            try:
-                analysis_result = json.loads(response_text)
-                match_score = analysis_result.get('matchScore', 0)
-                
-                return {
-                    'job': job,
-                    'matchScore': match_score,
-                    'analysis': analysis_result,
-                    'status': 'success'
-                }
-                
-            except json.JSONDecodeError as e:
-                print(f"Error parsing Gemini response as JSON: {e}")
-                print(f"Raw response: {response_text}")
-                return {
-                    'job': job,
-                    'matchScore': 0,
-                    'analysis': None,
-                    'status': 'error',
-                    'error': f"Failed to parse response: {e}"
-                }
+            result = self.parse_response(job, response.text)
+            self.store_result(resume_text, result)
+            return result
                 
         except Exception as e:
             print(f"Error analyzing job: {e}")
@@ -156,36 +254,233 @@ Job Description:
                 'status': 'error',
                 'error': str(e)
             }
-    
+
+    def parse_response(self, job: Dict[str, Any], response_text: str) -> Dict[str, Any]:
+        """Turn a raw Gemini response into an analysis result dict"""
+        response_text = response_text.strip()
+
+        # Remove any markdown code fences if present
+        if response_text.startswith('```json'):
+            response_text = response_text[7:]
+        if response_text.startswith('```'):
+            response_text = response_text[3:]
+        if response_text.endswith('```'):
+            response_text = response_text[:-3]
+
+        response_text = response_text.strip()
+
+        # Parse JSON response
+        try:
+            analysis_result = json.loads(response_text)
+            match_score = analysis_result.get('matchScore', 0)
+
+            return {
+                'job': job,
+                'matchScore': match_score,
+                'analysis': analysis_result,
+                'status': 'success'
+            }
+
+        except json.JSONDecodeError as e:
+            print(f"Error parsing Gemini response as JSON: {e}")
+            print(f"Raw response: {response_text}")
+            return {
+                'job': job,
+                'matchScore': 0,
+                'analysis': None,
+                'status': 'error',
+                'error': f"Failed to parse response: {e}"
+            }
+
+    async def generate_async(self, prompt: str) -> str:
+        """Send one prompt to Gemini without blocking the event loop"""
+        response = await self.model.generate_content_async(prompt)
+        return response.text
+
+    async def analyze_job_fit_async(
+        self,
+        resume_text: str,
+        job: Dict[str, Any],
+        limiter: RateLimiter,
+    ) -> Dict[str, Any]:
+        """Async variant of analyze_job_fit that honours the shared rate limiter"""
+        cached = self.get_cached_result(resume_text, job)
+        if cached is not None:
+            return cached
+
+        job_title = job.get('title', 'Unknown')
+        company = job.get('company', 'Unknown')
+        prompt = self.create_prompt(resume_text, self.get_job_description(job))
+        prompt_tokens = estimate_tokens(prompt)
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await limiter.acquire(prompt_tokens)
+            try:
+                print(f"Analyzing: {job_title} at {company}...")
+                response_text = await self.generate_async(prompt)
+                result = self.parse_response(job, response_text)
+                self.store_result(resume_text, result)
+                return result
+            except Exception as e:
+                if _is_rate_limit_error(e) and attempt < MAX_RATE_LIMIT_RETRIES:
+                    limiter.penalize()
+                    sleep_seconds = BACKOFF_BASE_SECONDS * (2 ** attempt) * random.uniform(1, 1.5)
+                    print(f"⚠️ Rate limited on {job_title} at {company}, retrying in {sleep_seconds:.1f}s...")
+                    await asyncio.sleep(sleep_seconds)
+                    continue
+                print(f"Error analyzing job: {e}")
+                return {
+                    'job': job,
+                    'matchScore': 0,
+                    'analysis': None,
+                    'status': 'error',
+                    'error': str(e)
+                }
+
     def analyze_all_jobs(self, resume_path: str, jobs_path: str) -> List[Dict[str, Any]]:
-        """Analyze all jobs and return results"""
+        """Analyze all jobs and return results (in the same order as the input)"""
+        return asyncio.run(self.analyze_all_jobs_async(resume_path, jobs_path))
+
+    async def analyze_all_jobs_async(self, resume_path: str, jobs_path: str) -> List[Dict[str, Any]]:
+        """Score jobs concurrently, bounded by max_concurrency and the RPM/TPM quota"""
         # Load resume and jobs
         resume_text = self.load_resume(resume_path)
         jobs = self.load_jobs(jobs_path)
         
         print(f"Loaded {len(jobs)} jobs to analyze...")
         print(f"Resume loaded from: {resume_path}")
+        print(f"Concurrency: {self.max_concurrency} | Quota: {self.requests_per_minute} RPM, {self.tokens_per_minute} TPM")
         print("-" * 50)
-        
-        results = []
-        for i, job in enumerate(jobs, 1):
-            print(f"[{i}/{len(jobs)}] Processing job...")
-            
-            # Add 5-second delay before analyzing job fit
-            import time
-            time.sleep(5)
-            
-            result = self.analyze_job_fit(resume_text, job)
-            results.append(result)
-            
+
+        return await self.analyze_jobs_async(resume_text, jobs)
+
+    async def analyze_jobs_async(self, resume_text: str, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score an in-memory list of jobs; results keep the input order"""
+        limiter = RateLimiter(self.requests_per_minute, self.tokens_per_minute)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        to_score = list(range(len(jobs)))
+
+        near_duplicates = self.new_near_duplicate_index()
+        if near_duplicates is not None and jobs:
+            for i, job in enumerate(jobs):
+                original = near_duplicates.check_and_add(str(i), job.get('description', ''))
+                if original is not None:
+                    results[i] = self.duplicate_result(job, int(original))
+            near_duplicates.close()
+            to_score = [i for i in to_score if results[i] is None]
+            if len(to_score) < len(jobs):
+                print(f"Near-duplicates: {len(jobs) - len(to_score)}/{len(jobs)} jobs repeat an earlier posting, skipping LLM scoring")
+
+        if self.prefilter is not None and to_score:
+            passed, rejected, scores = self.prefilter.split(resume_text, jobs)
+            unique = set(to_score)
+            to_score = [i for i in passed if i in unique]
+            rejected = [i for i in rejected if i in unique]
+            for i in rejected:
+                results[i] = {
+                    'job': jobs[i],
+                    'matchScore': 0,
+                    'analysis': None,
+                    'status': 'prefiltered',
+                    'prefilterScore': float(scores[i])
+                }
+            self.save_prefilter_audit(jobs, scores)
+            print(f"Pre-filter: {len(rejected)}/{len(jobs)} jobs below similarity {self.prefilter.min_score}, skipping LLM scoring")
+
+        async def score(i: int) -> None:
+            job = jobs[i]
+            async with semaphore:
+                result = await self.analyze_job_fit_async(resume_text, job, limiter)
+
             # Print the match score for this job
             if result['status'] == 'success':
-                print(f"Match Score: {result['matchScore']}/100")
+                print(f"[{i + 1}/{len(jobs)}] Match Score: {result['matchScore']}/100 - {job.get('title', 'Unknown')}")
             else:
-                print(f"Error: {result.get('error', 'Unknown error')}")
-            print("-" * 30)
-        
+                print(f"[{i + 1}/{len(jobs)}] Error: {result.get('error', 'Unknown error')}")
+            results[i] = result
+
+        await asyncio.gather(*(score(i) for i in to_score))
+        if self.cache is not None:
+            print(f"Analysis cache: {self.cache.hits} hits, {self.cache.misses} misses")
         return results
+
+    async def analyze_job_stream(self, resume_text: str, job_queue: asyncio.Queue) -> List[Dict[str, Any]]:
+        """
+        Score jobs as soon as they arrive on job_queue, until STREAM_END is received.
+        Scoring overlaps with the producer (e.g. the scraper); results are in arrival order.
+        """
+        limiter = RateLimiter(self.requests_per_minute, self.tokens_per_minute)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        jobs: List[Dict[str, Any]] = []
+        results: List[Optional[Dict[str, Any]]] = []
+        prefilter_scores: List[float] = []
+        near_duplicates = self.new_near_duplicate_index()
+        tasks = []
+
+        async def score(i: int, job: Dict[str, Any]) -> None:
+            async with semaphore:
+                result = await self.analyze_job_fit_async(resume_text, job, limiter)
+            if result['status'] == 'success':
+                print(f"[stream #{i + 1}] Match Score: {result['matchScore']}/100 - {job.get('title', 'Unknown')}")
+            else:
+                print(f"[stream #{i + 1}] Error: {result.get('error', 'Unknown error')}")
+            results[i] = result
+
+        while True:
+            job = await job_queue.get()
+            if job is STREAM_END:
+                break
+            i = len(jobs)
+            jobs.append(job)
+            results.append(None)
+            if near_duplicates is not None:
+                original = near_duplicates.check_and_add(str(i), job.get('description', ''))
+                if original is not None:
+                    print(f"[stream #{i + 1}] Near-duplicate of stream #{int(original) + 1} - {job.get('title', 'Unknown')}")
+                    results[i] = self.duplicate_result(job, int(original))
+                    if self.prefilter is not None:
+                        prefilter_scores.append(0.0)
+                    continue
+            if self.prefilter is not None:
+                prefilter_score = float(self.prefilter.score(resume_text, [job])[0])
+                prefilter_scores.append(prefilter_score)
+                if prefilter_score < self.prefilter.min_score:
+                    print(f"[stream #{i + 1}] Pre-filtered ({prefilter_score:.3f}) - {job.get('title', 'Unknown')}")
+                    results[i] = {
+                        'job': job,
+                        'matchScore': 0,
+                        'analysis': None,
+                        'status': 'prefiltered',
+                        'prefilterScore': prefilter_score
+                    }
+                    continue
+            tasks.append(asyncio.create_task(score(i, job)))
+
+        await asyncio.gather(*tasks)
+        if near_duplicates is not None:
+            near_duplicates.close()
+        if self.prefilter is not None and jobs:
+            self.save_prefilter_audit(jobs, prefilter_scores)
+        if self.cache is not None:
+            print(f"Analysis cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        return results
+
+    def save_prefilter_audit(self, jobs: List[Dict[str, Any]], scores, output_path: Path = PREFILTER_AUDIT_PATH):
+        """Keep every pre-filter score so rejected jobs can be reviewed later"""
+        audit = [
+            {
+                'title': job.get('title'),
+                'company': job.get('company'),
+                'job_id': job.get('job_id'),
+                'url': job.get('url'),
+                'prefilterScore': round(float(score), 4),
+                'passed': bool(score >= self.prefilter.min_score)
+            }
+            for job, score in zip(jobs, scores)
+        ]
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump(audit, file, indent=2, ensure_ascii=False)
     
     def filter_good_matches(self, results: List[Dict[str, Any]], min_score: int = 71) -> List[Dict[str, Any]]:
         """Filter jobs with match score >= min_score"""
@@ -196,6 +491,13 @@ Job Description:
         
         return good_matches
     
+    def load_saved_matches(self, output_path: str) -> List[Dict[str, Any]]:
+        """Good matches saved earlier to output_path (empty when there are none)"""
+        if not os.path.exists(output_path):
+            return []
+        with open(output_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+
     def save_good_matches(self, good_matches: List[Dict[str, Any]], output_path: str = "good_score_jobs.json"):
         """Save good matches to JSON file"""
         # Prepare data for output (include original job data plus analysis)
@@ -233,61 +535,138 @@ Job Description:
         return filtered
 
 
+ANALYSIS_DIR = Path(__file__).resolve().parent
+DEFAULT_RESUME_PATH = ANALYSIS_DIR / "resume.txt"
+DEFAULT_JOBS_PATH = ANALYSIS_DIR / "linkedin_jobs.json"
+DEFAULT_OUTPUT_PATH = ANALYSIS_DIR / "good_score_jobs.json"
+
+
+async def run_analysis(
+    analyzer: JobFitAnalyzer,
+    resume_path: str = str(DEFAULT_RESUME_PATH),
+    jobs_path: Optional[str] = None,
+    output_path: str = str(DEFAULT_OUTPUT_PATH),
+    store: Optional[JobStore] = None,
+    merge: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Analyze, filter and save good matches; usable in-process by the orchestrator.
+    Without jobs_path the pending jobs of the job store (every source, duplicates
+    removed) are analyzed and marked analyzed afterwards. merge=True adds the good
+    matches to the ones already saved at output_path instead of replacing them.
+    """
+    # Check if files exist
+    if not os.path.exists(resume_path):
+        raise FileNotFoundError(f"Resume file not found: {resume_path}")
+
+    if jobs_path is not None:
+        if not os.path.exists(jobs_path):
+            raise FileNotFoundError(f"Jobs file not found: {jobs_path}")
+        analyzer.fit_prefilter(store)
+
+        # Analyze all jobs
+        print("Starting job fit analysis...")
+        results = await analyzer.analyze_all_jobs_async(resume_path, jobs_path)
+        return finish_analysis(analyzer, results, output_path, merge=merge)
+
+    own_store = store is None
+    store = store or JobStore()
+    try:
+        analyzer.fit_prefilter(store)
+        jobs = store.pending_jobs()
+        print(f"Starting job fit analysis of {len(jobs)} pending jobs from the job store...")
+        results = await analyzer.analyze_jobs_async(analyzer.load_resume(resume_path), jobs)
+        return finish_analysis(analyzer, results, output_path, store, merge)
+    finally:
+        if own_store:
+            store.close()
+
+
+async def run_stream_analysis(
+    analyzer: JobFitAnalyzer,
+    job_queue: asyncio.Queue,
+    resume_path: str = str(DEFAULT_RESUME_PATH),
+    output_path: str = str(DEFAULT_OUTPUT_PATH),
+    store: Optional[JobStore] = None,
+) -> List[Dict[str, Any]]:
+    """Like run_analysis, but scores jobs from a queue while they are still being scraped"""
+    print("Starting streaming job fit analysis...")
+    analyzer.fit_prefilter(store)
+    results = await analyzer.analyze_job_stream(analyzer.load_resume(resume_path), job_queue)
+    return finish_analysis(analyzer, results, output_path, store)
+
+
+def match_key(match: Dict[str, Any]) -> tuple:
+    """Identifies the job of a good match across runs"""
+    job = match['job']
+    if job.get('job_id'):
+        return (job.get('source'), str(job['job_id']))
+    return (job.get('company'), job.get('title'))
+
+
+def finish_analysis(
+    analyzer: JobFitAnalyzer,
+    results: List[Dict[str, Any]],
+    output_path: str,
+    store: Optional[JobStore] = None,
+    merge: bool = False,
+) -> List[Dict[str, Any]]:
+    """Filter good matches, drop already-applied jobs, save and print the summary"""
+    # Scored, pre-filtered and duplicate jobs are done; failed ones stay pending for the next run
+    if store is not None:
+        store.mark_analyzed(r['job'] for r in results if r['status'] in ('success', 'prefiltered', 'duplicate'))
+
+    # Filter good matches
+    print("\nFiltering good matches (score >= 70)...")
+    good_matches = analyzer.filter_good_matches(results, min_score=71)
+    filtered_matches = analyzer.filter_already_applied(good_matches)
+
+    # Save results (merged into the matches an interrupted streaming run already saved)
+    saved_matches = analyzer.load_saved_matches(output_path) if merge else []
+    if filtered_matches:
+        saved_keys = {match_key(match) for match in saved_matches}
+        analyzer.save_good_matches(
+            saved_matches + [match for match in filtered_matches if match_key(match) not in saved_keys], output_path
+        )
+        print(f"\n✅ Found {len(filtered_matches)} jobs with good match scores (>= 71) that you haven't applied to yet")
+    else:
+        print("\n❌ No jobs found with match scores >= 71")
+        # Still save empty results (or keep the earlier ones when merging)
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump(saved_matches, file, indent=2, ensure_ascii=False)
+
+    # Print summary
+    print("\n" + "="*50)
+    print("ANALYSIS SUMMARY")
+    print("="*50)
+    print(f"Total jobs analyzed: {len(results)}")
+    print(f"Successful analyses: {len([r for r in results if r['status'] == 'success'])}")
+    print(f"Failed analyses: {len([r for r in results if r['status'] == 'error'])}")
+    print(f"Rejected by local pre-filter: {len([r for r in results if r['status'] == 'prefiltered'])}")
+    print(f"Skipped near-duplicates: {len([r for r in results if r['status'] == 'duplicate'])}")
+    print(f"Good matches (score >= 70): {len(good_matches)}")
+    print(f"After removing already-applied jobs: {len(filtered_matches)}")
+
+    if good_matches:
+        print("\nGood matches:")
+        for match in good_matches:
+            job = match['job']
+            score = match['matchScore']
+            print(f"  • {job['title']} at {job['company']} - Score: {score}")
+
+    return filtered_matches
+
+
 def main():
     """Main function to run the job fit analysis"""
+    parser = argparse.ArgumentParser(description="Score scraped jobs against the resume")
+    parser.add_argument("jobs_path", nargs="?", help="jobs JSON file (default: pending jobs in the job store)")
+    parser.add_argument("--merge", action="store_true", help="add to the saved good matches instead of replacing them")
+    args = parser.parse_args()
     try:
         # Initialize analyzer
         analyzer = JobFitAnalyzer()
-        
-        # File paths
-        resume_path = "./resume.txt"
-        jobs_path = "./linkedin_jobs.json"
-        output_path = "./good_score_jobs.json"
-        
-        # Check if files exist
-        if not os.path.exists(resume_path):
-            print(f"Error: Resume file not found: {resume_path}")
-            sys.exit(1)
-        
-        if not os.path.exists(jobs_path):
-            print(f"Error: Jobs file not found: {jobs_path}")
-            sys.exit(1)
-        
-        # Analyze all jobs
-        print("Starting job fit analysis...")
-        results = analyzer.analyze_all_jobs(resume_path, jobs_path)
-        
-        # Filter good matches
-        print("\nFiltering good matches (score >= 70)...")
-        good_matches = analyzer.filter_good_matches(results, min_score=71)
-        filtered_matches = analyzer.filter_already_applied(good_matches)
-        
-        # Save results
-        if filtered_matches:
-            analyzer.save_good_matches(filtered_matches, output_path)
-            print(f"\n✅ Found {len(filtered_matches)} jobs with good match scores (>= 71) that you haven't applied to yet")
-        else:
-            print("\n❌ No jobs found with match scores >= 71")
-            # Still save empty results
-            with open(output_path, 'w', encoding='utf-8') as file:
-                json.dump([], file, indent=2)
-        
-        # Print summary
-        print("\n" + "="*50)
-        print("ANALYSIS SUMMARY")
-        print("="*50)
-        print(f"Total jobs analyzed: {len(results)}")
-        print(f"Successful analyses: {len([r for r in results if r['status'] == 'success'])}")
-        print(f"Failed analyses: {len([r for r in results if r['status'] == 'error'])}")
-        print(f"Good matches (score >= 70): {len(good_matches)}")
-        print(f"After removing already-applied jobs: {len(filtered_matches)}")
-        
-        if good_matches:
-            print("\nGood matches:")
-            for match in good_matches:
-                job = match['job']
-                score = match['matchScore']
-                print(f"  • {job['title']} at {job['company']} - Score: {score}")
+        asyncio.run(run_analysis(analyzer, jobs_path=args.jobs_path, merge=args.merge))
         
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,127 @@
+"""
+Cheap local pre-filter for job-fit scoring.
+
+Computes a TF-IDF cosine similarity between the resume and every job in the
+batch (vectorized with NumPy) so clearly unrelated postings can be rejected
+before they are sent to Gemini. The IDF is fitted once on a reference corpus
+(the job store), so a job gets the same score in a batch and in a stream.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_MIN_SCORE = 0.04
+TITLE_WEIGHT = 3  # title terms are repeated so they count more than boilerplate
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+_STOPWORDS = frozenset(
+    """
+    a about an and are as at be by for from has have in is it of on or our that the their
+    this to we will with you your who what work working team role job experience ability
+    years year strong skills including using well etc across within all any other more
+    """.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS and len(t) > 1]
+
+
+def document_frequencies(texts: Iterable[str]) -> Tuple[Dict[str, int], int]:
+    """Number of texts each token appears in, and the number of texts"""
+    frequencies: Dict[str, int] = {}
+    num_documents = 0
+    for text in texts:
+        num_documents += 1
+        for token in set(tokenize(text)):
+            frequencies[token] = frequencies.get(token, 0) + 1
+    return frequencies, num_documents
+
+
+def tfidf_similarity(
+    query: str,
+    documents: List[str],
+    frequencies: Optional[Dict[str, int]] = None,
+    num_documents: int = 0,
+) -> np.ndarray:
+    """
+    Cosine similarity between `query` and each document. The IDF comes from the given
+    document frequencies, or from the query and documents themselves when none are given.
+    """
+    if not documents:
+        return np.zeros(0)
+
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, text in enumerate([query] + documents):
+        for token in tokenize(text):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(token, len(vocabulary)))
+    if not vocabulary:
+        return np.zeros(len(documents))
+
+    counts = np.zeros((len(documents) + 1, len(vocabulary)), dtype=np.float64)
+    np.add.at(counts, (np.array(rows), np.array(cols)), 1.0)
+
+    tf = np.zeros_like(counts)
+    nonzero = counts > 0
+    tf[nonzero] = 1.0 + np.log(counts[nonzero])  # sublinear term frequency
+    if frequencies is None:
+        df = nonzero.sum(axis=0)
+        num_documents = counts.shape[0]
+    else:
+        df = np.zeros(len(vocabulary))
+        for token, col in vocabulary.items():
+            df[col] = frequencies.get(token, 0)
+    idf = np.log((1.0 + num_documents) / (1.0 + df)) + 1.0
+
+    weights = tf * idf
+    norms = np.linalg.norm(weights, axis=1)
+    norms[norms == 0] = 1.0
+    weights /= norms[:, None]
+    return weights[1:] @ weights[0]
+
+
+class LexicalPrefilter:
+    def __init__(self, min_score: float = DEFAULT_MIN_SCORE):
+        self.min_score = min_score
+        # Fixed IDF shared by batch and stream scoring (see fit)
+        self.frequencies: Dict[str, int] = {}
+        self.num_documents = 0
+
+    @property
+    def fitted(self) -> bool:
+        return self.num_documents > 0
+
+    def fit(self, jobs: Iterable[Dict[str, Any]]) -> "LexicalPrefilter":
+        """Fix the IDF to a reference corpus of jobs, e.g. every posting in the job store"""
+        self.frequencies, self.num_documents = document_frequencies(self.job_text(job) for job in jobs)
+        return self
+
+    @staticmethod
+    def job_text(job: Dict[str, Any]) -> str:
+        title = job.get("title", "")
+        description = job.get("cleaned_description") or job.get("description", "")
+        return " ".join([title] * TITLE_WEIGHT + [description])
+
+    def score(self, resume_text: str, jobs: List[Dict[str, Any]]) -> np.ndarray:
+        documents = [self.job_text(job) for job in jobs]
+        if self.fitted:
+            return tfidf_similarity(resume_text, documents, self.frequencies, self.num_documents)
+        # Not fitted: IDF of the resume alone, which still does not depend on the other jobs scored
+        frequencies, num_documents = document_frequencies([resume_text])
+        return tfidf_similarity(resume_text, documents, frequencies, num_documents)
+
+    def split(
+        self, resume_text: str, jobs: List[Dict[str, Any]]
+    ) -> Tuple[List[int], List[int], np.ndarray]:
+        """Return (kept indices, rejected indices, scores) for the batch."""
+        scores = self.score(resume_text, jobs)
+        kept = [i for i, s in enumerate(scores) if s >= self.min_score]
+        rejected = [i for i, s in enumerate(scores) if s < self.min_score]
+        return kept, rejected, scores
@@ -0,0 +1,94 @@
+"""
+Token-bucket rate limiting for LLM calls.
+
+A provider quota is usually expressed as requests per minute (RPM) and
+tokens per minute (TPM). `RateLimiter` keeps one bucket for each and only
+lets a call through once both buckets can cover it. The request bucket holds
+at most a small burst and the token bucket starts empty, so even the first
+minute of a run stays within the quota instead of spending a full minute's
+allowance up front and then the next one.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, capacity: float, rate: float, initial: Optional[float] = None):
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("Token bucket capacity and rate must be positive.")
+        self.capacity = float(capacity)
+        self.rate = float(rate)
+        self._tokens = self.capacity if initial is None else min(float(initial), self.capacity)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)."""
+        amount = min(float(amount), self.capacity)
+        self._refill()
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._tokens -= min(float(amount), self.capacity)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the provider answered with a 429."""
+        self._refill()
+        self._tokens = 0.0
+
+
+# Requests that may go out back to back; any 60 s window then admits at most RPM + burst - 1
+DEFAULT_REQUEST_BURST = 1
+
+
+class RateLimiter:
+    """Combined RPM/TPM limiter shared by all in-flight requests."""
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: Optional[int] = None,
+        burst: int = DEFAULT_REQUEST_BURST,
+    ):
+        self.requests = TokenBucket(max(1, min(burst, requests_per_minute)), requests_per_minute / 60.0)
+        self.tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60.0, initial=0)
+            if tokens_per_minute
+            else None
+        )
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request carrying roughly `tokens` tokens may be sent."""
+        async with self._lock:
+            while True:
+                wait = self.requests.wait_time(1)
+                if self.tokens is not None:
+                    wait = max(wait, self.tokens.wait_time(tokens))
+                if wait <= 0:
+                    self.requests.consume(1)
+                    if self.tokens is not None:
+                        self.tokens.consume(tokens)
+                    return
+                await asyncio.sleep(wait)
+
+    def penalize(self) -> None:
+        """Back off globally after a rate-limit response from the provider."""
+        self.requests.drain()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) used for TPM accounting."""
+    return max(1, len(text) // 4)
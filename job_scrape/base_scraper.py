@@ -0,0 +1,359 @@
+"""
+Shared scraping engine for every job source.
+
+A SourceAdapter knows one site: how to open the browser session, walk the result pages
+of a keyword/location search and read a job's detail view. BaseJobScraper does the rest
+once for all sources: the keyword × location sweep over a pool of tabs, seen-job and
+blacklist filtering at card level, concurrent detail fetching, French detection, the job
+dict, cross-source dedup in the job store, per-page checkpoints, streaming handoff and the
+JSON batch writer.
+"""
+import asyncio
+import json
+import shutil
+import sys
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from playwright.async_api import BrowserContext, Page, async_playwright
+
+from checkpoint import CHECKPOINT_FILENAME, ScrapeCheckpoint
+from scraper_helpers import DomainPacer, PagePool, ScraperHelpers
+from seen_jobs import SEEN_INDEX_FILENAME, SeenJobIndex
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from job_store.store import JobStore
+
+
+class SourceAdapter(ABC):
+    """The site-specific part of a scraper: result pages in, job cards and job details out"""
+
+    # Source name recorded with every job in the job store
+    name = "unknown"
+    # True when a card's detail can be opened inside the results page (e.g. a side pane),
+    # so Config.DETAIL_TABS = 0 clicks through cards instead of using a tab pool
+    inline_details = False
+    # Timezone of the scraped_at timestamp
+    scraped_at_tz = timezone.utc
+    location_skip_reason = "Location not allowed"
+
+    def __init__(self, config, helpers: ScraperHelpers):
+        self.config = config
+        self.helpers = helpers
+
+    async def open_context(self, playwright) -> BrowserContext:
+        """Browser context the whole scrape runs in"""
+        browser = await playwright.chromium.launch(headless=self.config.HEADLESS)
+        context = await browser.new_context()
+        await self.helpers.install_network_policy(context)
+        return context
+
+    async def prepare(self, context: BrowserContext) -> None:
+        """Run once before the sweep starts, e.g. to log in"""
+
+    @abstractmethod
+    def result_pages(
+        self, page: Page, keyword: str, location: str, max_pages: int, first_page: int = 1
+    ) -> AsyncIterator[Tuple[int, object, List[Dict]]]:
+        """
+        Walk one search's result pages (up to max_pages, starting at first_page when the
+        site allows jumping there), yielding (page_number, surface, cards) per page.
+        Cards carry job_id, title, company, location and url (job_id/url may be None).
+        """
+
+    @abstractmethod
+    async def open_detail(self, page: Page, card: Dict) -> None:
+        """Navigate a pooled tab to the card's detail page and wait until it is readable"""
+
+    async def show_inline_detail(self, surface, card: Dict) -> None:
+        """Open the card's detail inside the results page (only for inline_details sources)"""
+        raise NotImplementedError(f"{type(self).__name__} has no inline detail view")
+
+    @abstractmethod
+    async def read_detail(self, page, card: Dict) -> Optional[Dict]:
+        """
+        Fields read from the open detail view (at least description; may also set job_id,
+        url, easy_apply and posted_date), or None when the job should be skipped
+        """
+
+    def location_allowed(self, location: str) -> bool:
+        return True
+
+    def title_blacklisted(self, title: str) -> bool:
+        return any(keyword in title for keyword in self.config.TITLE_KEYWORDS_BLACKLIST)
+
+
+class BaseJobScraper:
+    """Source-independent scraping engine driven by a SourceAdapter"""
+
+    def __init__(
+        self,
+        adapter: SourceAdapter,
+        output_dir: Path,
+        batch_prefix: str,
+        analysis_jobs_path: Optional[Path] = None,
+        job_queue: Optional[asyncio.Queue] = None,
+        seen_index: Optional[SeenJobIndex] = None,
+        resume: bool = False,
+        checkpoint: Optional[ScrapeCheckpoint] = None,
+        job_store: Optional[JobStore] = None,
+    ):
+        self.adapter = adapter
+        self.config = adapter.config
+        self.helpers = adapter.helpers
+        self.output_dir = Path(output_dir)
+        self.batch_prefix = batch_prefix
+        self.analysis_jobs_path = analysis_jobs_path
+        self.jobs_data: List[Dict] = []
+        # When set, every newly scraped job is pushed here as soon as it is extracted,
+        # followed by None once the scrape is finished
+        self.job_queue = job_queue
+        # job_ids saved by previous runs (persistent) and handled during this run
+        self.seen_index = seen_index or SeenJobIndex(self.output_dir / SEEN_INDEX_FILENAME)
+        self.seen_job_ids = set()
+        self.published_job_ids = set()
+        # Tab pool + per-domain pacing for detail pages
+        self.detail_pool: Optional[PagePool] = None
+        self.pacer = DomainPacer(self.config.DOMAIN_MIN_INTERVAL, self.config.DOMAIN_JITTER)
+        # Keyword × location searches run in a pool of Config.SEARCH_TABS tabs, with search starts paced
+        self.search_pacer = DomainPacer(self.config.SEARCH_MIN_INTERVAL, self.config.SEARCH_JITTER)
+        # Finished (keyword, location, page) units and their jobs; resume=True picks up an interrupted run
+        self.resume = resume
+        self.checkpoint = checkpoint or ScrapeCheckpoint(self.output_dir / CHECKPOINT_FILENAME)
+        # Store shared by every source; postings of a role already scraped (from any source) are dropped
+        self.job_store = job_store or JobStore()
+
+    # ------------------------- Card filtering -------------------------
+
+    def is_seen(self, job_id: str) -> bool:
+        return job_id in self.seen_job_ids or job_id in self.seen_index
+
+    def card_skip_reason(self, card: Dict) -> Optional[str]:
+        """Why a card should be skipped based on its list-view fields alone (None to keep it)"""
+        if card["company"] in self.config.BLACKLIST_COMPANIES:
+            return "Company in blacklist"
+        if self.adapter.title_blacklisted(card["title"]):
+            return "Title contains keyword in blacklist"
+        if not self.adapter.location_allowed(card["location"]):
+            return self.adapter.location_skip_reason
+        return None
+
+    # ------------------------- Jobs -------------------------
+
+    def build_job(self, card: Dict, detail: Dict) -> Dict:
+        job = {
+            "source": self.adapter.name,
+            "title": card["title"].strip(),
+            "company": card["company"].strip(),
+            "location": card["location"].strip(),
+            "job_id": card["job_id"],
+            "url": card["url"],
+            "description": "",
+            "easy_apply": card.get("easy_apply", False),
+            "posted_date": datetime.now(timezone.utc).isoformat(),
+        }
+        job.update(detail)
+        job["description"] = job["description"].strip()
+        job["scraped_at"] = datetime.now(self.adapter.scraped_at_tz).isoformat()
+        return job
+
+    async def accept_job(self, card: Dict, detail: Optional[Dict]) -> Optional[Dict]:
+        """Turn a read detail into a job (None if it is skipped) and hand it to the stream"""
+        if detail is None:
+            return None
+        if self.helpers.has_french_words(detail.get("description", "")):
+            print(f"⏩ Skipping job: {card['title'].strip()} - French job description")
+            return None
+        job = self.build_job(card, detail)
+        duplicate_of = self.job_store.add_job(job, self.adapter.name)
+        if duplicate_of is not None:
+            print(f"⏩ Skipping job: {job['title'][:60]} | {job['company']} - duplicate of stored job #{duplicate_of}")
+            # Remember the posting so later runs skip it at card level
+            self.seen_index.add_many([job["job_id"]])
+            return None
+        print(f"✅ Scraped: {job['title'][:60]} | {job['company']}")
+        await self.publish_job(job)
+        return job
+
+    async def publish_job(self, job_data: Dict):
+        """Hand a new job to the streaming consumer (if any) right after extraction"""
+        job_id = job_data["job_id"]
+        if self.job_queue is None or job_id in self.published_job_ids or job_id in self.seen_index:
+            return
+        self.published_job_ids.add(job_id)
+        await self.job_queue.put(job_data)
+
+    async def fetch_job_detail(self, card: Dict) -> Optional[Dict]:
+        """Open one job's detail page in a pooled tab, paced per domain"""
+        async with self.detail_pool.page() as tab:
+            try:
+                await self.pacer.wait(card["url"])
+                await self.adapter.open_detail(tab, card)
+                detail = await self.adapter.read_detail(tab, card)
+            except Exception as e:
+                print(f"⚠️ Error fetching job detail {card['url']}: {e}")
+                return None
+        return await self.accept_job(card, detail)
+
+    async def scrape_result_page(self, surface, cards: List[Dict]) -> List[Dict]:
+        """Filter one page of cards, then read the details of the remaining ones"""
+        skipped_known = 0
+        candidates = []
+        for card in cards:
+            # Skip jobs saved by an earlier run (or already handled in this one) before any detail is opened
+            job_id = card["job_id"]
+            if job_id:
+                if self.is_seen(job_id):
+                    skipped_known += 1
+                    continue
+                self.seen_job_ids.add(job_id)
+            skip_reason = self.card_skip_reason(card)
+            if skip_reason:
+                print(f"⏩ Skipping job: {card['title']} - {skip_reason}")
+                continue
+            candidates.append(card)
+        if skipped_known:
+            print(f"⏩ Skipped {skipped_known} already seen job cards")
+
+        if self.detail_pool is not None:
+            # Pooled tabs open the job's own page, so the card must identify it
+            candidates = [card for card in candidates if card["job_id"] and card["url"]]
+            print(f"🗂️ Fetching {len(candidates)} job details across {self.detail_pool.size} tabs...")
+            results = await asyncio.gather(*(self.fetch_job_detail(card) for card in candidates))
+            return [job for job in results if job]
+
+        jobs = []
+        for card in candidates:
+            try:
+                await self.adapter.show_inline_detail(surface, card)
+                job = await self.accept_job(card, await self.adapter.read_detail(surface, card))
+            except Exception as e:
+                print(f"⚠️ Error extracting job card: {e}")
+                continue
+            if job:
+                jobs.append(job)
+                await self.helpers.jitter()
+        return jobs
+
+    # ------------------------- Sweep -------------------------
+
+    async def search_jobs(self, page: Page, keyword: str, location: str, max_pages: int) -> List[Dict]:
+        """Scrape one keyword/location search page by page, checkpointing every finished page"""
+        jobs = []
+        # Resumed searches start at their first unfinished page
+        finished = self.checkpoint.finished_pages(keyword, location)
+        first_page = next(number for number in range(1, max_pages + 2) if number not in finished)
+        if first_page > max_pages:
+            self.checkpoint.mark_search_done(keyword, location)
+            return jobs
+        try:
+            pages = self.adapter.result_pages(page, keyword, location, max_pages, first_page)
+            async for page_number, surface, cards in pages:
+                print(f"✅ Found {len(cards)} job cards on page {page_number}")
+                page_jobs = await self.scrape_result_page(surface, cards)
+                jobs.extend(page_jobs)
+                self.checkpoint.record_page(keyword, location, page_number, page_jobs)
+            # Only a search that ran out of pages (not one that failed) is finished
+            self.checkpoint.mark_search_done(keyword, location)
+        except Exception as e:
+            print(f"⚠️ Error searching jobs: {e}")
+        return jobs
+
+    async def run_search(self, search_pool: PagePool, keyword: str, location: str, max_pages: int) -> List[Dict]:
+        """One keyword/location search in a pooled tab, started no sooner than its pacing slot"""
+        async with search_pool.page() as page:
+            await self.search_pacer.wait(self.config.BASE_URL)
+            print(f"\n🔍 Searching: {keyword} in {location}")
+            return await self.search_jobs(page, keyword, location, max_pages)
+
+    async def sweep_searches(self, context: BrowserContext):
+        """Run every keyword × location search across a bounded pool of tabs and merge the results in order"""
+        tasks = [
+            (keyword, location, max_pages)
+            for keyword, max_pages in self.config.KEYWORDS.items()
+            for location in self.config.LOCATIONS
+            if not self.checkpoint.is_done(keyword, location)
+        ]
+        search_pool = await PagePool(context, min(self.config.SEARCH_TABS, len(tasks))).start()
+        print(f"🧭 Running {len(tasks)} searches across {search_pool.size} tabs...")
+        try:
+            results = await asyncio.gather(*(
+                self.run_search(search_pool, keyword, location, max_pages)
+                for keyword, location, max_pages in tasks
+            ))
+        finally:
+            await search_pool.close()
+        for jobs in results:
+            self.jobs_data.extend(jobs)
+
+    async def run_scraper(self):
+        try:
+            # One-off import of batch files written before the index existed
+            self.seen_index.sync_batch_files(self.output_dir)
+            for job in self.checkpoint.restore(self.resume):
+                self.seen_job_ids.add(job["job_id"])
+                self.jobs_data.append(job)
+                await self.publish_job(job)
+            await self.scrape_all()
+        finally:
+            if self.job_queue is not None:
+                await self.job_queue.put(None)
+            self.seen_index.close()
+            self.checkpoint.close()
+            self.job_store.close()
+
+    async def scrape_all(self):
+        async with async_playwright() as playwright:
+            context = await self.adapter.open_context(playwright)
+            try:
+                await self.adapter.prepare(context)
+                if self.config.DETAIL_TABS > 0 or not self.adapter.inline_details:
+                    self.detail_pool = await PagePool(
+                        context, self.config.DETAIL_TABS, max_navigations=self.config.TAB_MAX_NAVIGATIONS or None
+                    ).start()
+                await self.sweep_searches(context)
+
+                await self.save_results()
+                self.checkpoint.reset()
+            finally:
+                if self.detail_pool is not None:
+                    if self.detail_pool.recycled:
+                        print(f"♻️ Recycled {self.detail_pool.recycled} detail tabs")
+                    await self.detail_pool.close()
+                    self.detail_pool = None
+                self.helpers.report_network_stats()
+                browser = context.browser
+                await context.close()
+                if browser is not None:
+                    await browser.close()
+
+    # ------------------------- Output -------------------------
+
+    async def save_results(self):
+        if not self.jobs_data:
+            print("⚠️ No jobs scraped; nothing to save.")
+            return
+        # dedupe within this run and against every job_id saved by earlier batches
+        seen, unique_jobs = set(), []
+        for job in self.jobs_data:
+            if job["job_id"] not in seen and job["job_id"] not in self.seen_index:
+                seen.add(job["job_id"])
+                unique_jobs.append(job)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = self.output_dir / f"{self.batch_prefix}_{timestamp}.json"
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(unique_jobs, f, ensure_ascii=False, indent=2)
+        self.seen_index.add_many((job["job_id"] for job in unique_jobs), batch_file=filename.name)
+        print(f"💾 Saved {len(unique_jobs)} unique jobs to {filename}")
+
+        # Copy the batch to job_fit_analysis for downstream processing
+        if self.analysis_jobs_path is not None:
+            shutil.copy(filename, self.analysis_jobs_path)
+            print(f"📁 Copied results to {self.analysis_jobs_path}")
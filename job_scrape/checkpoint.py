@@ -0,0 +1,76 @@
+"""
+Checkpoints for resumable scraping runs.
+
+Every finished (keyword, location, page) unit is committed together with the jobs it
+produced, so a crash only loses the page that was in progress. A `--resume` run reloads
+those jobs and skips finished units; a normal run starts from an empty checkpoint, and
+the checkpoint is cleared once the results have been saved.
+"""
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+CHECKPOINT_FILENAME = "scrape_checkpoint.sqlite3"
+# Page number recorded once a keyword/location search has run out of pages
+SEARCH_DONE = 0
+
+
+class ScrapeCheckpoint:
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            "keyword TEXT NOT NULL, location TEXT NOT NULL, page INTEGER NOT NULL, finished_at REAL NOT NULL, "
+            "PRIMARY KEY (keyword, location, page))"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        self._conn.commit()
+
+    def restore(self, resume: bool) -> List[Dict]:
+        """Jobs saved by the interrupted run when resuming; otherwise start from a clean checkpoint"""
+        if not resume:
+            self.reset()
+            return []
+        jobs = [json.loads(row[0]) for row in self._conn.execute("SELECT data FROM jobs ORDER BY rowid")]
+        units = self._conn.execute("SELECT COUNT(*) FROM units WHERE page != ?", (SEARCH_DONE,)).fetchone()[0]
+        print(f"♻️ Resuming from checkpoint: {len(jobs)} jobs from {units} finished pages")
+        return jobs
+
+    def is_done(self, keyword: str, location: str, page: int = SEARCH_DONE) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM units WHERE keyword = ? AND location = ? AND page = ?", (keyword, location, page)
+        ).fetchone() is not None
+
+    def finished_pages(self, keyword: str, location: str) -> Set[int]:
+        rows = self._conn.execute(
+            "SELECT page FROM units WHERE keyword = ? AND location = ? AND page != ?", (keyword, location, SEARCH_DONE)
+        )
+        return {row[0] for row in rows}
+
+    def record_page(self, keyword: str, location: str, page: int, jobs: Iterable[Dict]) -> None:
+        """Mark one results page finished and store its jobs in the same transaction"""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (job_id, data) VALUES (?, ?)",
+                [(str(job["job_id"]), json.dumps(job, ensure_ascii=False)) for job in jobs],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO units (keyword, location, page, finished_at) VALUES (?, ?, ?, ?)",
+                (keyword, location, page, time.time()),
+            )
+
+    def mark_search_done(self, keyword: str, location: str) -> None:
+        self.record_page(keyword, location, SEARCH_DONE, [])
+
+    def reset(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM units")
+            self._conn.execute("DELETE FROM jobs")
+
+    def close(self) -> None:
+        self._conn.close()
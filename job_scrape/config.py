@@ -52,10 +52,60 @@ class Config:
     # Time filters (in hours)
     TIME_LIMIT = 24  # jobs posted within last 24 hours
     
+    # Searches open the filtered results URL directly (keywords, location, f_TPR); the UI
+    # search + filter clicks are only used when the results list does not appear
+    DIRECT_SEARCH = os.getenv('LINKEDIN_DIRECT_SEARCH', '1') != '0'
+    BASE_URL = 'https://www.linkedin.com'
+    SEARCH_URL = 'https://www.linkedin.com/jobs/search/'
+    RESULTS_PER_PAGE = 25
+
     # Scraping behavior
     MAX_PAGES = 10  # maximum pages to scrape per keyword
     DELAY_BETWEEN_REQUESTS = (2, 5)  # random delay range in seconds
     DELAY_BETWEEN_PAGES = (5, 10)  # delay between page loads
+
+    # Adaptive waits: actions wait for readiness signals (selector, network idle, stable
+    # card count) and then add a small ACTION_JITTER pause instead of fixed sleeps
+    ACTION_JITTER = (0.2, 0.8)
+    READY_TIMEOUT_MS = 20000
+    NETWORK_IDLE_TIMEOUT_MS = 5000
+    SLOW_MO_MS = int(os.getenv('LINKEDIN_SLOW_MO_MS', '0'))  # Playwright slow_mo on every browser action
+    # Results-list scrolling stops once the card count has not grown for SCROLL_STABLE_POLLS
+    # polls at the bottom of the list, or after SCROLL_MAX_DURATION seconds
+    SCROLL_STEP = 600
+    SCROLL_POLL_INTERVAL = 0.3
+    SCROLL_STABLE_POLLS = 3
+    SCROLL_MAX_DURATION = 20
+
+    # Concurrent detail fetching: job detail URLs from the results list are opened in a
+    # pool of tabs instead of clicking each card (0 = click through cards one at a time)
+    DETAIL_TABS = int(os.getenv('LINKEDIN_DETAIL_TABS', '0'))
+    # Per-domain pacing shared by all tabs: minimum seconds between navigations plus jitter
+    DOMAIN_MIN_INTERVAL = float(os.getenv('LINKEDIN_DOMAIN_MIN_INTERVAL', '2'))
+    DOMAIN_JITTER = (0.5, 2.5)
+    # Replace a detail tab after this many navigations to cap renderer memory (0 = never)
+    TAB_MAX_NAVIGATIONS = int(os.getenv('LINKEDIN_TAB_MAX_NAVIGATIONS', '0'))
+
+    # Keyword × location searches run concurrently in up to SEARCH_TABS tabs (1 = one at a time);
+    # search starts are spaced by SEARCH_MIN_INTERVAL seconds plus jitter
+    SEARCH_TABS = int(os.getenv('LINKEDIN_SEARCH_TABS', '3'))
+    SEARCH_MIN_INTERVAL = float(os.getenv('LINKEDIN_SEARCH_MIN_INTERVAL', '5'))
+    SEARCH_JITTER = (0.0, 5.0)
+
+    # Network interception: the scraper only needs DOM text, so these are never downloaded
+    BLOCK_RESOURCES = os.getenv('LINKEDIN_BLOCK_RESOURCES', '1') != '0'
+    BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font']
+    BLOCKED_HOSTS = [
+        'doubleclick.net',
+        'google-analytics.com',
+        'googletagmanager.com',
+        'googlesyndication.com',
+        'facebook.net',
+        'bing.com',
+    ]
+    # Optionally block everything not served by the site itself (may break login challenges)
+    FIRST_PARTY_HOSTS = ['linkedin.com', 'licdn.com']
+    BLOCK_THIRD_PARTY = os.getenv('LINKEDIN_BLOCK_THIRD_PARTY', '0') == '1'
     
     # Proxy configuration
     USE_PROXIES = False
@@ -1,257 +1,149 @@
-    # async def create_browser_context(self, playwright) -> tuple[Browser, BrowserContext]:
-    #     """Create browser + context with proxy and UA"""
-    #     browser_type = playwright.chromium
-    #     launch_options = {
-    #         "headless": self.config.HEADLESS,
-    #         "slow_mo": 500,  # 🐢 <— add this line for slow motion
-    #         "args": [
-    #             "--no-sandbox",
-    #             "--disable-blink-features=AutomationControlled",
-    #             "--disable-dev-shm-usage",
-    #             "--disable-extensions",
-    #             "--no-first-run",
-    #             "--disable-default-apps",
-    #             "--disable-features=TranslateUI",
-    #             "--disable-ipc-flooding-protection",
-    #         ],
-    #     }
-    #     proxy = self.get_next_proxy()
-    #     if proxy:
-    #         launch_options["proxy"] = {"server": proxy}
-
-    #     browser = await browser_type.launch(**launch_options)
-    #     context = await browser.new_context(
-    #         user_agent=self.get_random_user_agent(),
-    #         viewport={
-    #             "width": self.config.VIEWPORT_WIDTH,
-    #             "height": self.config.VIEWPORT_HEIGHT,
-    #         },
-    #         locale="en-US",
-    #         timezone_id="America/New_York",
-    #     )
-
-    #     # Anti-detection script
-    #     await context.add_init_script(
-    #         """
-    #         Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-    #         Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-    #         Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-    #         """
-    #     )
-    #     return browser, context
-
 """
 LinkedIn Job Scraper
 - Excludes reposted jobs
 - Scrapes job descriptions
 - Uses Playwright async API, proxy rotation, and human-like behavior
 """
+import argparse
 import asyncio
-import random
-import json
-from datetime import datetime, timedelta, timezone
-import shutil
+from datetime import timedelta, timezone
+from functools import partial
 import time
+from pathlib import Path
 from typing import List, Dict, Optional
+from urllib.parse import urlencode
 # import pandas as pd
-from playwright.async_api import async_playwright, BrowserContext, Page
-from fake_useragent import UserAgent
+from playwright.async_api import BrowserContext, Page
 from config import Config
 from scraper_helpers import ScraperHelpers
-import os
+from seen_jobs import SeenJobIndex
+from checkpoint import ScrapeCheckpoint
+from base_scraper import BaseJobScraper, SourceAdapter
+from job_store.store import JobStore
 from playwright.async_api import TimeoutError as PWTimeout
 
+SCRAPE_DIR = Path(__file__).resolve().parent
+OUTPUT_DIR = SCRAPE_DIR / "linkedin_jobs"
+ANALYSIS_JOBS_PATH = SCRAPE_DIR.parent / "job_fit_analysis" / "linkedin_jobs.json"
+
+CARD_SELECTOR = ".job-card-job-posting-card-wrapper, div[data-job-id], li[data-job-id]"
+CARD_TITLE_SELECTOR = '.artdeco-entity-lockup__title strong, .job-card-list__title, h3'
+CARD_COMPANY_SELECTOR = '.artdeco-entity-lockup__subtitle div[dir="ltr"], .job-card-container__company-name, .job-card-list__company-name'
+CARD_LOCATION_SELECTOR = '.artdeco-entity-lockup__caption div[dir="ltr"], .job-card-container__metadata-item, .job-card-list__location'
+DESCRIPTION_SELECTOR = ".jobs-box__html-content, .show-more-less-html__markup"
+CARD_LINK_SELECTOR = "a[href*='/jobs/view/'], a[href*='/jobs/search-results/?currentJobId=']"
+# Results list of both the semantic (UI search) and the classic (/jobs/search/ URL) layouts
+RESULTS_LIST_SELECTOR = ".scaffold-layout__list, .jobs-search-results-list"
+RESULTS_SCROLL_SELECTOR = ".semantic-search-results-list, .jobs-search-results-list, .scaffold-layout__list"
+
+# Reads every card on the results page in a single protocol round trip
+EXTRACT_CARDS_JS = """
+(selectors) => Array.from(document.querySelectorAll(selectors.card)).map((el, index) => {
+    const text = (selector) => {
+        const node = el.querySelector(selector);
+        return node ? node.innerText.trim() : null;
+    };
+    const holder = el.closest('[data-job-id]') || el.querySelector('[data-job-id]');
+    const link = el.querySelector(selectors.link);
+    return {
+        index,
+        dataJobId: holder ? holder.getAttribute('data-job-id') : null,
+        title: text(selectors.title),
+        company: text(selectors.company),
+        location: text(selectors.location),
+        href: link ? link.getAttribute('href') : null,
+    };
+})
+"""
 
+# Scrolls the results list one step and reports how many cards are attached and whether the end is reached
+SCROLL_LIST_JS = """
+({ list, card, step }) => {
+    const candidates = Array.from(document.querySelectorAll(list));
+    const container = candidates.find((el) => el.scrollHeight > el.clientHeight) || candidates[0];
+    if (container) container.scrollBy(0, step);
+    return {
+        count: document.querySelectorAll(card).length,
+        atBottom: !container || container.scrollTop + container.clientHeight >= container.scrollHeight - 2,
+    };
+}
+"""
 
-class LinkedInJobScraper:
-    def __init__(self):
-        self.config = Config()
-        self.helpers = ScraperHelpers(self.config)
-        self.jobs_data = []
+# define what is GTA cities
+GTA_CITIES = ['Toronto', 'Markham', 'Richmond Hill', 'Mississauga', 'Brampton', 'Vaughan', 'Oakville', 'Burlington', 'Hamilton', 'Oshawa', 'Pickering', 'Ajax', 'Whitchurch-Stouffville', 'Whitby', 'North York','Greater Toronto Area', 'Remote', 'GTA', 'Caledon', 'NewMarket', 'King', 'Uxbridge', 'Aurora', 'Scugog', 'East York']
 
-    # ------------------------- Utility helpers -------------------------
-    async def scroll_visually_down(self, page: Page, selector: str, duration: float = 6.0, step: int = 220):
-        print(f"🖱️ Moving mouse to first job card and scrolling {selector} down slowly...")
-        await page.wait_for_selector(selector, timeout=20000)
 
-        start_time = asyncio.get_event_loop().time()
-        while (asyncio.get_event_loop().time() - start_time) < duration:
-            await page.evaluate(f"document.querySelector('{selector}').scrollBy(0, {step})")
-            await self.helpers.human_like_delay(0.3, 0.5)
-        print("✅ Finished visual scroll.")
+class LinkedInAdapter(SourceAdapter):
+    """LinkedIn results pages (direct URL or search UI) with a detail pane next to the list"""
 
+    name = "linkedin"
+    inline_details = True
+    # scraped_at is recorded in GMT-4
+    scraped_at_tz = timezone(timedelta(hours=-4))
+    location_skip_reason = "Location not in GTA"
 
-    # ------------------------- Core scraping logic -------------------------
+    LIST = ".scaffold-layout__list.jobs-semantic-search-list"
+    IFRAME = 'iframe[data-testid="interop-iframe"]'
 
-    async def extract_job_data(self, page: Page, max_pages: int = 1) -> List[Dict]:
-        """Extract job cards (title, company, location, description) from LinkedIn job search results (up to max_pages)."""
-        jobs = []
-        page_number = 1
+    # ------------------------- Utility helpers -------------------------
+    async def scroll_visually_down(self, page: Page, selector: str, card_selector: str = CARD_SELECTOR,
+                                   max_duration: float = None, step: int = None) -> int:
+        """
+        Scroll the results list until the number of attached job cards stops growing
+        (and the list is at its end) or max_duration runs out; returns the final card count.
+        """
+        max_duration = max_duration or self.config.SCROLL_MAX_DURATION
+        step = step or self.config.SCROLL_STEP
+        print(f"🖱️ Scrolling {selector} until all job cards are loaded...")
+        await page.wait_for_selector(selector, timeout=self.config.READY_TIMEOUT_MS)
+
+        start_time = time.monotonic()
+        last_count, stable = -1, 0
+        while True:
+            state = await page.evaluate(SCROLL_LIST_JS, {"list": selector, "card": card_selector, "step": step})
+            count = state["count"]
+            stable = stable + 1 if count == last_count and state["atBottom"] else 0
+            last_count = count
+            if stable >= self.config.SCROLL_STABLE_POLLS:
+                break
+            if time.monotonic() - start_time >= max_duration:
+                print(f"⏱️ Scroll hit the {max_duration:.0f}s limit with {count} cards still loading")
+                break
+            await asyncio.sleep(self.config.SCROLL_POLL_INTERVAL)
+        print(f"✅ Loaded {count} job cards in {time.monotonic() - start_time:.1f}s of scrolling.")
+        return count
+
+
+    # ------------------------- Session -------------------------
+
+    async def open_context(self, playwright) -> BrowserContext:
+        # Persistent profile, so the login cookies survive between runs
+        return await self.helpers.create_browser_context(playwright)
+
+    async def prepare(self, context: BrowserContext):
+        page = await context.new_page()
+        await self.helpers.goto(page, "https://www.linkedin.com/feed/", wait_until="domcontentloaded")
+        if "login" in page.url.lower():
+            print("🔐 Not logged in — performing login...")
+            if self.config.LINKEDIN_EMAIL and self.config.LINKEDIN_PASSWORD:
+                await self.login(page)
+        else:
+            print("✅ Already logged in — skipping login")
+        await page.close()
 
+    async def login(self, page: Page):
         try:
-            while page_number <= max_pages:
-                print(f"\n📄 Scraping page {page_number}...")
-
-                # 🔄 Scroll job list to ensure all lazy-loaded jobs appear
-                await self.scroll_visually_down(page, selector=".semantic-search-results-list")
-
-                # 🧭 Wait for visible job cards
-                await page.wait_for_selector(
-                    ".job-card-job-posting-card-wrapper, div[data-job-id], li[data-job-id]",
-                    state="attached",
-                    timeout=20000
-                )
-
-                job_elements = await page.query_selector_all(
-                    ".job-card-job-posting-card-wrapper, div[data-job-id], li[data-job-id]"
-                )
-                print(f"✅ Found {len(job_elements)} job cards on page {page_number}")
-
-                # 🧩 Extract job data from each card
-                for job_element in job_elements:
-                    try:
-                        title_el = await job_element.query_selector(
-                            '.artdeco-entity-lockup__title strong, .job-card-list__title, h3'
-                        )
-                        company_el = await job_element.query_selector(
-                            '.artdeco-entity-lockup__subtitle div[dir="ltr"], .job-card-container__company-name, .job-card-list__company-name'
-                        )
-                        location_el = await job_element.query_selector(
-                            '.artdeco-entity-lockup__caption div[dir="ltr"], .job-card-container__metadata-item, .job-card-list__location'
-                        )
-                        link_el = await job_element.query_selector(
-                            "a[href*='/jobs/view/'], a[href*='/jobs/search-results/?currentJobId=']"
-                        )
-
-                        title = await title_el.inner_text() if title_el else "N/A"
-                        company = await company_el.inner_text() if company_el else "N/A"
-
-                        # continue if company is within a blacklist company list
-                        if company in self.config.BLACKLIST_COMPANIES:
-                            print(f"⏩ Skipping job: {title.strip()} - Company in blacklist")
-                            continue
-
-                        # continue if title contains any of the title keywords blacklist
-                        if any(keyword in title for keyword in self.config.TITLE_KEYWORDS_BLACKLIST):
-                            print(f"⏩ Skipping job: {title.strip()} - Title contains keyword in blacklist")
-                            continue
-                        
-                        location = await location_el.inner_text() if location_el else "N/A"
-
-                        # define what is GTA cities
-                        GTA_CITIES = ['Toronto', 'Markham', 'Richmond Hill', 'Mississauga', 'Brampton', 'Vaughan', 'Oakville', 'Burlington', 'Hamilton', 'Oshawa', 'Pickering', 'Ajax', 'Whitchurch-Stouffville', 'Whitby', 'North York','Greater Toronto Area', 'Remote', 'GTA', 'Caledon', 'NewMarket', 'King', 'Uxbridge', 'Aurora', 'Scugog', 'East York']
-
-                        # check across all the cities in GTA, ontario, canada. If the location doesn't include any of the GTA cities, skip
-                        if not any(city in location for city in GTA_CITIES):
-                            print(f"⏩ Skipping job: {title.strip()} - Location not in GTA")
-                            continue
-
-                        await link_el.get_attribute("href")
-
-                        # Click job card (to load right panel)
-                        await link_el.click()
-                        print(f"🖱️ Clicked job: {title.strip()} — waiting for description...")
-                        await page.wait_for_selector(
-                            ".jobs-box__html-content, .show-more-less-html__markup",
-                            timeout=20000
-                        )
-                        await self.helpers.human_like_delay(1, 2)
-
-                        # Skip reposted jobs
-                        repost_el = await page.query_selector('span:has-text("Reposted")')
-                        if repost_el:
-                            print(f"⏩ Skipping reposted job: {title.strip()}")
-                            continue
-
-                        # Skip closed jobs
-                        closed_el = await page.query_selector('span.artdeco-inline-feedback__message:has-text("No longer accepting applications")')
-                        if closed_el:
-                            print(f"⏩ Skipping closed job: {title.strip()}")
-                            continue
-
-                        ifEasyApply = await page.query_selector('span.artdeco-button__text:has-text("Easy Apply")')
-                        
-                        # Extract description
-                        desc_el = await page.query_selector(
-                            ".jobs-box__html-content, .show-more-less-html__markup"
-                        )
-                        description = await desc_el.inner_text() if desc_el else ""
-
-                        # Check if description has French words
-                        if self.helpers.has_french_words(description):
-                            print(f"⏩ Skipping job: {title.strip()} - French job description")
-                            continue
-
-                        # get the href of the job link
-                        job_url = "https://www.linkedin.com" + await page.get_attribute(".job-details-jobs-unified-top-card__job-title h1 a", "href")
-                        job_id = self.helpers.extract_job_id(job_url)
-                        # Extract posted date
-                        date_el = await page.query_selector(
-                            ".job-details-jobs-unified-top-card__primary-description-container span.tvm__text--positive strong span"
-                        )
-                        posted_date = await date_el.inner_text() if date_el else "N/A"
-                        if posted_date == "N/A":
-                            continue
-                        easy_apply = True if ifEasyApply else False
-
-                        gmt_minus_4 = timezone(timedelta(hours=-4))
-
-                        # Save job data
-                        job_data = {
-                            "title": title.strip(),
-                            "company": company.strip(),
-                            "location": location.strip(),
-                            "job_id": job_id,
-                            "url": job_url,
-                            "description": description.strip(),
-                            "easy_apply": easy_apply,
-                            "posted_date": posted_date.strip(),
-                            # use gmt-4 timezone
-                            "scraped_at": datetime.now(gmt_minus_4).isoformat(),
-                        }
-                        jobs.append(job_data)
-                        print(f"✅ Scraped: {title[:60]} | {company}")
-                        await self.helpers.human_like_delay(1, 2)
-
-                    except Exception as e:
-                        print(f"⚠️ Error extracting job card: {e}")
-                        continue
-
-                # 🔁 Pagination (stop if no Next or reached page limit)
-                if page_number >= max_pages:
-                    print(f"⏹️ Reached max page limit ({max_pages}). Stopping pagination.")
-                    break
-
-                next_button = await page.query_selector(
-                    'button[aria-label="View next page"]'
-                )
-                if next_button:
-                    is_disabled = await next_button.get_attribute("disabled")
-                    if is_disabled:
-                        print("⏹️ No more pages found.")
-                        break
-
-                    print("➡️ Clicking 'Next' for more results...")
-                    await next_button.click()
-                    page_number += 1
-                    await self.helpers.human_like_delay(3, 5)
-
-                    # Wait for job list refresh
-                    await page.wait_for_selector(
-                        ".job-card-job-posting-card-wrapper, div[data-job-id], li[data-job-id]",
-                        timeout=20000
-                    )
-                else:
-                    print("⏹️ No Next button detected.")
-                    break
-
+            await self.helpers.goto(page, "https://www.linkedin.com/login")
+            await self.helpers.wait_until_ready(page, "#username")
+            await (await page.wait_for_selector("#username")).fill(self.config.LINKEDIN_EMAIL)
+            await (await page.wait_for_selector("#password")).fill(self.config.LINKEDIN_PASSWORD)
+            await page.click('button[type="submit"]')
+            await self.helpers.wait_until_ready(page, network_idle=True)
+            print("✅ Logged in successfully")
         except Exception as e:
-            print(f"⚠️ Error parsing frame: {e}")
-
-        return jobs
+            print(f"⚠️ Login failed: {e}")
 
-    LIST = ".scaffold-layout__list.jobs-semantic-search-list"
-    IFRAME = 'iframe[data-testid="interop-iframe"]'
+    # ------------------------- Result pages -------------------------
 
     async def get_results_surface(self,page):
         """Return (surface, LIST) where surface is either the page or the iframe's content_frame()."""
@@ -268,130 +160,241 @@ class LinkedInJobScraper:
         await page.wait_for_selector(self.LIST, state="attached", timeout=30_000)  # pyright: ignore[reportUndefinedVariable]
         return page, self.LIST
 
-    async def search_jobs(self, page: Page, context: BrowserContext, keyword: str, location: str = "", max_pages: int = 1) -> List[Dict]:
-        """Search by keyword/location and paginate, including clicking 'Past 24 hours' filter."""
-        all_jobs = []
+    def build_search_url(self, keyword: str, location: str = "", start: int = 0) -> str:
+        """Results URL with the keyword, location and posted-within (f_TPR, seconds) filters applied"""
+        params = {
+            "keywords": keyword,
+            "location": location,
+            "f_TPR": f"r{self.config.TIME_LIMIT * 3600}",
+        }
+        if start:
+            params["start"] = str(start)
+        return f"{self.config.SEARCH_URL}?{urlencode(params)}"
+
+    async def open_search_url(self, page: Page, keyword: str, location: str = "", start: int = 0):
+        """Fast path: navigate once to the filtered results URL; returns the results surface or None"""
+        await self.helpers.goto(page, self.build_search_url(keyword, location, start), wait_until="domcontentloaded")
         try:
-            # --- Navigate to jobs homepage ---
-            await page.goto("https://www.linkedin.com/jobs/", wait_until="domcontentloaded")
-            await self.helpers.human_like_delay()
-            await self.helpers.simulate_human_behavior(page)
-
-            # --- Perform search ---
-            search_input = await page.wait_for_selector('input[placeholder*="Describe the job"], input[aria-label*="Search jobs"]')
-            await search_input.fill(keyword)
-            await search_input.press("Enter")
-            await self.helpers.human_like_delay(3, 5)
-
-            # --- Wait for job search results container ---
-            
-            # await page.wait_for_selector(".scaffold-layout__list.jobs-semantic-search-list", state="attached", timeout=20000)
-            surface, list_selector = await self.get_results_surface(page)
-            print("✅ Found job search results container")
-
-            # --- Click "Date Posted" filter and select "Past 24 hours" ---
-            try:
-                # Click the "Date posted" dropdown
-                await surface.wait_for_selector('#searchFilter_timePostedRange', state="attached", timeout=30000)
-                await surface.click('#searchFilter_timePostedRange')
-                await self.helpers.human_like_delay(1, 2)
-
-                # Select "Past 24 hours"
-                await surface.wait_for_selector('label[for="timePostedRange-r86400"]', timeout=30000)
-                await surface.click('label[for="timePostedRange-r86400"]')
-                print("✅ Selected 'Past 24 hours' filter successfully")
-                await self.helpers.human_like_delay(1, 2)
-
-                # Click "Show results" to apply the filter
-                await surface.wait_for_selector('button[aria-label*="Apply current filter"], button:has-text("Show results")', timeout=30000)
-                await surface.click('button[aria-label*="Apply current filter"], button:has-text("Show results")')
-                print("✅ Clicked 'Show results' to apply the filter")
-                await self.helpers.human_like_delay(3, 5)
-            except Exception as e:
-                print(f"⚠️ Could not apply 'Past 24 hours' filter: {e}")
-
-            # --- Extract job data from main DOM ---
-            page_jobs = await self.extract_job_data(surface, max_pages)
-            all_jobs.extend(page_jobs)
-
-        except Exception as e:
-            print(f"⚠️ Error searching jobs: {e}")
-
-        return all_jobs
-
-
-    # ------------------------- Runner and output -------------------------
-
-    async def run_scraper(self):
-        async with async_playwright() as playwright:
-            context = await self.helpers.create_browser_context(playwright)
-            try:
-                page = await context.new_page()
-
-                await page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
-                if "login" in page.url.lower():
-                    print("🔐 Not logged in — performing login...")
-                    if self.config.LINKEDIN_EMAIL and self.config.LINKEDIN_PASSWORD:
-                        await self.login(page)
-                else:
-                    print("✅ Already logged in — skipping login")
-                #now KEYWWORDS IS A DICT
-                for keyword, max_pages in self.config.KEYWORDS.items():
-                    for location in self.config.LOCATIONS:
-                        print(f"\n🔍 Searching: {keyword} in {location}")
-                        jobs = await self.search_jobs(page, context, keyword, location, max_pages)
-                        self.jobs_data.extend(jobs)
-                        await self.helpers.human_like_delay(5, 10)
-
-                await self.save_results()
-
-            finally:
-                await context.close()
-
-    async def login(self, page: Page):
+            await page.wait_for_selector(f"{self.IFRAME}, {RESULTS_LIST_SELECTOR}", state="attached",
+                                         timeout=self.config.READY_TIMEOUT_MS)
+            iframe_el = await page.query_selector(self.IFRAME)
+            surface = await iframe_el.content_frame() if iframe_el else page
+            await self.helpers.wait_until_ready(surface, RESULTS_LIST_SELECTOR)
+        except PWTimeout:
+            return None
+        return surface
+
+    async def search_via_ui(self, page: Page, keyword: str):
+        """Fallback: type the keyword into the jobs search box and apply 'Past 24 hours' through the filter UI"""
+        # --- Navigate to jobs homepage ---
+        await self.helpers.goto(page, "https://www.linkedin.com/jobs/", wait_until="domcontentloaded")
+        search_box = 'input[placeholder*="Describe the job"], input[aria-label*="Search jobs"]'
+        await self.helpers.wait_until_ready(page, search_box)
+        await self.helpers.simulate_human_behavior(page)
+
+        # --- Perform search ---
+        search_input = await page.wait_for_selector(search_box)
+        await search_input.fill(keyword)
+        await search_input.press("Enter")
+
+        # --- Wait for job search results container ---
+        surface, list_selector = await self.get_results_surface(page)
+        print("✅ Found job search results container")
+
+        # --- Click "Date Posted" filter and select "Past 24 hours" ---
         try:
-            await page.goto("https://www.linkedin.com/login")
-            await self.helpers.human_like_delay(2, 4)
-            await (await page.wait_for_selector("#username")).fill(self.config.LINKEDIN_EMAIL)
-            await (await page.wait_for_selector("#password")).fill(self.config.LINKEDIN_PASSWORD)
-            await page.click('button[type="submit"]')
-            await self.helpers.human_like_delay(3, 5)
-            print("✅ Logged in successfully")
+            # Click the "Date posted" dropdown
+            await surface.wait_for_selector('#searchFilter_timePostedRange', state="attached", timeout=30000)
+            await surface.click('#searchFilter_timePostedRange')
+            await self.helpers.jitter()
+
+            # Select "Past 24 hours"
+            await surface.wait_for_selector('label[for="timePostedRange-r86400"]', timeout=30000)
+            await surface.click('label[for="timePostedRange-r86400"]')
+            print("✅ Selected 'Past 24 hours' filter successfully")
+            await self.helpers.jitter()
+
+            # Click "Show results" to apply the filter
+            await surface.wait_for_selector('button[aria-label*="Apply current filter"], button:has-text("Show results")', timeout=30000)
+            await surface.click('button[aria-label*="Apply current filter"], button:has-text("Show results")')
+            print("✅ Clicked 'Show results' to apply the filter")
+            await self.helpers.wait_until_ready(surface, list_selector, network_idle=True)
         except Exception as e:
-            print(f"⚠️ Login failed: {e}")
+            print(f"⚠️ Could not apply 'Past 24 hours' filter: {e}")
+        return surface
+
+    async def result_pages(self, page: Page, keyword: str, location: str, max_pages: int, first_page: int = 1):
+        """Open the search (direct URL, or the search UI as a fallback) and walk its pages"""
+        surface, page_url = None, None
+        if self.config.DIRECT_SEARCH:
+            start = (first_page - 1) * self.config.RESULTS_PER_PAGE
+            surface = await self.open_search_url(page, keyword, location, start)
+            if surface is None:
+                print("⚠️ Results list did not appear for the search URL — falling back to the search UI")
+            elif surface is page:
+                # Later pages are plain URLs too (an iframe surface still paginates with Next)
+                page_url = partial(self.build_search_url, keyword, location)
+        if surface is None:
+            surface = await self.search_via_ui(page, keyword)
+            first_page = 1
+
+        page_number = first_page
+        while True:
+            print(f"\n📄 Scraping page {page_number}...")
+
+            # 🔄 Scroll job list to ensure all lazy-loaded jobs appear
+            await self.scroll_visually_down(surface, selector=RESULTS_SCROLL_SELECTOR)
+
+            # 🧭 Wait for visible job cards
+            await surface.wait_for_selector(CARD_SELECTOR, state="attached", timeout=self.config.READY_TIMEOUT_MS)
+
+            # 📦 One evaluate for all cards; the engine filters them before any clicks
+            cards = await self.extract_card_summaries(surface)
+            yield page_number, surface, cards
+
+            # 🔁 Pagination (stop if no Next or reached page limit)
+            if page_number >= max_pages:
+                print(f"⏹️ Reached max page limit ({max_pages}). Stopping pagination.")
+                return
+
+            if page_url is not None:
+                if len({card["job_id"] for card in cards}) < self.config.RESULTS_PER_PAGE:
+                    print("⏹️ No more pages found.")
+                    return
+                page_number += 1
+                print("➡️ Opening the next results page...")
+                await self.helpers.goto(surface, page_url((page_number - 1) * self.config.RESULTS_PER_PAGE),
+                                        wait_until="domcontentloaded")
+                await self.helpers.wait_until_ready(surface, CARD_SELECTOR)
+                continue
+
+            next_button = await surface.query_selector('button[aria-label="View next page"]')
+            if not next_button:
+                print("⏹️ No Next button detected.")
+                return
+            if await next_button.get_attribute("disabled"):
+                print("⏹️ No more pages found.")
+                return
+
+            print("➡️ Clicking 'Next' for more results...")
+            await next_button.click()
+            page_number += 1
+
+            # Wait for the job list refresh to settle
+            await self.helpers.wait_until_ready(surface, CARD_SELECTOR, network_idle=True)
+
+    async def extract_card_summaries(self, surface) -> List[Dict]:
+        """Title, company, location, href, job id and URL of every card on the page, in DOM order"""
+        raw_cards = await surface.evaluate(EXTRACT_CARDS_JS, {
+            "card": CARD_SELECTOR,
+            "title": CARD_TITLE_SELECTOR,
+            "company": CARD_COMPANY_SELECTOR,
+            "location": CARD_LOCATION_SELECTOR,
+            "link": CARD_LINK_SELECTOR,
+        })
+        cards = []
+        for raw in raw_cards:
+            data_job_id = raw.get("dataJobId")
+            job_id = data_job_id if data_job_id and data_job_id.isdigit() else self.helpers.job_id_from_href(raw.get("href"))
+            cards.append({
+                "index": raw["index"],
+                "job_id": job_id,
+                "title": raw.get("title") or "N/A",
+                "company": raw.get("company") or "N/A",
+                "location": raw.get("location") or "N/A",
+                "href": raw.get("href"),
+                "url": f"https://www.linkedin.com/jobs/view/{job_id}/" if job_id else None,
+            })
+        return cards
+
+    def location_allowed(self, location: str) -> bool:
+        # check across all the cities in GTA, ontario, canada. If the location doesn't include any of the GTA cities, skip
+        return any(city in location for city in GTA_CITIES)
+
+    # ------------------------- Job details -------------------------
+
+    async def show_inline_detail(self, surface, card: Dict):
+        """Click the card so its detail loads in the right pane"""
+        job_elements = await surface.query_selector_all(CARD_SELECTOR)
+        if card["index"] >= len(job_elements):
+            raise ValueError(f"job card {card['index']} is no longer on the page")
+        link_el = await job_elements[card["index"]].query_selector(CARD_LINK_SELECTOR)
+        if not link_el:
+            raise ValueError(f"job card {card['title']!r} has no link")
+        await link_el.click()
+        print(f"🖱️ Clicked job: {card['title'].strip()} — waiting for description...")
+        await self.helpers.wait_until_ready(surface, DESCRIPTION_SELECTOR)
+
+    async def open_detail(self, page: Page, card: Dict):
+        await self.helpers.goto(page, card["url"], wait_until="domcontentloaded")
+        await page.wait_for_selector(DESCRIPTION_SELECTOR, timeout=self.config.READY_TIMEOUT_MS)
+
+    async def read_detail(self, page, card: Dict) -> Optional[Dict]:
+        """Read the open job detail (right pane or /jobs/view/ page); None if the job should be skipped"""
+        title = card["title"]
+
+        # Skip reposted jobs
+        repost_el = await page.query_selector('span:has-text("Reposted")')
+        if repost_el:
+            print(f"⏩ Skipping reposted job: {title.strip()}")
+            return None
+
+        # Skip closed jobs
+        closed_el = await page.query_selector('span.artdeco-inline-feedback__message:has-text("No longer accepting applications")')
+        if closed_el:
+            print(f"⏩ Skipping closed job: {title.strip()}")
+            return None
+
+        ifEasyApply = await page.query_selector('span.artdeco-button__text:has-text("Easy Apply")')
+
+        # Extract description
+        desc_el = await page.query_selector(DESCRIPTION_SELECTOR)
+        description = await desc_el.inner_text() if desc_el else ""
+
+        # get the href of the job link
+        job_url = card["url"]
+        if job_url is None:
+            job_url = "https://www.linkedin.com" + await page.get_attribute(".job-details-jobs-unified-top-card__job-title h1 a", "href")
+        # Extract posted date
+        date_el = await page.query_selector(
+            ".job-details-jobs-unified-top-card__primary-description-container span.tvm__text--positive strong span"
+        )
+        posted_date = await date_el.inner_text() if date_el else "N/A"
+        if posted_date == "N/A":
+            return None
+
+        return {
+            "job_id": self.helpers.extract_job_id(job_url),
+            "url": job_url,
+            "description": description,
+            "easy_apply": True if ifEasyApply else False,
+            "posted_date": posted_date.strip(),
+        }
+
+
+class LinkedInJobScraper(BaseJobScraper):
+    def __init__(self, job_queue: Optional[asyncio.Queue] = None, seen_index: Optional[SeenJobIndex] = None,
+                 resume: bool = False, checkpoint: Optional[ScrapeCheckpoint] = None,
+                 job_store: Optional[JobStore] = None):
+        config = Config()
+        super().__init__(
+            LinkedInAdapter(config, ScraperHelpers(config)),
+            output_dir=OUTPUT_DIR,
+            batch_prefix="linkedin_jobs_batch",
+            analysis_jobs_path=ANALYSIS_JOBS_PATH,
+            job_queue=job_queue,
+            seen_index=seen_index,
+            resume=resume,
+            checkpoint=checkpoint,
+            job_store=job_store,
+        )
 
-    async def save_results(self):
-        if not self.jobs_data:
-            print("No jobs found to save.")
-            return
-        seen, unique_jobs = set(), []
-        # load seen with all the job_ids in the linkedin_jobs folder
-        for file in os.listdir('linkedin_jobs'):
-            if file.endswith('.json'):
-                with open(f'linkedin_jobs/{file}', 'r', encoding='utf-8') as f:
-                    jobs = json.load(f)
-                    for job in jobs:
-                        seen.add(job["job_id"])
-        for job in self.jobs_data:
-            if job["job_id"] not in seen:
-                seen.add(job["job_id"])
-                unique_jobs.append(job)
-        print(f"\n💾 Saving {len(unique_jobs)} jobs")
-        if self.config.OUTPUT_FORMAT.lower() == "csv":
-            pd.DataFrame(unique_jobs).to_csv(self.config.OUTPUT_FILE, index=False)
-        else:
-            # file name is linkedin_jobs_batch_timestamp.json under a folder called linkedin_jobs
-            os.makedirs('linkedin_jobs', exist_ok=True)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'linkedin_jobs/linkedin_jobs_batch_{timestamp}.json'
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(unique_jobs, f, ensure_ascii=False, indent=2)
-        print("✅ Results saved successfully.")
-        #copy the file to the job_fit_analysis folder
-        shutil.copy(filename, '../job_fit_analysis/linkedin_jobs.json')
 
 async def main():
-    scraper = LinkedInJobScraper()
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn job postings")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted run from its checkpoint")
+    args = parser.parse_args()
+    scraper = LinkedInJobScraper(resume=args.resume)
     await scraper.run_scraper()
 
 
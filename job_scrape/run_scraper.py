@@ -2,6 +2,7 @@
 """
 Simple runner script for LinkedIn job scraper
 """
+import argparse
 import asyncio
 import sys
 from linkedin_scraper import LinkedInJobScraper
@@ -9,11 +10,14 @@ from linkedin_scraper import LinkedInJobScraper
 
 async def main():
     """Run the scraper with error handling"""
+    parser = argparse.ArgumentParser(description="Run the LinkedIn job scraper")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted run from its checkpoint")
+    args = parser.parse_args()
     try:
         print("Starting LinkedIn Job Scraper...")
         print("=" * 50)
         
-        scraper = LinkedInJobScraper()
+        scraper = LinkedInJobScraper(resume=args.resume)
         await scraper.run_scraper()
         
         print("=" * 50)
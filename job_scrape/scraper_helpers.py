@@ -5,23 +5,176 @@ Contains utility methods for browser automation, human-like behavior, and data p
 import asyncio
 import random
 import os
+import re
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Optional
-from playwright.async_api import BrowserContext, Page
-from fake_useragent import UserAgent
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Page, TimeoutError as PWTimeout
 from config import Config
 
 
+def _host_matches(host: str, suffixes: Iterable[str]) -> bool:
+    return any(host == suffix or host.endswith("." + suffix) for suffix in suffixes)
+
+
+class ResourcePolicy:
+    """Decides which browser requests are aborted: by resource type, blocked host or third-party host."""
+
+    def __init__(
+        self,
+        blocked_types: Iterable[str] = (),
+        first_party_hosts: Iterable[str] = (),
+        blocked_hosts: Iterable[str] = (),
+        block_third_party: bool = False,
+    ):
+        self.blocked_types = set(blocked_types)
+        self.first_party_hosts = list(first_party_hosts)
+        self.blocked_hosts = list(blocked_hosts)
+        self.block_third_party = block_third_party
+
+    @classmethod
+    def from_config(cls, config) -> Optional["ResourcePolicy"]:
+        """Policy from a scraper Config, or None when blocking is turned off"""
+        if not getattr(config, "BLOCK_RESOURCES", False):
+            return None
+        return cls(
+            getattr(config, "BLOCKED_RESOURCE_TYPES", ()),
+            getattr(config, "FIRST_PARTY_HOSTS", ()),
+            getattr(config, "BLOCKED_HOSTS", ()),
+            getattr(config, "BLOCK_THIRD_PARTY", False),
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            return False  # never break navigations (including login/challenge frames)
+        if resource_type in self.blocked_types:
+            return True
+        host = urlparse(url).hostname or ""
+        if _host_matches(host, self.blocked_hosts):
+            return True
+        return self.block_third_party and not _host_matches(host, self.first_party_hosts)
+
+
+class NetworkStats:
+    """Per-run transfer and page-load figures, reported so runs with and without blocking can be compared."""
+
+    def __init__(self, blocking_enabled: bool):
+        self.blocking_enabled = blocking_enabled
+        self.requests = 0
+        self.blocked = 0
+        self.bytes = 0
+        self.page_loads: List[float] = []
+
+    async def on_request_finished(self, request) -> None:
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        self.requests += 1
+        self.bytes += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+
+    def summary(self) -> str:
+        avg_load = sum(self.page_loads) / len(self.page_loads) if self.page_loads else 0.0
+        mode = "on" if self.blocking_enabled else "off"
+        return (
+            f"📊 Network (blocking {mode}): {self.requests} requests, {self.blocked} blocked, "
+            f"{self.bytes / 1_048_576:.1f} MB transferred, {len(self.page_loads)} page loads "
+            f"averaging {avg_load:.2f}s"
+        )
+
+
+class DomainPacer:
+    """
+    Per-domain pacing shared by all tabs: each navigation to a domain is given the
+    next free slot, at least min_interval (plus random jitter) after the previous one.
+    Tabs wait for their slot concurrently, so the delay budget is spread across tabs
+    instead of being paid serially by each of them.
+    """
+
+    def __init__(self, min_interval: float, jitter: Tuple[float, float] = (0.0, 0.0)):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_slot: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str) -> None:
+        domain = urlparse(url).netloc
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, now))
+            self._next_slot[domain] = slot + self.min_interval + random.uniform(*self.jitter)
+        await asyncio.sleep(slot - now)
+
+
+class PagePool:
+    """
+    A fixed set of reusable tabs in one browser context, handed out through an asyncio queue.
+    With max_navigations set, a tab is closed and replaced after that many uses to cap
+    renderer memory growth.
+    """
+
+    def __init__(self, context: BrowserContext, size: int, max_navigations: Optional[int] = None):
+        self.context = context
+        self.size = max(1, size)
+        self.max_navigations = max_navigations
+        self.recycled = 0
+        self._pages: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[Page, int] = {}
+
+    async def start(self) -> "PagePool":
+        for _ in range(self.size):
+            await self._pages.put(await self._new_page())
+        return self
+
+    async def _new_page(self) -> Page:
+        page = await self.context.new_page()
+        self._uses[page] = 0
+        return page
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a tab for one navigation; waits while all tabs are busy."""
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
+            self._uses[page] += 1
+            if self.max_navigations and self._uses[page] >= self.max_navigations:
+                page = await self._recycle(page)
+            self._pages.put_nowait(page)
+
+    async def _recycle(self, page: Page) -> Page:
+        del self._uses[page]
+        try:
+            await page.close()
+        except Exception as e:
+            print(f"⚠️ Error closing recycled tab: {e}")
+        self.recycled += 1
+        return await self._new_page()
+
+    async def close(self) -> None:
+        while not self._pages.empty():
+            page = self._pages.get_nowait()
+            self._uses.pop(page, None)
+            await page.close()
+
+
 class ScraperHelpers:
     """Helper class containing utility methods for LinkedIn scraping"""
     
     def __init__(self, config: Config):
         self.config = config
-        self.ua = UserAgent()
+        self.ua = None  # fake_useragent is loaded on first use only
         self.current_proxy_index = 0
+        self.network_stats: Optional[NetworkStats] = None
 
     def get_random_user_agent(self) -> str:
         """Get a random user agent string"""
+        if self.ua is None:
+            from fake_useragent import UserAgent
+            self.ua = UserAgent()
         return self.ua.random if self.config.USE_RANDOM_USER_AGENTS else self.ua.chrome
 
     def get_next_proxy(self) -> Optional[str]:
@@ -40,6 +193,56 @@ class ScraperHelpers:
             min_delay, max_delay = self.config.DELAY_BETWEEN_REQUESTS
         await asyncio.sleep(random.uniform(min_delay, max_delay))
 
+    async def jitter(self):
+        """Small random pause from the Config.ACTION_JITTER budget, layered on top of readiness waits"""
+        low, high = getattr(self.config, "ACTION_JITTER", (0.0, 0.0))
+        if high > 0:
+            await asyncio.sleep(random.uniform(low, high))
+
+    async def wait_for_stable_count(
+        self,
+        surface,
+        selector: str,
+        timeout: float = 10.0,
+        poll_interval: float = 0.25,
+        stable_polls: int = 3,
+    ) -> int:
+        """Poll how many elements match selector until it stops changing (or timeout); returns the count"""
+        deadline = time.monotonic() + timeout
+        last, stable = -1, 0
+        while True:
+            count = await surface.evaluate("(s) => document.querySelectorAll(s).length", selector)
+            stable = stable + 1 if count == last else 0
+            last = count
+            if stable >= stable_polls or time.monotonic() >= deadline:
+                return count
+            await asyncio.sleep(poll_interval)
+
+    async def wait_until_ready(
+        self,
+        surface,
+        selector: Optional[str] = None,
+        network_idle: bool = False,
+        stable_selector: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Wait on real readiness signals instead of a fixed sleep, then add jitter:
+        selector attached, network idle (best effort) and/or a stable element count.
+        Returns the stabilized count when stable_selector is given.
+        """
+        if selector:
+            await surface.wait_for_selector(selector, state="attached", timeout=self.config.READY_TIMEOUT_MS)
+        if network_idle:
+            try:
+                await surface.wait_for_load_state("networkidle", timeout=self.config.NETWORK_IDLE_TIMEOUT_MS)
+            except PWTimeout:
+                pass  # long-polling pages never go fully idle; the other signals still apply
+        count = None
+        if stable_selector:
+            count = await self.wait_for_stable_count(surface, stable_selector)
+        await self.jitter()
+        return count
+
     async def simulate_human_behavior(self, page: Page):
         """Simulate human-like mouse movements and scrolling"""
         viewport = page.viewport_size
@@ -58,7 +261,7 @@ class ScraperHelpers:
         context = await playwright.chromium.launch_persistent_context(
             user_data_dir=user_data_dir,
             headless=self.config.HEADLESS,
-            slow_mo=500,
+            slow_mo=self.config.SLOW_MO_MS,
             channel="chrome",
             args=[
                 "--no-sandbox",
@@ -76,8 +279,39 @@ class ScraperHelpers:
             Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
             Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
         """)
+        await self.install_network_policy(context)
         return context
 
+    async def install_network_policy(self, context: BrowserContext) -> NetworkStats:
+        """Route every request through the configured ResourcePolicy and start collecting NetworkStats"""
+        policy = ResourcePolicy.from_config(self.config)
+        stats = NetworkStats(blocking_enabled=policy is not None)
+        if policy is not None:
+            async def handle(route):
+                request = route.request
+                if policy.should_block(request.resource_type, request.url):
+                    stats.blocked += 1
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route("**/*", handle)
+        context.on("requestfinished", stats.on_request_finished)
+        self.network_stats = stats
+        return stats
+
+    async def goto(self, page: Page, url: str, **kwargs):
+        """page.goto that records the page-load time in the run's NetworkStats"""
+        start = time.monotonic()
+        response = await page.goto(url, **kwargs)
+        if self.network_stats is not None:
+            self.network_stats.page_loads.append(time.monotonic() - start)
+        return response
+
+    def report_network_stats(self) -> None:
+        if self.network_stats is not None:
+            print(self.network_stats.summary())
+
     def is_within_time_limit(self, job_date_str: str) -> bool:
         """Check if a job posting is within the specified time limit"""
         try:
@@ -98,6 +332,11 @@ class ScraperHelpers:
         """Extract job ID from LinkedIn job URL"""
         return url.split("/")[-2]
 
+    def job_id_from_href(self, href: Optional[str]) -> Optional[str]:
+        """Job ID from a job card link (/jobs/view/<id>/ or ...?currentJobId=<id>), if present"""
+        match = re.search(r"/jobs/view/(\d+)|currentJobId=(\d+)", href or "")
+        return (match.group(1) or match.group(2)) if match else None
+
     def has_french_words(self, text: str) -> bool:
         """Check if text contains at least 2 common French words"""
         if not text:
@@ -0,0 +1,65 @@
+"""
+Persistent index of LinkedIn job_ids that have already been scraped.
+
+Replaces re-reading every linkedin_jobs/*.json batch on each run. Legacy batch
+files are imported once (tracked per file name), and each new batch is added
+incrementally when it is saved, so startup cost no longer grows with history.
+"""
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable
+
+SEEN_INDEX_FILENAME = "seen_jobs.sqlite3"
+
+
+class SeenJobIndex:
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_jobs (job_id TEXT PRIMARY KEY, first_seen REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS indexed_batches (file_name TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+    def __contains__(self, job_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM seen_jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+    def add_many(self, job_ids: Iterable[str], batch_file: str = None) -> None:
+        """Record job_ids (and the batch file they came from) in one transaction."""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_jobs (job_id, first_seen) VALUES (?, ?)",
+                [(str(job_id), now) for job_id in job_ids if job_id],
+            )
+            if batch_file:
+                self._conn.execute("INSERT OR IGNORE INTO indexed_batches (file_name) VALUES (?)", (batch_file,))
+
+    def sync_batch_files(self, directory: Path) -> int:
+        """Import batch files that are not in the index yet; returns how many were imported."""
+        directory = Path(directory)
+        if not directory.exists():
+            return 0
+        indexed = {row[0] for row in self._conn.execute("SELECT file_name FROM indexed_batches")}
+        imported = 0
+        for path in sorted(directory.glob("*.json")):
+            if path.name in indexed:
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                jobs = json.load(f)
+            self.add_many((job.get("job_id") for job in jobs), batch_file=path.name)
+            imported += 1
+        if imported:
+            print(f"🗂️ Indexed {imported} existing batch file(s) into {self.db_path.name}")
+        return imported
+
+    def close(self) -> None:
+        self._conn.close()
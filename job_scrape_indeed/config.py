@@ -30,6 +30,41 @@ class Config:
     DELAY_BETWEEN_PAGES = (3, 6)
     DELAY_BETWEEN_REQUESTS = DELAY_BETWEEN_ACTIONS
 
+    # Adaptive waits: result pages wait for a stable card count, then add a small jitter
+    ACTION_JITTER = (0.3, 1.0)
+    READY_TIMEOUT_MS = 20_000
+    NETWORK_IDLE_TIMEOUT_MS = 5_000
+
+    # Job descriptions are fetched concurrently in a pool of reusable tabs; each tab is
+    # replaced after TAB_MAX_NAVIGATIONS descriptions to cap renderer memory growth
+    DETAIL_TABS = int(os.getenv("INDEED_DETAIL_TABS", "3"))
+    TAB_MAX_NAVIGATIONS = int(os.getenv("INDEED_TAB_MAX_NAVIGATIONS", "25"))
+    # Per-domain pacing shared by all tabs: minimum seconds between detail navigations plus jitter
+    DOMAIN_MIN_INTERVAL = DELAY_BETWEEN_ACTIONS[0]
+    DOMAIN_JITTER = (0.0, DELAY_BETWEEN_ACTIONS[1] - DELAY_BETWEEN_ACTIONS[0])
+
+    # Keyword × location searches run concurrently in up to SEARCH_TABS tabs (1 = one at a time);
+    # search starts are spaced by SEARCH_MIN_INTERVAL seconds plus jitter
+    SEARCH_TABS = int(os.getenv("INDEED_SEARCH_TABS", "2"))
+    SEARCH_MIN_INTERVAL = DELAY_BETWEEN_PAGES[0]
+    SEARCH_JITTER = (0.0, DELAY_BETWEEN_PAGES[1] - DELAY_BETWEEN_PAGES[0])
+    RESULTS_PER_PAGE = 15  # Indeed typically shows 15 results per page
+
+    # Network interception: the scraper only needs DOM text, so these are never downloaded
+    BLOCK_RESOURCES = os.getenv("INDEED_BLOCK_RESOURCES", "1") != "0"
+    BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+    BLOCKED_HOSTS = [
+        "doubleclick.net",
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googlesyndication.com",
+        "facebook.net",
+        "bing.com",
+    ]
+    # Optionally block everything not served by the site itself (may break login challenges)
+    FIRST_PARTY_HOSTS = ["indeed.com"]
+    BLOCK_THIRD_PARTY = os.getenv("INDEED_BLOCK_THIRD_PARTY", "0") == "1"
+
     BLACKLIST_COMPANIES = [
         "Adecco",
         "Randstad",
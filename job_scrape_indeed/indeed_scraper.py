@@ -6,27 +6,57 @@ Indeed Job Scraper
 - Filters by blacklist and optional heuristics
 - Stores results under job_scrape_indeed/indeed_jobs/
 """
+import argparse
 import asyncio
-import json
-import random
-from datetime import datetime, timedelta, timezone
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse, parse_qs, quote_plus
 
-from playwright.async_api import BrowserContext, Page, async_playwright, TimeoutError as PWTimeout
+from playwright.async_api import Page, TimeoutError as PWTimeout
 
-from job_scrape.scraper_helpers import ScraperHelpers
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# The job_scrape modules use flat imports (from config import Config)
+if str(PROJECT_ROOT / "job_scrape") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from base_scraper import BaseJobScraper, SourceAdapter
+from checkpoint import ScrapeCheckpoint
+from scraper_helpers import ScraperHelpers
+from seen_jobs import SeenJobIndex
+from job_store.store import JobStore
 from job_scrape_indeed.config import Config
 
+OUTPUT_DIR = Path(__file__).resolve().parent / Config.OUTPUT_DIR
+ANALYSIS_JOBS_PATH = PROJECT_ROOT / "job_fit_analysis" / "indeed_jobs.json"
+
+CARD_SELECTOR = ".job_seen_beacon"
+DESCRIPTION_SELECTOR = "#jobDescriptionText, .jobsearch-jobDescriptionText"
+
+# Reads every card on the results page in a single protocol round trip
+EXTRACT_CARDS_JS = """
+(selectors) => Array.from(document.querySelectorAll(selectors.card)).map((el) => {
+    const text = (selector) => {
+        const node = el.querySelector(selector);
+        return node ? node.innerText.trim() : null;
+    };
+    const link = el.querySelector(selectors.link);
+    return {
+        jk: link ? link.getAttribute('data-jk') : null,
+        href: link ? link.getAttribute('href') : null,
+        title: text(selectors.title),
+        company: text(selectors.company),
+        location: text(selectors.location),
+        easyApply: Array.from(el.querySelectorAll('span')).some((span) => span.textContent.includes('Easily apply')),
+    };
+})
+"""
+
 
-class IndeedJobScraper:
-    def __init__(self) -> None:
-        self.config = Config()
-        self.helpers = ScraperHelpers(self.config)
-        self.jobs_data: List[Dict] = []
-        self.project_root = Path(__file__).resolve().parent
-        self.output_dir = self.project_root / self.config.OUTPUT_DIR
+class IndeedAdapter(SourceAdapter):
+    """Indeed results pages addressed by URL; descriptions are read from each job's own page"""
+
+    name = "indeed"
 
     # ------------------------- Utility methods -------------------------
 
@@ -50,190 +80,101 @@ class IndeedJobScraper:
         # fallback: last segment
         return parsed.path.split("/")[-1] or None
 
-    async def fetch_job_description(self, context: BrowserContext, job_url: str) -> str:
-        detail_page = await context.new_page()
-        try:
-            await detail_page.goto(job_url, wait_until="domcontentloaded", timeout=30_000)
-            await self.helpers.human_like_delay(*self.config.DELAY_BETWEEN_ACTIONS)
-            description_el = await detail_page.query_selector("#jobDescriptionText, .jobsearch-jobDescriptionText")
-            if description_el:
-                return (await description_el.inner_text()).strip()
-        except PWTimeout:
-            print(f"⚠️ Timeout fetching description for {job_url}")
-        except Exception as exc:
-            print(f"⚠️ Error fetching description for {job_url}: {exc}")
-        finally:
-            await detail_page.close()
-        return ""
-
-    async def extract_job_cards(
-        self,
-        context: BrowserContext,
-        page: Page,
-        keyword: str,
-        location: str,
-        max_results: int,
-    ) -> List[Dict]:
-        collected: List[Dict] = []
-        start = 0
-        results_per_page = 15  # Indeed typically shows 15 results per page
-
-        while start < max_results:
-            search_url = self.build_search_url(keyword, location, start=start)
+    def title_blacklisted(self, title: str) -> bool:
+        return any(keyword.lower() in title.lower() for keyword in self.config.TITLE_KEYWORDS_BLACKLIST)
+
+    # ------------------------- Result pages -------------------------
+
+    async def result_pages(self, page: Page, keyword: str, location: str, max_pages: int, first_page: int = 1):
+        results_per_page = self.config.RESULTS_PER_PAGE
+        for page_number in range(first_page, max_pages + 1):
+            search_url = self.build_search_url(keyword, location, start=(page_number - 1) * results_per_page)
             print(f"🔍 Visiting search URL: {search_url}")
-            await page.goto(search_url, wait_until="domcontentloaded")
-            await self.helpers.human_like_delay(*self.config.DELAY_BETWEEN_PAGES)
+            await self.helpers.goto(page, search_url, wait_until="domcontentloaded")
 
-            # Wait for job cards to load
+            # Wait for job cards to load and stop changing
             try:
-                await page.wait_for_selector("ul.jobsearch-ResultsList, .job_seen_beacon", timeout=20_000)
+                await self.helpers.wait_until_ready(
+                    page, f"ul.jobsearch-ResultsList, {CARD_SELECTOR}", stable_selector=CARD_SELECTOR
+                )
             except PWTimeout:
                 print("⚠️ No results container found – moving to next keyword.")
-                break
-
-            job_cards = await page.query_selector_all(".job_seen_beacon")
-            if not job_cards:
+                return
+
+            raw_cards = await page.evaluate(EXTRACT_CARDS_JS, {
+                "card": CARD_SELECTOR,
+                "link": "a[data-jk], h2.jobTitle a, a",
+                "title": "h2.jobTitle span",
+                "company": ".companyName",
+                "location": ".companyLocation",
+            })
+            if not raw_cards:
                 print("⚠️ No job cards found on this page.")
-                break
-
-            for card in job_cards:
-                if len(collected) >= max_results:
-                    break
-
-                try:
-                    title_el = await card.query_selector("h2.jobTitle span")
-                    company_el = await card.query_selector(".companyName")
-                    location_el = await card.query_selector(".companyLocation")
-                    easy_apply_el = await card.query_selector("span:has-text('Easily apply')")
-                    link_el = await card.query_selector("a")
-
-                    title = (await title_el.inner_text()).strip() if title_el else "N/A"
-                    company = (await company_el.inner_text()).strip() if company_el else "N/A"
-                    location_text = (await location_el.inner_text()).strip() if location_el else "N/A"
-
-                    if company in self.config.BLACKLIST_COMPANIES:
-                        print(f"⏩ Skipping {title} at {company} – company blacklist")
-                        continue
-
-                    if any(keyword.lower() in title.lower() for keyword in self.config.TITLE_KEYWORDS_BLACKLIST):
-                        print(f"⏩ Skipping {title} – title blacklist")
-                        continue
-
-                    if not link_el:
-                        continue
-
-                    partial_href = await link_el.get_attribute("href")
-                    if not partial_href:
-                        continue
-
-                    job_url = urljoin(self.config.BASE_URL, partial_href)
-                    job_id = self.extract_job_id(job_url)
-                    if not job_id:
-                        print(f"⚠️ Could not determine job ID for {job_url}, skipping.")
-                        continue
-
-                    description = await self.fetch_job_description(context, job_url)
-                    if not description:
-                        print(f"⚠️ Empty description for {job_url}, skipping.")
-                        continue
-
-                    if self.helpers.has_french_words(description):
-                        print(f"⏩ Skipping {title} – French description detected.")
-                        continue
-
-                    job_data = {
-                        "title": title,
-                        "company": company,
-                        "location": location_text,
-                        "job_id": job_id,
-                        "url": job_url,
-                        "description": description,
-                        "easy_apply": bool(easy_apply_el),
-                        "posted_date": datetime.now(timezone.utc).isoformat(),
-                        "scraped_at": datetime.now(timezone.utc).isoformat(),
-                    }
-
-                    collected.append(job_data)
-                    print(f"✅ Scraped: {title} | {company}")
-                    await self.helpers.human_like_delay(*self.config.DELAY_BETWEEN_ACTIONS)
-                except Exception as exc:
-                    print(f"⚠️ Failed to process job card: {exc}")
-                    continue
-
-            if len(job_cards) < results_per_page:
-                # no more pages
-                break
-            start += results_per_page
-
-        return collected
-
-    # ------------------------- Workflow methods -------------------------
-
-    async def search_jobs(
-        self,
-        context: BrowserContext,
-        keyword: str,
-        location: str,
-        max_pages: int,
-    ) -> List[Dict]:
-        max_results = max_pages * 15
-        page = await context.new_page()
-        try:
-            return await self.extract_job_cards(context, page, keyword, location, max_results)
-        finally:
-            await page.close()
-
-    async def run_scraper(self) -> None:
-        async with async_playwright() as playwright:
-            browser = await playwright.chromium.launch(headless=self.config.HEADLESS)
-            context = await browser.new_context()
-
-            try:
-                for keyword, max_pages in self.config.KEYWORDS.items():
-                    for location in self.config.LOCATIONS:
-                        print("=" * 80)
-                        print(f"🔍 Searching: {keyword} | {location}")
-                        jobs = await self.search_jobs(context, keyword, location, max_pages)
-                        self.jobs_data.extend(jobs)
-                        await self.helpers.human_like_delay(*self.config.DELAY_BETWEEN_PAGES)
-            finally:
-                await context.close()
-                await browser.close()
-
-        await self.save_results()
-
-    # ------------------------- Persistence -------------------------
-
-    async def save_results(self) -> None:
-        if not self.jobs_data:
-            print("⚠️ No jobs scraped; nothing to save.")
-            return
-
-        unique = {}
-        for job in self.jobs_data:
-            unique[job["job_id"]] = job
+                return
 
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.output_dir / f"indeed_jobs_batch_{timestamp}.json"
+            yield page_number, page, self.cards_from_raw(raw_cards)
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(list(unique.values()), f, ensure_ascii=False, indent=2)
-
-        print(f"✅ Saved {len(unique)} unique jobs to {filename}")
-
-        # Copy the latest batch to job_fit_analysis for downstream processing
-        analysis_target = self.project_root.parent / "job_fit_analysis" / "indeed_jobs.json"
-        with open(analysis_target, "w", encoding="utf-8") as f:
-            json.dump(list(unique.values()), f, ensure_ascii=False, indent=2)
-        print(f"📁 Copied results to {analysis_target}")
+            if len(raw_cards) < results_per_page:
+                # no more pages
+                return
+
+    def cards_from_raw(self, raw_cards: List[Dict]) -> List[Dict]:
+        cards = []
+        for raw in raw_cards:
+            if not raw.get("href"):
+                continue
+            job_url = urljoin(self.config.BASE_URL, raw["href"])
+            job_id = raw.get("jk") or self.extract_job_id(job_url)
+            if not job_id:
+                print(f"⚠️ Could not determine job ID for {job_url}, skipping.")
+                continue
+            cards.append({
+                "job_id": job_id,
+                "title": raw.get("title") or "N/A",
+                "company": raw.get("company") or "N/A",
+                "location": raw.get("location") or "N/A",
+                "url": job_url,
+                "easy_apply": bool(raw.get("easyApply")),
+            })
+        return cards
+
+    # ------------------------- Job details -------------------------
+
+    async def open_detail(self, page: Page, card: Dict):
+        await self.helpers.goto(page, card["url"], wait_until="domcontentloaded", timeout=30_000)
+
+    async def read_detail(self, page: Page, card: Dict) -> Optional[Dict]:
+        description_el = await page.query_selector(DESCRIPTION_SELECTOR)
+        description = (await description_el.inner_text()).strip() if description_el else ""
+        if not description:
+            print(f"⚠️ Empty description for {card['url']}, skipping.")
+            return None
+        return {"description": description}
+
+
+class IndeedJobScraper(BaseJobScraper):
+    def __init__(self, resume: bool = False, seen_index: Optional[SeenJobIndex] = None,
+                 checkpoint: Optional[ScrapeCheckpoint] = None, job_store: Optional[JobStore] = None) -> None:
+        config = Config()
+        super().__init__(
+            IndeedAdapter(config, ScraperHelpers(config)),
+            output_dir=OUTPUT_DIR,
+            batch_prefix="indeed_jobs_batch",
+            analysis_jobs_path=ANALYSIS_JOBS_PATH,
+            seen_index=seen_index,
+            resume=resume,
+            checkpoint=checkpoint,
+            job_store=job_store,
+        )
 
 
 async def main():
-    scraper = IndeedJobScraper()
+    parser = argparse.ArgumentParser(description="Scrape Indeed job postings")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted run from its checkpoint")
+    args = parser.parse_args()
+    scraper = IndeedJobScraper(resume=args.resume)
     await scraper.run_scraper()
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
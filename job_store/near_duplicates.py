@@ -0,0 +1,167 @@
+"""
+MinHash / LSH near-duplicate detection over job descriptions.
+
+Each description is reduced to a MinHash signature of its hashed word shingles, whose
+positions agree between two descriptions with probability equal to their Jaccard
+similarity. Signatures are split into LSH bands and every band is stored as a bucket in
+SQLite, so a new posting is only compared with the earlier postings that share at least
+one bucket instead of the whole history. Staffing-agency reposts of a role under a new
+ID (or company name) land in the same buckets and are reported as near-duplicates.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+SHINGLE_SIZE = 5
+# Descriptions with fewer shingles (under ~7 words) are too short to call near-duplicates
+MIN_SHINGLES = 3
+NUM_PERM = 128
+# 32 bands of 4 rows: pairs above ~0.5 similarity almost always share a bucket,
+# the estimated similarity then decides whether they are near-duplicates
+BANDS = 32
+NEAR_DUPLICATE_SIMILARITY = float(os.getenv("JOB_STORE_NEAR_DUPLICATE_SIMILARITY", "0.85"))
+
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32, so a * x + b fits in uint64
+_SEED = 1
+
+
+def description_shingles(description: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed word k-shingles of the description, ignoring case, punctuation and digits"""
+    words = re.sub(r"[\W\d_]+", " ", (description or "").lower()).split()
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) for i in range(len(words) - size + 1)}
+
+
+class NearDuplicateIndex:
+    def __init__(self, db_path: Path, threshold: float = NEAR_DUPLICATE_SIMILARITY,
+                 num_perm: int = NUM_PERM, bands: int = BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        # The same seed on every run keeps stored signatures comparable
+        rng = np.random.default_rng(_SEED)
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS minhash_signatures ("
+            "doc_id TEXT PRIMARY KEY, signature BLOB NOT NULL, added_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS minhash_bands ("
+            "band INTEGER NOT NULL, bucket INTEGER NOT NULL, doc_id TEXT NOT NULL, "
+            "PRIMARY KEY (band, bucket, doc_id)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def __contains__(self, doc_id: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM minhash_signatures WHERE doc_id = ?", (str(doc_id),)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0]
+
+    def doc_ids(self) -> Set[str]:
+        return {row[0] for row in self._conn.execute("SELECT doc_id FROM minhash_signatures")}
+
+    def signature(self, description: str) -> Optional[np.ndarray]:
+        """MinHash signature of the description (None when it is too short to compare)"""
+        shingles = description_shingles(description)
+        if len(shingles) < MIN_SHINGLES:
+            return None
+        x = np.fromiter(shingles, dtype=np.uint64, count=len(shingles)) % _PRIME
+        hashes = (np.outer(x, self._a) + self._b) % _PRIME
+        return hashes.min(axis=0).astype(np.uint32)
+
+    def band_buckets(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        return [
+            (band, zlib.crc32(signature[band * self.rows:(band + 1) * self.rows].tobytes()))
+            for band in range(self.bands)
+        ]
+
+    def candidates(self, signature: np.ndarray) -> List[str]:
+        """Stored documents sharing at least one LSH bucket with the signature"""
+        buckets = self.band_buckets(signature)
+        placeholders = ", ".join("(?, ?)" for _ in buckets)
+        rows = self._conn.execute(
+            f"SELECT DISTINCT doc_id FROM minhash_bands WHERE (band, bucket) IN (VALUES {placeholders})",
+            [value for bucket in buckets for value in bucket],
+        )
+        return [row[0] for row in rows]
+
+    def similar(self, description: str, threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Stored documents whose estimated similarity reaches the threshold, most similar first"""
+        signature = self.signature(description)
+        if signature is None:
+            return []
+        return self._similar(signature, self.threshold if threshold is None else threshold)
+
+    def _similar(self, signature: np.ndarray, threshold: float) -> List[Tuple[str, float]]:
+        candidates = self.candidates(signature)
+        if not candidates:
+            return []
+        matches = []
+        placeholders = ", ".join("?" for _ in candidates)
+        rows = self._conn.execute(
+            f"SELECT doc_id, signature FROM minhash_signatures WHERE doc_id IN ({placeholders})", candidates
+        )
+        for doc_id, blob in rows:
+            similarity = float(np.mean(np.frombuffer(blob, dtype=np.uint32) == signature))
+            if similarity >= threshold:
+                matches.append((doc_id, similarity))
+        return sorted(matches, key=lambda match: -match[1])
+
+    def find(self, description: str) -> Optional[str]:
+        """The stored document this description is a near-duplicate of, if any"""
+        matches = self.similar(description)
+        return matches[0][0] if matches else None
+
+    def add(self, doc_id: str, description: str) -> bool:
+        """Index a document; returns False when the description has nothing to index"""
+        signature = self.signature(description)
+        if signature is None:
+            return False
+        self._add(str(doc_id), signature)
+        return True
+
+    def _add(self, doc_id: str, signature: np.ndarray) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO minhash_signatures (doc_id, signature, added_at) VALUES (?, ?, ?)",
+                (doc_id, signature.tobytes(), time.time()),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO minhash_bands (band, bucket, doc_id) VALUES (?, ?, ?)",
+                [(band, bucket, doc_id) for band, bucket in self.band_buckets(signature)],
+            )
+
+    def check_and_add(self, doc_id: str, description: str) -> Optional[str]:
+        """Return the earlier near-duplicate of the description, or index it as a new document"""
+        signature = self.signature(description)
+        if signature is None:
+            return None
+        matches = self._similar(signature, self.threshold)
+        if matches:
+            return matches[0][0]
+        self._add(str(doc_id), signature)
+        return None
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,257 @@
+"""
+Unified job store shared by every scraper source.
+
+Jobs from all sources land in one SQLite database (WAL) with an FTS5 index over title,
+company and description. A new posting is first compared with earlier ones that have the
+same normalized company + title; when their description shingles overlap enough it is
+kept only as a duplicate of the earlier row. Otherwise the MinHash/LSH index catches
+reposts of a role under another company name or title. Either way each unique role is
+cleaned, scored and applied to once. The fit analyzer reads the pending (unique, not yet
+analyzed) jobs.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from job_store.near_duplicates import NEAR_DUPLICATE_SIMILARITY, NearDuplicateIndex, description_shingles
+
+DEFAULT_STORE_PATH = Path(__file__).resolve().parent / "jobs.sqlite3"
+STORE_PATH = os.getenv("JOB_STORE_PATH", str(DEFAULT_STORE_PATH))
+# Jaccard similarity of description shingles from which two postings of the same
+# company + title are treated as the same role
+DUPLICATE_SIMILARITY = float(os.getenv("JOB_STORE_DUPLICATE_SIMILARITY", "0.8"))
+
+PENDING = "pending"
+ANALYZED = "analyzed"
+
+_COMPANY_SUFFIXES = re.compile(r"\b(inc|incorporated|ltd|limited|llc|corp|corporation|co|plc|gmbh)\b")
+
+
+def normalize_company(company: str) -> str:
+    text = re.sub(r"[^\w\s]", " ", (company or "").lower())
+    return " ".join(_COMPANY_SUFFIXES.sub(" ", text).split())
+
+
+def normalize_title(title: str) -> str:
+    # "(Remote)", "[Contract]" and similar decorations do not make a different role
+    text = re.sub(r"\(.*?\)|\[.*?\]", " ", (title or "").lower())
+    return " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+
+def dedup_key(company: str, title: str) -> str:
+    return f"{normalize_company(company)}|{normalize_title(title)}"
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class JobStore:
+    def __init__(self, db_path: Path = STORE_PATH, duplicate_similarity: float = DUPLICATE_SIMILARITY,
+                 near_duplicate_similarity: float = NEAR_DUPLICATE_SIMILARITY):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.duplicate_similarity = duplicate_similarity
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                title TEXT NOT NULL DEFAULT '',
+                company TEXT NOT NULL DEFAULT '',
+                description TEXT NOT NULL DEFAULT '',
+                cleaned_description TEXT,
+                data TEXT NOT NULL,
+                dedup_key TEXT NOT NULL,
+                duplicate_of INTEGER REFERENCES jobs (id),
+                status TEXT NOT NULL DEFAULT 'pending',
+                added_at REAL NOT NULL,
+                UNIQUE (source, job_id)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_dedup_key ON jobs (dedup_key)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, duplicate_of)")
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+            "title, company, description, content='jobs', content_rowid='id')"
+        )
+        # One-time migrations that have already run on this database
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+        # MinHash/LSH index of the unique postings, keyed by str(jobs.id), in the same database file
+        self.near_duplicates = NearDuplicateIndex(self.db_path, near_duplicate_similarity)
+        self._index_unique_jobs()
+
+    def _index_unique_jobs(self) -> None:
+        """
+        Add unique postings stored before the near-duplicate index existed. Runs once per
+        database: add_job indexes every later posting, so the flag in `meta` skips the scan.
+        """
+        if self._conn.execute("SELECT 1 FROM meta WHERE key = 'near_duplicates_indexed'").fetchone():
+            return
+        # Only postings without a signature yet, so an interrupted backfill resumes where it stopped
+        rows = self._conn.execute(
+            "SELECT jobs.id, jobs.description FROM jobs "
+            "LEFT JOIN minhash_signatures ON minhash_signatures.doc_id = CAST(jobs.id AS TEXT) "
+            "WHERE jobs.duplicate_of IS NULL AND minhash_signatures.doc_id IS NULL"
+        ).fetchall()
+        for row_id, description in rows:
+            self.near_duplicates.add(str(row_id), description)
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('near_duplicates_indexed', '1')")
+
+    def add_job(self, job: Dict, source: str) -> Optional[int]:
+        """Store a scraped job; returns the id of the earlier posting it duplicates (None if it is new)"""
+        job_id = str(job["job_id"])
+        existing = self._conn.execute(
+            "SELECT id, duplicate_of FROM jobs WHERE source = ? AND job_id = ?", (source, job_id)
+        ).fetchone()
+        if existing:
+            return existing[1]
+
+        title, company = job.get("title", ""), job.get("company", "")
+        description = job.get("description", "")
+        key = dedup_key(company, title)
+        duplicate_of = self.find_duplicate(key, description)
+        if duplicate_of is None:
+            near_duplicate = self.near_duplicates.find(description)
+            duplicate_of = int(near_duplicate) if near_duplicate is not None else None
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (source, job_id, title, company, description, cleaned_description, data, "
+                "dedup_key, duplicate_of, added_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (source, job_id, title, company, description, job.get("cleaned_description"),
+                 json.dumps(job, ensure_ascii=False), key, duplicate_of, time.time()),
+            )
+            self._conn.execute(
+                "INSERT INTO jobs_fts (rowid, title, company, description) VALUES (?, ?, ?, ?)",
+                (cursor.lastrowid, title, company, description),
+            )
+        if duplicate_of is None:
+            self.near_duplicates.add(str(cursor.lastrowid), description)
+        return duplicate_of
+
+    def find_duplicate(self, key: str, description: str) -> Optional[int]:
+        """Earliest unique posting with the same company + title whose description matches"""
+        shingles = description_shingles(description)
+        rows = self._conn.execute(
+            "SELECT id, description FROM jobs WHERE dedup_key = ? AND duplicate_of IS NULL ORDER BY id", (key,)
+        )
+        for row_id, other in rows:
+            # Without a description on either side the company + title match has to do
+            if not shingles or not other.strip():
+                return row_id
+            if jaccard(shingles, description_shingles(other)) >= self.duplicate_similarity:
+                return row_id
+        return None
+
+    def pending_jobs(self) -> List[Dict]:
+        """Unique jobs that have not been analyzed yet, oldest first, tagged with their store_id"""
+        jobs = []
+        rows = self._conn.execute(
+            "SELECT id, data, cleaned_description FROM jobs WHERE status = ? AND duplicate_of IS NULL ORDER BY id",
+            (PENDING,),
+        )
+        for row_id, data, cleaned in rows:
+            job = json.loads(data)
+            job["store_id"] = row_id
+            if cleaned:
+                job["cleaned_description"] = cleaned
+            jobs.append(job)
+        return jobs
+
+    def unique_job_texts(self) -> List[Dict]:
+        """Title and descriptions of every unique posting, e.g. as a reference corpus for TF-IDF"""
+        rows = self._conn.execute(
+            "SELECT title, description, cleaned_description FROM jobs WHERE duplicate_of IS NULL ORDER BY id"
+        )
+        return [
+            {"title": title, "description": description, "cleaned_description": cleaned}
+            for title, description, cleaned in rows
+        ]
+
+    def set_cleaned_descriptions(self, jobs: Iterable[Dict]) -> None:
+        """Save cleaned descriptions of jobs (from pending_jobs, or streamed with their source)"""
+        by_id, by_source = [], []
+        for job in jobs:
+            if not job.get("cleaned_description"):
+                continue
+            if job.get("store_id"):
+                by_id.append((job["cleaned_description"], job["store_id"]))
+            elif job.get("source"):
+                by_source.append((job["cleaned_description"], job["source"], str(job["job_id"])))
+        with self._conn:
+            self._conn.executemany("UPDATE jobs SET cleaned_description = ? WHERE id = ?", by_id)
+            self._conn.executemany(
+                "UPDATE jobs SET cleaned_description = ? WHERE source = ? AND job_id = ?", by_source
+            )
+
+    def mark_analyzed(self, jobs: Iterable[Dict]) -> None:
+        """Mark jobs (from pending_jobs, or streamed with their source) as analyzed"""
+        by_id, by_source = [], []
+        for job in jobs:
+            if job.get("store_id"):
+                by_id.append((ANALYZED, job["store_id"]))
+            elif job.get("source"):
+                by_source.append((ANALYZED, job["source"], str(job["job_id"])))
+        with self._conn:
+            self._conn.executemany("UPDATE jobs SET status = ? WHERE id = ?", by_id)
+            self._conn.executemany("UPDATE jobs SET status = ? WHERE source = ? AND job_id = ?", by_source)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """Full-text search over title, company and description, best matches first"""
+        rows = self._conn.execute(
+            "SELECT jobs.id, jobs.source, jobs.title, jobs.company, jobs.status, jobs.duplicate_of "
+            "FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid WHERE jobs_fts MATCH ? ORDER BY rank LIMIT ?",
+            (query, limit),
+        ).fetchall()
+        keys = ("store_id", "source", "title", "company", "status", "duplicate_of")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        total, duplicates, pending = self._conn.execute(
+            "SELECT COUNT(*), COUNT(duplicate_of), "
+            "SUM(CASE WHEN status = ? AND duplicate_of IS NULL THEN 1 ELSE 0 END) FROM jobs",
+            (PENDING,),
+        ).fetchone()
+        return {"jobs": total, "duplicates": duplicates, "pending": pending or 0}
+
+    def close(self) -> None:
+        self.near_duplicates.close()
+        self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the unified job store")
+    parser.add_argument("--store", default=STORE_PATH)
+    parser.add_argument("query", nargs="?", help="full-text search query (omit for store statistics)")
+    args = parser.parse_args()
+
+    store = JobStore(args.store)
+    try:
+        if args.query:
+            for row in store.search(args.query):
+                duplicate = f" (duplicate of #{row['duplicate_of']})" if row["duplicate_of"] else ""
+                print(f"#{row['store_id']} [{row['source']}] {row['title']} at {row['company']} - {row['status']}{duplicate}")
+        else:
+            stats = store.stats()
+            print(f"🗄️ {stats['jobs']} jobs, {stats['duplicates']} cross-posting duplicates, {stats['pending']} pending analysis")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,24 +3,50 @@
 Main Job Automation Orchestrator
 This script runs the complete job automation workflow:
 1. Run job scraper
-2. Run job fit analysis
-3. Process each good-scoring job sequentially
-4. Copy job data to job_description.txt
-5. Run test.py for each job
+2. Batch-clean the scraped job descriptions
+3. Run job fit analysis
+4. Process good-scoring jobs in a pool of workers
+5. Copy each job's data to its own job_description.txt
+6. Run test.py for each job
+
+Stages run as library calls inside this process by default, so LLM clients,
+caches and the applied-jobs tracker are loaded once per run, and scraped jobs
+are streamed straight into JD cleaning and fit analysis. Set
+JOB_AUTOMATION_MODE=subprocess to run every stage in its own interpreter.
 """
 
 import os
+import re
 import sys
 import json
+import shutil
 import subprocess
 import asyncio
+import importlib.util
+import time
 from datetime import datetime
 from pathlib import Path
 
+# Number of applications built concurrently (each in its own working directory)
+DEFAULT_MAX_WORKERS = int(os.getenv("JOB_AUTOMATION_WORKERS", "3"))
+# "inprocess" calls each stage as a library function; "subprocess" isolates every stage
+EXECUTION_MODE = os.getenv("JOB_AUTOMATION_MODE", "inprocess")
+
+class StreamInterrupted(Exception):
+    """The streaming stages failed after jobs were already streamed, scored and saved"""
+
+
 class JobAutomationOrchestrator:
-    def __init__(self):
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, mode=EXECUTION_MODE):
         self.project_root = Path(__file__).parent.resolve()
+        self.in_process = mode != "subprocess"
+        self._analyzer = None
+        self._application_builder = None
         self.job_description_path = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/job_description.txt"
+        self.additional_info_path = os.path.join(os.path.dirname(self.job_description_path), "additional_info.txt")
+        self.runs_dir = self.project_root / "application_runs"
+        self.max_workers = max(1, max_workers)
+        self.scraped_jobs_path = self.project_root / "job_fit_analysis" / "linkedin_jobs.json"
         self.good_jobs_path = self.project_root / "job_fit_analysis" / "good_score_jobs.json"
         venv_dir = self.project_root / "venv"
         if sys.platform.startswith("win"):
@@ -33,13 +59,14 @@ class JobAutomationOrchestrator:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] {message}")
         
-    def run_subprocess(self, command, cwd=None, description=""):
+    def run_subprocess(self, command, cwd=None, description="", env=None):
         """Run a subprocess and handle errors"""
         self.log(f"Starting: {description}")
         try:
             result = subprocess.run(
                 command,
                 cwd=cwd,
+                env=env,
                 shell=True,
                 check=True,
                 capture_output=True,
@@ -61,11 +88,119 @@ class JobAutomationOrchestrator:
             self.log(f"❌ Unexpected error in {description}: {e}")
             raise
     
+    # ---------------------------------------------------
+    #  In-process stages (shared clients, caches and tracker)
+    # ---------------------------------------------------
+    def get_analyzer(self):
+        """One JobFitAnalyzer per orchestrator, so its cache and tracker are loaded once"""
+        if self._analyzer is None:
+            from job_fit_analysis.job_fit_analyzer import JobFitAnalyzer
+            self._analyzer = JobFitAnalyzer()
+        return self._analyzer
+
+    def get_application_builder(self):
+        """Import test.py once; it cannot be imported as `test`, which is a stdlib package"""
+        if self._application_builder is None:
+            spec = importlib.util.spec_from_file_location("application_builder", self.project_root / "test.py")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._application_builder = module
+        return self._application_builder
+
+    async def run_streaming_stages(self):
+        """
+        Scrape, clean and score concurrently: every job flows scraper -> JD cleaning ->
+        fit analysis through asyncio queues as soon as its description is extracted.
+        """
+        self.log("=" * 60)
+        self.log("STEPS 1-2: Scraping, cleaning and analyzing jobs as a stream")
+        self.log("=" * 60)
+        # The scraper package uses flat imports (from config import Config)
+        scrape_dir = str(self.project_root / "job_scrape")
+        if scrape_dir not in sys.path:
+            sys.path.insert(0, scrape_dir)
+        from linkedin_scraper import LinkedInJobScraper
+        from job_description_cleaner.jd_cleaning import clean_job_stream
+        from job_fit_analysis.job_fit_analyzer import run_stream_analysis
+        from job_store.store import JobStore
+
+        scraped_jobs, cleaned_jobs = asyncio.Queue(), asyncio.Queue()
+        scraper = LinkedInJobScraper(job_queue=scraped_jobs)
+        # Streamed jobs are marked analyzed so a later store-based analysis does not score them again
+        store = JobStore()
+        try:
+            # The scraper always ends the stream with None, so every stage drains and stops
+            # before the store is closed, even when one of them failed
+            results = await asyncio.gather(
+                scraper.run_scraper(),
+                clean_job_stream(scraped_jobs, cleaned_jobs, store=store),
+                run_stream_analysis(
+                    self.get_analyzer(), cleaned_jobs, output_path=str(self.good_jobs_path), store=store
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            store.close()
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            streamed = len(scraper.published_job_ids)
+            if streamed:
+                raise StreamInterrupted(f"stream failed after {streamed} jobs: {errors[0]}") from errors[0]
+            raise errors[0]
+        self.log("✅ Completed: streaming scrape and analysis")
+
+    def build_application_in_process(self, job_index, total_jobs, company, title, easy_apply, jd_source_path,
+                                     folder_suffix=None):
+        self.log(f"STEP 4: Building application in-process (Job {job_index + 1}/{total_jobs})")
+        folder_created = self.get_application_builder().build_application(
+            self.process_title_or_company_name(company),
+            self.process_title_or_company_name(title),
+            "fullstack",
+            "true" if easy_apply else "false",
+            jd_source_path,
+            defer_export=True,
+            folder_suffix=folder_suffix,
+        )
+        if not folder_created:
+            raise RuntimeError("Application folder was not created")
+
+    def build_application(self, job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix=None):
+        """Build in-process when enabled, falling back to a test.py subprocess if that fails"""
+        if self.in_process:
+            try:
+                self.build_application_in_process(
+                    job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix
+                )
+                return
+            except Exception as e:
+                self.log(f"⚠️ In-process build failed ({e}); retrying with test.py in a subprocess")
+        self.run_test_script(job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix)
+
+    def sync_application_journal(self):
+        """Export the journal in-process when enabled, falling back to a subprocess if that fails"""
+        if self.in_process:
+            try:
+                self.export_application_journal_in_process()
+                return
+            except Exception as e:
+                self.log(f"⚠️ In-process journal export failed ({e}); retrying in a subprocess")
+        self.export_application_journal()
+
+    def export_application_journal_in_process(self):
+        from job_fit_analysis.application_journal import ApplicationJournal, journal_path_for
+        from job_fit_analysis.applied_tracker import DEFAULT_SHEET_NAME, DEFAULT_TRACKER_PATH
+        excel_path = os.getenv("JOB_TRACKER_PATH", str(DEFAULT_TRACKER_PATH))
+        journal = ApplicationJournal(journal_path_for(excel_path))
+        try:
+            journal.export_to_excel(excel_path, os.getenv("JOB_TRACKER_SHEET", DEFAULT_SHEET_NAME))
+        finally:
+            journal.close()
+
     # ---------------------------------------------------
     #  STEP 1: Job Scraper
     # ---------------------------------------------------
-    def run_scraper(self):
-        """Run the LinkedIn job scraper"""
+    def run_scraper(self, resume=False):
+        """Run the LinkedIn job scraper (resume=True continues an interrupted scrape from its checkpoint)"""
         self.log("=" * 60)
         self.log("STEP 1: Running LinkedIn Job Scraper")
         self.log("=" * 60)
@@ -78,17 +213,38 @@ class JobAutomationOrchestrator:
             raise FileNotFoundError(f"Root virtual environment Python not found: {self.root_python}")
             
         command = f"\"{self.root_python}\" \"{scraper_path}\""
+        if resume:
+            command += " --resume"
         self.run_subprocess(
             command, 
             cwd=str(scraper_path.parent),
             description="Running LinkedIn Job Scraper"
         )
 
+    # ---------------------------------------------------
+    #  STEP 1b: Batch JD cleaning
+    # ---------------------------------------------------
+    def run_jd_cleaning(self):
+        """Clean the pending job descriptions of the job store once, right after scraping"""
+        self.log("=" * 60)
+        self.log("STEP 1b: Cleaning Scraped Job Descriptions")
+        self.log("=" * 60)
+
+        if not self.root_python.exists():
+            raise FileNotFoundError(f"Root virtual environment Python not found: {self.root_python}")
+
+        command = f"\"{self.root_python}\" -m job_description_cleaner.jd_cleaning --store"
+        self.run_subprocess(
+            command,
+            cwd=str(self.project_root),
+            description="Cleaning job descriptions"
+        )
+
     # ---------------------------------------------------
     #  STEP 2: Job Fit Analyzer
     # ---------------------------------------------------
-    def run_analyzer(self):
-        """Run the job fit analyzer"""
+    def run_analyzer(self, merge=False):
+        """Run the job fit analyzer (merge=True keeps the good matches already saved this run)"""
         self.log("=" * 60)
         self.log("STEP 2: Running Job Fit Analyzer")
         self.log("=" * 60)
@@ -101,6 +257,8 @@ class JobAutomationOrchestrator:
             raise FileNotFoundError(f"Root virtual environment Python not found: {self.root_python}")
             
         command = f"\"{self.root_python}\" \"{analyzer_path}\""
+        if merge:
+            command += " --merge"
         
         # Run analyzer in project root so relative paths (./job_scrape/...) resolve correctly
         self.run_subprocess(
@@ -123,8 +281,8 @@ class JobAutomationOrchestrator:
         self.log(f"Loaded {len(jobs)} good-scoring jobs from {self.good_jobs_path}")
         return jobs
         
-    def write_job_description(self, job_data):
-        """Write job data to the job_description.txt file"""
+    def write_job_description(self, job_data, job_description_path):
+        """Write job data to a job_description.txt file"""
         company = job_data['job'].get('company', 'Unknown Company')
         title = job_data['job'].get('title', 'Unknown Title')
         description = job_data['job'].get('description', 'No description available')
@@ -138,18 +296,61 @@ DESCRIPTION:
 ---
 {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 """
-        with open(self.job_description_path, 'w', encoding='utf-8') as f:
+        with open(job_description_path, 'w', encoding='utf-8') as f:
             f.write(content)
+
+        # Precomputed cleaned JD lets the resume customizer skip its own cleaning call
+        cleaned_description = job_data['job'].get('cleaned_description')
+        if cleaned_description:
+            cleaned_path = os.path.join(os.path.dirname(job_description_path), "cleaned_job_description.txt")
+            with open(cleaned_path, 'w', encoding='utf-8') as f:
+                f.write(cleaned_description)
             
-        self.log(f"✅ Written job data to {self.job_description_path}")
+        self.log(f"✅ Written job data to {job_description_path}")
         self.log(f"   Company: {company}")
         self.log(f"   Title: {title}")
+
+    def prepare_job_workdir(self, run_dir, job_index, job_data):
+        """Create an isolated working directory with this job's JD input; returns the JD path"""
+        company = job_data['job'].get('company', 'Unknown')
+        title = job_data['job'].get('title', 'Unknown')
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", f"{company}_{title}").strip("_")[:60]
+        workdir = run_dir / f"{job_index + 1:03d}_{slug}"
+        workdir.mkdir(parents=True, exist_ok=True)
+
+        job_description_path = str(workdir / "job_description.txt")
+        self.write_job_description(job_data, job_description_path)
+
+        # Carry over the additional_info.txt taken for this run (see take_additional_info)
+        run_additional_info = run_dir / "additional_info.txt"
+        if run_additional_info.exists():
+            shutil.copy(run_additional_info, workdir / "additional_info.txt")
+        return job_description_path
+
+    def take_additional_info(self, run_dir):
+        """
+        Move the manually provided additional_info.txt into the run directory and clear the
+        shared file, so it is attached to this run's jobs only and never leaks into a later run
+        """
+        if not os.path.exists(self.additional_info_path) or os.path.getsize(self.additional_info_path) == 0:
+            return None
+        run_dir.mkdir(parents=True, exist_ok=True)
+        run_additional_info = run_dir / "additional_info.txt"
+        shutil.copy(self.additional_info_path, run_additional_info)
+        open(self.additional_info_path, "w").close()
+        self.log(f"📎 Archived additional_info.txt to {run_additional_info}")
+        return run_additional_info
+
+    def job_folder_suffix(self, job_index, job_data):
+        """Keeps the output folder unique when two jobs share a company and position"""
+        job_id = re.sub(r"[^A-Za-z0-9]+", "", str(job_data['job'].get('job_id') or ""))
+        return job_id or f"{job_index + 1:03d}"
     
     def process_title_or_company_name(self, name):
         """Replace invalid characters in title/company name"""
         return name.replace("/", "_")
         
-    def run_test_script(self, job_index, total_jobs, company, title, easy_apply):
+    def run_test_script(self, job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix=None):
         """Run the test.py script"""
         self.log("=" * 60)
         self.log(f"STEP 4: Running test.py (Job {job_index + 1}/{total_jobs})")
@@ -166,15 +367,60 @@ DESCRIPTION:
         title = self.process_title_or_company_name(title)
         easy_apply = "true" if easy_apply else "false"
         
-        command = f"\"{self.root_python}\" test.py \"{company}\" \"{title}\" \"fullstack\" \"{easy_apply}\""
+        command = f"\"{self.root_python}\" test.py \"{company}\" \"{title}\" \"fullstack\" \"{easy_apply}\" \"{jd_source_path}\""
+        if folder_suffix:
+            command += f" \"{folder_suffix}\""
+        # Applications go to the journal only; export_application_journal syncs the workbook once per run
+        env = {**os.environ, "JOB_TRACKER_DEFER_EXPORT": "1"}
         self.run_subprocess(
             command, 
             cwd=str(test_path.parent),
-            description="Running test.py"
+            description="Running test.py",
+            env=env
+        )
+
+    def export_application_journal(self):
+        """Sync all journaled applications into the Job Tracker workbook in one batch"""
+        command = f"\"{self.root_python}\" -m job_fit_analysis.application_journal"
+        self.run_subprocess(
+            command,
+            cwd=str(self.project_root),
+            description="Exporting application journal to Job Tracker"
         )
         
+    def process_job(self, job_index, total_jobs, job_data, run_dir):
+        """Build one application end to end; never raises, returns a result record"""
+        company = job_data['job'].get('company', 'Unknown')
+        title = job_data['job'].get('title', 'Unknown')
+        easy_apply = job_data['job'].get('easy_apply', False)
+        started = time.monotonic()
+
+        self.log(f"PROCESSING JOB {job_index + 1}/{total_jobs}: {title} at {company}")
+        try:
+            # Step 1: Write job description into this job's own working directory
+            jd_source_path = self.prepare_job_workdir(run_dir, job_index, job_data)
+            folder_suffix = self.job_folder_suffix(job_index, job_data)
+
+            # Step 2: Build the application (test.py)
+            self.build_application(job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix)
+
+            self.log(f"✅ Completed processing job {job_index + 1}/{total_jobs}")
+            status, error = "success", None
+        except Exception as e:
+            self.log(f"❌ Job {job_index + 1}/{total_jobs} failed: {title} at {company}: {e}")
+            status, error = "failed", str(e)
+
+        return {
+            "index": job_index + 1,
+            "company": company,
+            "title": title,
+            "status": status,
+            "error": error,
+            "duration": time.monotonic() - started,
+        }
+
     async def process_all_jobs(self):
-        """Process all good-scoring jobs sequentially"""
+        """Process all good-scoring jobs with a bounded pool of workers"""
         self.log("=" * 60)
         self.log("STEP 3: Processing Good-Scoring Jobs")
         self.log("=" * 60)
@@ -183,43 +429,80 @@ DESCRIPTION:
         
         if not jobs:
             self.log("⚠️ No good-scoring jobs found. Exiting.")
-            return
+            return []
             
-        self.log(f"Found {len(jobs)} jobs to process")
-        
-        for i, job_data in enumerate(jobs):
-            self.log("=" * 60)
-            self.log(f"PROCESSING JOB {i + 1}/{len(jobs)}")
-            self.log("=" * 60)
-            
-            company = job_data['job'].get('company', 'Unknown')
-            title = job_data['job'].get('title', 'Unknown')
-            easy_apply = job_data['job'].get('easy_apply', False)
-            
-            self.log(f"Processing: {title} at {company}")
-            
-            # Step 1: Write job description
-            self.write_job_description(job_data)
-            
-            # Step 2: Run test.py
-            self.run_test_script(i, len(jobs), company, title, easy_apply)
-            
-            self.log(f"✅ Completed processing job {i + 1}/{len(jobs)}")
+        self.log(f"Found {len(jobs)} jobs to process with {self.max_workers} worker(s)")
+        run_dir = self.runs_dir / datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.take_additional_info(run_dir)
+        semaphore = asyncio.Semaphore(self.max_workers)
+        if self.in_process:
+            # Import once up front so worker threads never race on the module import
+            try:
+                self.get_application_builder()
+            except Exception as e:
+                self.log(f"⚠️ Could not import test.py in-process ({e}); jobs will fall back to subprocesses")
+
+        async def worker(i, job_data):
+            async with semaphore:
+                return await asyncio.to_thread(self.process_job, i, len(jobs), job_data, run_dir)
+
+        try:
+            results = await asyncio.gather(*(worker(i, job_data) for i, job_data in enumerate(jobs)))
+        finally:
+            # Step 3: Sync the journal into the tracker workbook once, even after a failure
+            self.sync_application_journal()
+
+        self.report_job_results(results)
+        return results
+
+    def report_job_results(self, results):
+        """Print per-job success/failure summary"""
+        succeeded = [r for r in results if r["status"] == "success"]
+        self.log("=" * 60)
+        self.log(f"APPLICATIONS: {len(succeeded)}/{len(results)} succeeded")
+        for r in results:
+            marker = "✅" if r["status"] == "success" else "❌"
+            line = f"{marker} [{r['index']}] {r['title']} at {r['company']} ({r['duration']:.0f}s)"
+            if r["error"]:
+                line += f" - {r['error']}"
+            self.log(line)
             
     # ---------------------------------------------------
     #  MAIN WORKFLOW
     # ---------------------------------------------------
+    def run_subprocess_stages(self, resume=False):
+        """
+        Steps 1-2 with every stage in its own interpreter. resume=True picks up after an
+        interrupted streaming run: the scrape continues from its checkpoint and the new
+        good matches are merged into the ones that run already saved.
+        """
+        # Step 1: Run job scraper
+        self.run_scraper(resume=resume)
+
+        # Step 1b: Clean job descriptions once for both analyzer and customizer
+        self.run_jd_cleaning()
+
+        # Step 2: Run job fit analyzer
+        self.run_analyzer(merge=resume)
+
     async def run_complete_workflow(self):
         """Run the complete job automation workflow"""
         try:
-            self.log("🚀 Starting Job Automation Workflow")
+            self.log(f"🚀 Starting Job Automation Workflow ({'in-process' if self.in_process else 'subprocess'} mode)")
             self.log("=" * 80)
 
-            # # Step 1: Run job scraper
-            self.run_scraper()
-
-            # Step 2: Run job fit analyzer
-            self.run_analyzer()
+            if self.in_process:
+                # Steps 1-2 overlap: jobs are scored while the scrape is still running
+                try:
+                    await self.run_streaming_stages()
+                except StreamInterrupted as e:
+                    self.log(f"⚠️ In-process {e}; resuming in subprocess stages")
+                    self.run_subprocess_stages(resume=True)
+                except Exception as e:
+                    self.log(f"⚠️ In-process stages failed ({e}); falling back to subprocess stages")
+                    self.run_subprocess_stages()
+            else:
+                self.run_subprocess_stages()
 
             # Step 3: Process all good jobs
             await self.process_all_jobs()
@@ -158,10 +158,11 @@ def insert_paragraph_after(paragraph, style=None):
     paragraph._element.addnext(new_para._element)  # insert directly after
     return new_para
 
-def customize_resume_with_placeholders(template_path: str, section_files: dict, job_description: str, output_path: str, additional_info: str = None):
+def customize_resume_with_placeholders(template_path: str, section_files: dict, job_description: str, output_path: str, additional_info: str = None, cleaned_job_description: str = None):
     """
     Replace placeholders in resume template with LLM-customized content.
     section_files = {"SUMMARY": "path/to/summary.txt", ...}
+    cleaned_job_description: precomputed output of the batch JD cleaning stage, if available.
     """
     doc = Document(template_path)
 
@@ -174,8 +175,9 @@ def customize_resume_with_placeholders(template_path: str, section_files: dict,
         else:
             print(f"⚠️ Section file not found: {file_path}")
 
-    # Clean job description
-    cleaned_job_description = clean_job_description(job_description)
+    # Clean job description (unless the batch cleaning stage already did)
+    if not cleaned_job_description:
+        cleaned_job_description = clean_job_description(job_description)
 
     # Get improved sections from LLM
     improved_sections = improve_resume_json(section_texts, cleaned_job_description, additional_info)
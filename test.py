@@ -1,18 +1,24 @@
 import os
 import shutil
 import sys
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from docx import Document
-from openpyxl import Workbook, load_workbook
 
+from coverletter_customizer import customize_cover_letter
+from job_fit_analysis.application_journal import ApplicationJournal, journal_path_for, schedule_export
 from resume_customizer import customize_resume_with_placeholders
 
 import subprocess
 
 excel_log_path = "/Users/Roger/Documents/FullTime-Resume/Job Tracker.xlsx"
 
+# Serializes WPS Office GUI automation (AppleScript sessions would steal each other's windows)
+_WPS_LOCK = threading.Lock()
+
 
 def convert_docx_to_pdf(docx_path: str) -> str:
     """
@@ -40,73 +46,75 @@ def convert_docx_to_pdf(docx_path: str) -> str:
         ]
         
         wps_found = False
-        for wps_app in wps_app_paths:
-            if Path(wps_app).exists():
-                wps_found = True
-                print(f"📝 Attempting PDF conversion with WPS Office...")
-                try:
-                    # AppleScript to automate WPS Office to export to PDF
-                    # Note: WPS Office menu structure may vary - this is a simplified approach
-                    applescript = f'''
-                    tell application "WPS Office"
-                        activate
-                        open POSIX file "{docx_abs_path}"
-                    end tell
-                    delay 4
-                    tell application "System Events"
-                        tell process "WPS Office"
-                            try
-                                -- Try keyboard shortcut for export/save as PDF (Cmd+Shift+E or Cmd+P then export)
-                                -- First, try Save As dialog approach
-                                keystroke "s" using {{command down, shift down}}
-                                delay 2
-                                -- In Save As dialog, set format to PDF if possible
-                                -- This is a simplified approach - actual menu may differ
-                                keystroke return
-                                delay 2
-                            on error errMsg
-                                return "Error: " & errMsg
-                            end try
+        # WPS is driven through its GUI, so only one export may run at a time across worker threads
+        with _WPS_LOCK:
+            for wps_app in wps_app_paths:
+                if Path(wps_app).exists():
+                    wps_found = True
+                    print(f"📝 Attempting PDF conversion with WPS Office...")
+                    try:
+                        # AppleScript to automate WPS Office to export to PDF
+                        # Note: WPS Office menu structure may vary - this is a simplified approach
+                        applescript = f'''
+                        tell application "WPS Office"
+                            activate
+                            open POSIX file "{docx_abs_path}"
                         end tell
-                    end tell
-                    delay 3
-                    tell application "WPS Office"
-                        quit
-                    end tell
-                    '''
-                    
-                    result = subprocess.run(
-                        ["osascript", "-e", applescript],
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
+                        delay 4
+                        tell application "System Events"
+                            tell process "WPS Office"
+                                try
+                                    -- Try keyboard shortcut for export/save as PDF (Cmd+Shift+E or Cmd+P then export)
+                                    -- First, try Save As dialog approach
+                                    keystroke "s" using {{command down, shift down}}
+                                    delay 2
+                                    -- In Save As dialog, set format to PDF if possible
+                                    -- This is a simplified approach - actual menu may differ
+                                    keystroke return
+                                    delay 2
+                                on error errMsg
+                                    return "Error: " & errMsg
+                                end try
+                            end tell
+                        end tell
+                        delay 3
+                        tell application "WPS Office"
+                            quit
+                        end tell
+                        '''
                     
-                    # Check if PDF was created (might have a different name if Save As was used)
-                    # Look for any PDF file with similar name in the output directory
-                    if pdf_path.exists():
-                        print(f"✅ PDF exported using WPS Office: {pdf_path}")
-                        return str(pdf_path)
+                        result = subprocess.run(
+                            ["osascript", "-e", applescript],
+                            capture_output=True,
+                            text=True,
+                            timeout=30
+                        )
                     
-                    # Also check if any PDF was created in the directory
-                    pdf_files = list(output_dir.glob("*.pdf"))
-                    if pdf_files:
-                        # Find the most recent PDF that might match
-                        recent_pdf = max(pdf_files, key=lambda p: p.stat().st_mtime)
-                        if recent_pdf.stat().st_mtime > docx_path_obj.stat().st_mtime:
-                            print(f"⚠️ WPS Office created PDF but with different name: {recent_pdf}")
-                            # Rename to expected name
-                            recent_pdf.rename(pdf_path)
+                        # Check if PDF was created (might have a different name if Save As was used)
+                        # Look for any PDF file with similar name in the output directory
+                        if pdf_path.exists():
                             print(f"✅ PDF exported using WPS Office: {pdf_path}")
                             return str(pdf_path)
                     
-                    print(f"⚠️ WPS Office automation attempted but PDF not created")
-                    if result.stderr:
-                        print(f"   Error: {result.stderr}")
-                except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-                    print(f"⚠️ WPS Office conversion failed: {e}")
-                break
-        
+                        # Also check if any PDF was created in the directory
+                        pdf_files = list(output_dir.glob("*.pdf"))
+                        if pdf_files:
+                            # Find the most recent PDF that might match
+                            recent_pdf = max(pdf_files, key=lambda p: p.stat().st_mtime)
+                            if recent_pdf.stat().st_mtime > docx_path_obj.stat().st_mtime:
+                                print(f"⚠️ WPS Office created PDF but with different name: {recent_pdf}")
+                                # Rename to expected name
+                                recent_pdf.rename(pdf_path)
+                                print(f"✅ PDF exported using WPS Office: {pdf_path}")
+                                return str(pdf_path)
+                    
+                        print(f"⚠️ WPS Office automation attempted but PDF not created")
+                        if result.stderr:
+                            print(f"   Error: {result.stderr}")
+                    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
+                        print(f"⚠️ WPS Office conversion failed: {e}")
+                    break
+
         # Method 2: Try LibreOffice (most reliable command-line method)
         if not wps_found or not pdf_path.exists():
             libreoffice_paths = [
@@ -129,6 +137,8 @@ def convert_docx_to_pdf(docx_path: str) -> str:
                 cmd = [
                     libreoffice_cmd,
                     "--headless",
+                    # Per-worker profile so concurrent application workers (processes or threads) can convert in parallel
+                    f"-env:UserInstallation={Path(tempfile.gettempdir(), f'lo_profile_{os.getpid()}_{threading.get_ident()}').as_uri()}",
                     "--convert-to", "pdf",
                     "--outdir", str(output_dir),
                     str(docx_path_obj)
@@ -168,26 +178,25 @@ def convert_docx_to_pdf(docx_path: str) -> str:
         return None
 
 
-def log_application_to_excel(excel_path, sheet_name, company_name, position_name, applied_date, job_description=None):
-    if os.path.exists(excel_path):
-        wb = load_workbook(excel_path)
-        if sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-        else:
-            ws = wb.create_sheet(sheet_name)
-            ws.append(["Company", "Position", "Applied Date", "Job Description"])
-    else:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
-        ws.append(["Company", "Position", "Applied Date", "Job Description"])
-
-    # Append
-    ws.append([company_name, position_name, applied_date, job_description or ""])
-    print(f"➡️ Logging row: {company_name}, {position_name}, {applied_date}")  # debug
+def log_application_to_excel(excel_path, sheet_name, company_name, position_name, applied_date, job_description=None,
+                             defer_export=None):
+    """
+    Record the application in the append-only journal next to the tracker workbook.
+    The workbook itself is synced in one batch: when a standalone run exits, or once at
+    the end of an orchestrated run (defer_export / JOB_TRACKER_DEFER_EXPORT=1).
+    """
+    if defer_export is None:
+        defer_export = os.getenv("JOB_TRACKER_DEFER_EXPORT") == "1"
+    journal = ApplicationJournal(journal_path_for(excel_path))
+    try:
+        journal.append(company_name, position_name, applied_date, job_description)
+        print(f"➡️ Logging row: {company_name}, {position_name}, {applied_date}")  # debug
 
-    wb.save(excel_path)
-    print(f"💾 Saved to {excel_path}")
+        if not defer_export:
+            schedule_export(excel_path, sheet_name)
+            print(f"💾 {excel_path} will be updated when this run exits")
+    finally:
+        journal.close()
 
 
 def replace_placeholders_in_docx(input_path, output_path, replacements: dict):
@@ -202,18 +211,24 @@ def replace_placeholders_in_docx(input_path, output_path, replacements: dict):
     doc.save(output_path)
 
 
-def create_application_folder(company_name, position_name, position_type, resume_path, coverLetter_path, jd_source_path=None):
+def application_folder_path(resume_path, company_name, position_name, folder_suffix=None):
+    """
+    Output folder of one application. Concurrent jobs pass a folder_suffix (job ID or index)
+    so two postings with the same company and position never write into the same folder.
+    """
+    grandparent_folder = os.path.dirname(os.path.dirname(resume_path))
+    position_folder_name = f"{position_name}_{folder_suffix}" if folder_suffix else position_name
+    return os.path.join(grandparent_folder, company_name, position_folder_name)
+
+
+def create_application_folder(company_name, position_name, position_type, resume_path, coverLetter_path, jd_source_path=None,
+                              defer_export=None, folder_suffix=None):
     """
     Create an application folder for a company/position, copy resume & cover letter,
     copy job description file, and optionally customize resume with LLM.
     """
-    parent_folder = os.path.dirname(resume_path)
-    grandparent_folder = os.path.dirname(parent_folder)
-
     # Create folders
-    company_folder = os.path.join(grandparent_folder, company_name)
-    os.makedirs(company_folder, exist_ok=True)
-    position_folder = os.path.join(company_folder, position_name)
+    position_folder = application_folder_path(resume_path, company_name, position_name, folder_suffix)
     os.makedirs(position_folder, exist_ok=True)
 
     # Define filenames
@@ -241,6 +256,7 @@ def create_application_folder(company_name, position_name, position_type, resume
     # Step 2: Copy JD and read additional_info if present
     job_description = None
     additional_info = None
+    cleaned_job_description = None
 
     if jd_source_path and os.path.exists(jd_source_path):
         shutil.copy(jd_source_path, jd_target)
@@ -253,6 +269,13 @@ def create_application_folder(company_name, position_name, position_type, resume
                 additional_info = f.read()
             print("ℹ️ Loaded additional_info.txt")
 
+        cleaned_source_path = os.path.join(os.path.dirname(jd_source_path), "cleaned_job_description.txt")
+        if os.path.exists(cleaned_source_path):
+            with open(cleaned_source_path, "r") as f:
+                cleaned_job_description = f.read().strip() or None
+            if cleaned_job_description:
+                print("ℹ️ Loaded precomputed cleaned_job_description.txt")
+
     # Step 3: Customize resume
     # position type folder name such as Frontend_Sections or Frontend_Sections
     position_type_folder_name = position_type.capitalize() + "_Sections"
@@ -274,7 +297,8 @@ def create_application_folder(company_name, position_name, position_type, resume
             section_files,
             job_description,
             customized_resume_path,
-            additional_info
+            additional_info,
+            cleaned_job_description
         )
         resume_target = customized_resume_path
         
@@ -299,6 +323,7 @@ def create_application_folder(company_name, position_name, position_type, resume
         position_name=position_name,
         applied_date=today_str,
         job_description=job_description,
+        defer_export=defer_export,
     )
     print(f"📝 Logged application to {excel_log_path}")
     
@@ -314,6 +339,12 @@ def create_application_folder(company_name, position_name, position_type, resume
         if os.path.exists(addl_source_path):
             open(addl_source_path, "w").close()
             print("🧹 Cleared source additional_info.txt content")
+
+        # Clear the precomputed cleaned JD so it is never reused for another job
+        cleaned_source_path = os.path.join(os.path.dirname(jd_source_path), "cleaned_job_description.txt")
+        if os.path.exists(cleaned_source_path):
+            open(cleaned_source_path, "w").close()
+            print("🧹 Cleared source cleaned_job_description.txt content")
     except Exception as e:
         print(f"⚠️ Failed to clear source job description/additional_info: {e}")
 
@@ -329,78 +360,59 @@ def create_application_folder(company_name, position_name, position_type, resume
     return True
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 4:
-        print("Usage: python script.py <CompanyName> <PositionName> <Type>")
-        sys.exit(1)
-
-    # Resume templates
-    resume_default = "/Users/Roger/Documents/FullTime-Resume/Rong Gang Xu_Resume_v3.docx"
-    resume_frontend = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/Roger Xu_Frontend_Resume_Placeholder.docx"
-    resume_fullstack = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/Roger Xu_Fullstack_Resume_Placeholder.docx"
-    resume_sharepoint = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/Roger Xu_SharePoint_Resume.docx"
-    coverLetter = "/Users/Roger/Documents/FullTime-Resume/Roger Xu_coverletter.docx"
+# Resume templates
+resume_default = "/Users/Roger/Documents/FullTime-Resume/Rong Gang Xu_Resume_v3.docx"
+resume_frontend = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/Roger Xu_Frontend_Resume_Placeholder.docx"
+resume_fullstack = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/Roger Xu_Fullstack_Resume_Placeholder.docx"
+resume_sharepoint = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/Roger Xu_SharePoint_Resume.docx"
+coverLetter = "/Users/Roger/Documents/FullTime-Resume/Roger Xu_coverletter.docx"
 
-    jd_source_path = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/job_description.txt"
+default_jd_source_path = "/Users/Roger/Documents/FullTime-Resume/Resume Template - One Page/job_description.txt"
 
-    # CLI args
-    company = sys.argv[1].strip()
-    position = sys.argv[2].strip()
-    position_type = sys.argv[3]
-    
-    # easy_apply default is true
-    if len(sys.argv) < 5:
-        easy_apply = "true"
-    else:
-        easy_apply = sys.argv[4].strip().lower()
+resume_by_type = {
+    "default": resume_default,
+    "frontend": resume_frontend,
+    "fullstack": resume_fullstack,
+    "sharepoint": resume_sharepoint,
+}
 
-    if position_type == "default":
-        resume = resume_default
-    elif position_type == "frontend":
-        resume = resume_frontend
-    elif position_type == "fullstack":
-        resume = resume_fullstack
-    elif position_type == "sharepoint":
-        resume = resume_sharepoint
-    else:
-        print("Invalid position type. Use 'default', 'frontend', 'fullstack', or 'sharepoint'.")
-        sys.exit(1)
 
-    folder_created = create_application_folder(company, position, position_type, resume, coverLetter, jd_source_path)
+def build_application(company, position, position_type, easy_apply="true", jd_source_path=None, defer_export=None,
+                      folder_suffix=None):
+    """
+    Build the full application (resume, cover letter, PDFs, tracker entry) for one job.
+    Importable so the orchestrator can run it in-process instead of spawning this script.
+    """
+    resume = resume_by_type.get(position_type)
+    if resume is None:
+        raise ValueError("Invalid position type. Use 'default', 'frontend', 'fullstack', or 'sharepoint'.")
+    jd_source_path = jd_source_path or default_jd_source_path
+
+    folder_created = create_application_folder(
+        company, position, position_type, resume, coverLetter, jd_source_path, defer_export=defer_export,
+        folder_suffix=folder_suffix,
+    )
 
     # Reconstruct the cover letter path
-    parent_folder = os.path.dirname(resume)
-    grandparent_folder = os.path.dirname(parent_folder)
-    company_folder = os.path.join(grandparent_folder, company)
-    position_folder = os.path.join(company_folder, position)
+    position_folder = application_folder_path(resume, company, position, folder_suffix)
     cover_filename = f"Roger Xu_{company}_CoverLetter_Template.docx"
     cover_target = os.path.join(position_folder, cover_filename)
 
     # If not easy apply, run coverletter customizer
     if easy_apply == "false" and folder_created:
         print("🔄 Running coverletter customizer...")
-        import subprocess
-        coverletter_script = "/Users/Roger/Documents/PersonalProject/Job Automation/coverletter_customizer.py"
         try:
-            subprocess.run(f"python3 \"{coverletter_script}\"", shell=True, check=True)
+            customize_cover_letter(cover_target)
             print("✅ Cover letter customized successfully")
-            
-            # Export cover letter as PDF (after customization)
-            # The coverletter_customizer.py saves the customized cover letter,
-            # which replaces "_Template.docx" with ".docx"
+        except Exception as e:
+            print(f"❌ Failed to customize cover letter: {e}")
+            # Fall back to exporting the template version
             print("📄 Exporting cover letter to PDF...")
             try:
-                customized_cover_path = cover_target.replace("_Template.docx", ".docx")
-                if os.path.exists(customized_cover_path):
-                    convert_docx_to_pdf(customized_cover_path)
-                else:
-                    # Fallback to template version if customized version doesn't exist
-                    convert_docx_to_pdf(cover_target)
+                convert_docx_to_pdf(cover_target)
             except Exception as e:
                 print(f"⚠️ PDF export failed (non-critical): {e}")
                 print("   Cover letter DOCX file is still available for manual PDF export.")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to customize cover letter: {e}")
     elif folder_created:
         # Export cover letter as PDF even if not customized (for easy_apply cases)
         print("📄 Exporting cover letter to PDF...")
@@ -408,4 +420,32 @@ if __name__ == "__main__":
             convert_docx_to_pdf(cover_target)
         except Exception as e:
             print(f"⚠️ PDF export failed (non-critical): {e}")
-            print("   Cover letter DOCX file is still available for manual PDF export.")
\ No newline at end of file
+    return folder_created
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Usage: python script.py <CompanyName> <PositionName> <Type> [EasyApply] [JobDescriptionPath] [FolderSuffix]")
+        sys.exit(1)
+
+    # CLI args
+    company = sys.argv[1].strip()
+    position = sys.argv[2].strip()
+    position_type = sys.argv[3]
+
+    # easy_apply default is true
+    if len(sys.argv) < 5:
+        easy_apply = "true"
+    else:
+        easy_apply = sys.argv[4].strip().lower()
+
+    # Optional isolated JD input (one working directory per job when running workers in parallel)
+    jd_source_path = sys.argv[5] if len(sys.argv) >= 6 else default_jd_source_path
+    # Optional suffix that keeps the output folder of each orchestrated job unique
+    folder_suffix = sys.argv[6] if len(sys.argv) >= 7 else None
+
+    try:
+        build_application(company, position, position_type, easy_apply, jd_source_path, folder_suffix=folder_suffix)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
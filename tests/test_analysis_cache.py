@@ -0,0 +1,66 @@
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import job_fit_analysis.analysis_cache as analysis_cache
+from job_fit_analysis.analysis_cache import AnalysisCache, make_cache_key
+from job_fit_analysis.job_fit_analyzer import JobFitAnalyzer
+
+
+def test_cache_key_changes_with_any_input():
+    base = make_cache_key("resume", "description", "1", "model")
+    assert base == make_cache_key("resume", "description", "1", "model")
+    assert base != make_cache_key("resume v2", "description", "1", "model")
+    assert base != make_cache_key("resume", "description", "2", "model")
+    assert base != make_cache_key("resume", "description", "1", "other-model")
+
+
+def test_ttl_and_size_eviction(tmp_path):
+    cache = AnalysisCache(tmp_path / "cache.sqlite3", ttl_days=1, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"matchScore": 1})
+        time.sleep(0.01)
+    cache.get("a")  # refresh "a" so "b" becomes least recently used
+    cache.evict()
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"matchScore": 1}
+
+    cache.ttl_seconds = 0
+    assert cache.get("a") is None
+    cache.evict()
+    assert len(cache) == 0
+
+
+def test_cache_stays_bounded_while_it_is_written(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis_cache, "EVICT_EVERY", 5)
+    cache = AnalysisCache(tmp_path / "cache.sqlite3", max_entries=3)
+    for i in range(12):
+        cache.set(str(i), {"matchScore": i})
+    assert len(cache) <= 3 + 5
+    cache.set("last", {"matchScore": 0})
+    cache.close()
+
+    reopened = AnalysisCache(tmp_path / "cache.sqlite3", max_entries=100)
+    assert len(reopened) == 3  # close() evicted down to max_entries
+    reopened.close()
+
+
+def test_analyzer_returns_cached_analysis_without_api_call(tmp_path):
+    cache = AnalysisCache(tmp_path / "cache.sqlite3")
+    analyzer = JobFitAnalyzer(api_key="test-key", cache=cache)
+    job = {"title": "Developer", "company": "Acme", "description": "Build React apps"}
+    cache.set(analyzer.get_cache_key("resume", job), {"matchScore": 82, "summary": "cached"})
+
+    class FailingModel:
+        def generate_content(self, prompt):
+            raise AssertionError("API should not be called on a cache hit")
+
+    analyzer.model = FailingModel()
+    result = analyzer.analyze_job_fit("resume", job)
+    assert result["status"] == "success"
+    assert result["matchScore"] == 82
+    assert result["analysis"]["summary"] == "cached"
@@ -0,0 +1,121 @@
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from job_fit_analysis.applied_tracker import AppliedTracker, TrackerEntry
+
+DESCRIPTION = "Build React and Node.js services on AWS with PostgreSQL, write tests and review code."
+
+
+def make_tracker(extra_rows: int = 0) -> AppliedTracker:
+    entries = [
+        TrackerEntry("acme", "software developer", DESCRIPTION, datetime.now()),
+        TrackerEntry("globex", "qa automation developer", "", datetime.now()),
+    ]
+    entries += [
+        TrackerEntry(f"company {i % 2000}", f"developer {i}", DESCRIPTION, datetime.now())
+        for i in range(extra_rows)
+    ]
+    return AppliedTracker(entries=entries)
+
+
+def test_exact_match_uses_description_similarity():
+    tracker = make_tracker()
+    assert tracker.is_applied("Acme", "Software Developer", job_description=DESCRIPTION)
+    assert not tracker.is_applied("Acme", "Software Developer", job_description="Wrong job description")
+    assert tracker.is_applied("Globex", "QA Automation Developer", job_description="anything")
+
+
+def test_near_duplicate_title_requires_matching_description():
+    tracker = make_tracker()
+    assert tracker.is_applied("Acme", "Software Developer (Hybrid)", job_description=DESCRIPTION)
+    assert not tracker.is_applied("Acme", "Software Developer (Hybrid)", job_description="Wrong job description")
+    assert not tracker.is_applied("Acme", "Software Developer (Hybrid)")
+    assert not tracker.is_applied("Initech", "Software Developer", job_description=DESCRIPTION)
+
+
+def test_lookups_stay_fast_on_large_tracker():
+    tracker = make_tracker(extra_rows=50_000)
+    start = time.perf_counter()
+    for _ in range(200):
+        tracker.is_applied("Acme", "Software Developer (Hybrid)", job_description=DESCRIPTION)
+        tracker.is_applied("Unknown Co", "Developer 5", job_description=DESCRIPTION)
+    per_lookup = (time.perf_counter() - start) / 400
+    assert per_lookup < 0.001
+
+
+def test_snapshot_is_reused_until_workbook_changes(tmp_path, monkeypatch):
+    from openpyxl import Workbook
+
+    workbook_path = tmp_path / "Job Tracker.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Job Tracker"
+    ws.append(["Company", "Position", "Applied Date", "Job Description"])
+    ws.append(["Acme", "Software Developer", datetime.now().strftime("%B %d, %Y"), DESCRIPTION * 20])
+    wb.save(workbook_path)
+
+    first = AppliedTracker(workbook_path)
+    assert first.snapshot_path.exists()
+    assert len(first.entries[0].description) == 800
+
+    def fail_if_parsed(self):
+        raise AssertionError("workbook should be served from the snapshot")
+
+    monkeypatch.setattr(AppliedTracker, "_read_workbook_rows", fail_if_parsed)
+    second = AppliedTracker(workbook_path)
+    assert second.is_applied("Acme", "Software Developer", job_description=DESCRIPTION * 20)
+
+    monkeypatch.undo()
+    ws.append(["Globex", "QA Developer", datetime.now().strftime("%B %d, %Y"), ""])
+    wb.save(workbook_path)
+    assert len(AppliedTracker(workbook_path).entries) == 2
+
+
+def test_journaled_application_is_seen_before_export(tmp_path):
+    from openpyxl import load_workbook
+
+    from job_fit_analysis.application_journal import ApplicationJournal, journal_path_for
+
+    workbook_path = tmp_path / "Job Tracker.xlsx"
+    journal = ApplicationJournal(journal_path_for(workbook_path))
+    journal.append("Acme", "Software Developer", datetime.now().strftime("%B %d, %Y"), DESCRIPTION)
+
+    tracker = AppliedTracker(workbook_path)
+    assert tracker.is_applied("Acme", "Software Developer", job_description=DESCRIPTION)
+    assert not workbook_path.exists()
+
+    assert journal.export_to_excel(workbook_path, "Job Tracker") == 1
+    assert journal.export_to_excel(workbook_path, "Job Tracker") == 0
+    rows = list(load_workbook(workbook_path)["Job Tracker"].iter_rows(values_only=True))
+    assert rows[0] == ("Company", "Position", "Applied Date", "Job Description")
+    assert rows[1][:2] == ("Acme", "Software Developer")
+    journal.close()
+
+
+def test_standalone_applications_are_exported_once_per_process(tmp_path):
+    import importlib.util
+
+    from openpyxl import load_workbook
+
+    from job_fit_analysis.application_journal import flush_exports
+
+    spec = importlib.util.spec_from_file_location("application_builder", PROJECT_ROOT / "test.py")
+    application_builder = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(application_builder)
+
+    workbook_path = tmp_path / "Job Tracker.xlsx"
+    for position in ("Software Developer", "QA Engineer"):
+        application_builder.log_application_to_excel(
+            workbook_path, "Job Tracker", "Acme", position, "January 01, 2026", DESCRIPTION, defer_export=False
+        )
+    assert not workbook_path.exists()  # nothing is rewritten per application
+
+    assert flush_exports() == 2
+    assert flush_exports() == 0
+    rows = list(load_workbook(workbook_path)["Job Tracker"].iter_rows(values_only=True))
+    assert [row[1] for row in rows[1:]] == ["Software Developer", "QA Engineer"]
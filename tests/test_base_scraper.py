@@ -0,0 +1,108 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from base_scraper import BaseJobScraper, SourceAdapter
+from checkpoint import ScrapeCheckpoint
+from config import Config
+from scraper_helpers import ScraperHelpers
+from seen_jobs import SeenJobIndex
+from job_store.store import JobStore
+
+FRENCH = "Nous cherchons un développeur pour travailler avec notre équipe dans Montréal"
+
+
+class FakeAdapter(SourceAdapter):
+    """Two result pages of cards whose details are read inline"""
+
+    name = "fake"
+    inline_details = True
+
+    def __init__(self, config, helpers, pages):
+        super().__init__(config, helpers)
+        self.pages = pages
+        self.opened = []
+
+    async def result_pages(self, page, keyword, location, max_pages, first_page=1):
+        for number in range(first_page, min(max_pages, len(self.pages)) + 1):
+            yield number, page, self.pages[number - 1]
+
+    async def open_detail(self, page, card):
+        raise AssertionError("inline sources do not open detail tabs")
+
+    async def show_inline_detail(self, surface, card):
+        self.opened.append(card["job_id"])
+
+    async def read_detail(self, page, card):
+        return {"description": card["description"]}
+
+
+def card(job_id, title="Software Developer", company="Shopify", description="Build APIs in Python"):
+    return {
+        "job_id": job_id, "title": title, "company": company, "location": "Toronto, ON",
+        "url": f"https://jobs.example.com/{job_id}", "description": description,
+    }
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    config = Config()
+    config.BLACKLIST_COMPANIES = ["Jerry"]
+    config.TITLE_KEYWORDS_BLACKLIST = ["Intern"]
+    config.ACTION_JITTER = (0.0, 0.0)
+    adapter = FakeAdapter(config, ScraperHelpers(config), pages=[
+        [card("1"), card("2", company="Jerry"), card("3", title="Developer Intern")],
+        [card("4", description=FRENCH), card("1"), card("5")],
+    ])
+    index = SeenJobIndex(tmp_path / "seen_jobs.sqlite3")
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.sqlite3")
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    yield BaseJobScraper(adapter, tmp_path, "fake_jobs_batch", seen_index=index, checkpoint=checkpoint, job_store=store)
+    index.close()
+    checkpoint.close()
+    store.close()
+
+
+def test_engine_filters_cards_reads_details_and_checkpoints_pages(scraper):
+    scraper.seen_index.add_many(["5"])
+
+    jobs = asyncio.run(scraper.search_jobs(object(), "developer", "Toronto", max_pages=2))
+
+    assert [job["job_id"] for job in jobs] == ["1"]
+    # blacklisted, already seen (this run or an earlier one) cards never open a detail view
+    assert scraper.adapter.opened == ["1", "4"]
+    assert set(jobs[0]) == {
+        "source", "title", "company", "location", "job_id", "url", "description", "easy_apply", "posted_date",
+        "scraped_at",
+    }
+    assert scraper.checkpoint.finished_pages("developer", "Toronto") == {1, 2}
+    assert scraper.checkpoint.is_done("developer", "Toronto")
+
+
+def test_engine_drops_roles_already_stored_by_another_source(scraper):
+    scraper.job_store.add_job(
+        {"job_id": "li-9", "title": "Software Developer (Remote)", "company": "Shopify Inc.",
+         "description": "Build APIs in Python"},
+        source="linkedin",
+    )
+
+    jobs = asyncio.run(scraper.search_jobs(object(), "developer", "Toronto", max_pages=1))
+
+    assert jobs == []
+    assert "1" in scraper.seen_index
+    assert scraper.job_store.stats() == {"jobs": 2, "duplicates": 1, "pending": 1}
+
+
+def test_engine_writes_one_deduplicated_batch(scraper, tmp_path):
+    scraper.jobs_data = [scraper.build_job(card("1"), {"description": "A"}), scraper.build_job(card("1"), {"description": "B"})]
+
+    asyncio.run(scraper.save_results())
+
+    batches = list(tmp_path.glob("fake_jobs_batch_*.json"))
+    assert len(batches) == 1
+    assert "1" in scraper.seen_index
@@ -0,0 +1,122 @@
+import asyncio
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import job_description_cleaner.jd_cleaning as jd_cleaning
+from job_description_cleaner.jd_cleaning import CleanedDescriptionCache, clean_jobs, description_fingerprint
+from job_store.store import JobStore
+
+
+def test_fingerprint_ignores_formatting_but_keeps_numbers():
+    base = description_fingerprint("React developer, 3+ years. Salary $90,000.")
+    assert base == description_fingerprint("  react DEVELOPER -- 3+ years;\nsalary $90 000 ")
+    assert base != description_fingerprint("React developer, 5+ years. Salary $90,000.")
+    assert base != description_fingerprint("React developer, 3+ years. Salary $120,000.")
+
+
+def test_clean_jobs_dedups_descriptions_and_reuses_the_cache(tmp_path, monkeypatch):
+    calls = []
+
+    async def fake_agenerate_many(prompts, LLM_name="GEMINI", max_concurrency=1):
+        calls.append(len(prompts))
+        return [f"cleaned #{len(calls)}.{i}" for i in range(len(prompts))]
+
+    monkeypatch.setattr(jd_cleaning, "agenerate_many", fake_agenerate_many)
+    jobs = [
+        {"description": "Build APIs in Python. 3 years."},
+        {"description": "build apis in python -- 3 years"},
+        {"description": "Build APIs in Python. 7 years."},
+        {"description": "   "},
+    ]
+
+    with CleanedDescriptionCache(tmp_path / "jd_cache.sqlite3") as cache:
+        stats = asyncio.run(clean_jobs(jobs, cache=cache))
+        assert calls == [2]
+        assert stats["unique_descriptions"] == 2
+        assert stats["duplicates"] == 1
+        assert stats["cache_hits"] == 0
+        assert stats["cache_hit_rate"] == 0.0
+        assert jobs[0]["cleaned_description"] == jobs[1]["cleaned_description"]
+        assert jobs[0]["cleaned_description"] != jobs[2]["cleaned_description"]
+        assert "cleaned_description" not in jobs[3]
+
+        rerun = [{"description": "Build APIs in Python. 3 years."}, {"description": "Own the Kotlin app."}]
+        stats = asyncio.run(clean_jobs(rerun, cache=cache))
+
+    assert calls == [2, 1]
+    assert stats["cache_hits"] == 1
+    assert stats["llm_calls"] == 1
+    assert stats["cache_hit_rate"] == 0.5
+    assert rerun[0]["cleaned_description"] == jobs[0]["cleaned_description"]
+
+
+def test_failed_descriptions_are_retried_on_the_next_store_run(tmp_path, monkeypatch):
+    outcomes = [None, "cleaned"]
+
+    async def flaky_agenerate_many(prompts, LLM_name="GEMINI", max_concurrency=1):
+        return [outcomes.pop(0) for _ in prompts]
+
+    monkeypatch.setattr(jd_cleaning, "agenerate_many", flaky_agenerate_many)
+    monkeypatch.setattr(jd_cleaning, "CleanedDescriptionCache", lambda: CleanedDescriptionCache(tmp_path / "jd_cache.sqlite3"))
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    store.add_job({"job_id": "1", "title": "Developer", "company": "Acme", "description": "Build APIs in Python."}, "linkedin")
+
+    stats = asyncio.run(jd_cleaning.aclean_store_jobs(store))
+    assert stats["failed"] == 1
+    assert "cleaned_description" not in store.pending_jobs()[0]
+
+    stats = asyncio.run(jd_cleaning.aclean_store_jobs(store))
+    assert stats["llm_calls"] == 1
+    assert store.pending_jobs()[0].get("cleaned_description") == "cleaned"
+    store.close()
+
+
+def test_stream_reports_hit_rate_saves_to_the_store_and_retries_failures(tmp_path, monkeypatch):
+    outcomes = {"Build APIs in Python.": [RuntimeError("quota"), "cleaned APIs"], "Own the Kotlin app.": ["cleaned Kotlin"]}
+
+    class FlakyModel:
+        def __init__(self, llm_name, prompt):
+            self.description = prompt.rsplit("\n", 1)[1]
+
+        async def agenerate(self):
+            outcome = outcomes[self.description].pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    monkeypatch.setattr(jd_cleaning, "Model", FlakyModel)
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    jobs = [
+        {"source": "linkedin", "job_id": "1", "title": "Developer", "company": "Acme", "description": "Build APIs in Python."},
+        {"source": "linkedin", "job_id": "2", "title": "Android", "company": "Acme", "description": "Own the Kotlin app."},
+    ]
+    for job in jobs:
+        store.add_job(job, "linkedin")
+
+    async def stream(cache):
+        in_queue, out_queue = asyncio.Queue(), asyncio.Queue()
+        for job in jobs:
+            await in_queue.put(dict(job))
+        await in_queue.put(None)
+        stats = await jd_cleaning.clean_job_stream(in_queue, out_queue, cache=cache, store=store)
+        forwarded = []
+        while (job := await out_queue.get()) is not None:
+            forwarded.append(job)
+        return stats, forwarded
+
+    with CleanedDescriptionCache(tmp_path / "jd_cache.sqlite3") as cache:
+        stats, forwarded = asyncio.run(stream(cache))
+        assert stats["failed"] == 1 and stats["cache_hit_rate"] == 0.0
+        assert {job["job_id"]: job.get("cleaned_description") for job in forwarded} == {"1": None, "2": "cleaned Kotlin"}
+        assert {job["job_id"]: job.get("cleaned_description") for job in store.pending_jobs()} == {"1": None, "2": "cleaned Kotlin"}
+
+        stats, forwarded = asyncio.run(stream(cache))
+        assert stats["cache_hits"] == 1 and stats["llm_calls"] == 1
+        assert stats["cache_hit_rate"] == 0.5
+        assert {job["job_id"]: job.get("cleaned_description") for job in store.pending_jobs()} == {
+            "1": "cleaned APIs", "2": "cleaned Kotlin"
+        }
+    store.close()
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import job_fit_analysis.job_fit_analyzer as job_fit_analyzer
+from job_fit_analysis.job_fit_analyzer import JobFitAnalyzer
+from job_fit_analysis.rate_limiter import RateLimiter
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the Gemini endpoint: adds latency and throttles every 4th call."""
+
+    latency = 0.1
+    lock = threading.Lock()
+    calls = 0
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_POST(self):
+        cls = type(self)
+        with cls.lock:
+            cls.calls += 1
+            call_number = cls.calls
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(cls.latency)
+            if call_number % 4 == 0:
+                self.send_response(429)
+                self.end_headers()
+                return
+            score = int(body["prompt"].rsplit("job-", 1)[1])
+            payload = json.dumps({"matchScore": score, "summary": "ok"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class StubbedAnalyzer(JobFitAnalyzer):
+    def __init__(self, endpoint: str, **kwargs):
+        super().__init__(api_key="test-key", **kwargs)
+        self.endpoint = endpoint
+
+    async def generate_async(self, prompt: str) -> str:
+        def post() -> str:
+            request = urllib.request.Request(
+                self.endpoint,
+                data=json.dumps({"prompt": prompt}).encode(),
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(request) as response:
+                return response.read().decode()
+
+        return await asyncio.to_thread(post)
+
+
+@pytest.fixture
+def fake_endpoint():
+    FakeLLMHandler.calls = 0
+    FakeLLMHandler.in_flight = 0
+    FakeLLMHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLMHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/generate"
+    server.shutdown()
+
+
+def test_concurrent_scoring_keeps_order_and_retries_429(fake_endpoint, monkeypatch):
+    monkeypatch.setattr(job_fit_analyzer, "BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(job_fit_analyzer, "USE_CACHE", False)
+    analyzer = StubbedAnalyzer(
+        fake_endpoint, max_concurrency=5, requests_per_minute=6000, prefilter_min_score=0
+    )
+    jobs = [{"title": f"Developer {i}", "company": "Acme", "description": f"job-{i}"} for i in range(20)]
+
+    start = time.monotonic()
+    results = asyncio.run(analyzer.analyze_jobs_async("resume", jobs))
+    elapsed = time.monotonic() - start
+
+    assert [r["status"] for r in results] == ["success"] * len(jobs)
+    assert [r["matchScore"] for r in results] == list(range(len(jobs)))
+    assert FakeLLMHandler.calls > len(jobs)  # some calls were throttled and retried
+    assert FakeLLMHandler.max_in_flight <= 5
+    assert elapsed < len(jobs) * FakeLLMHandler.latency
+
+
+def test_rate_limiter_enforces_requests_per_minute():
+    async def run():
+        limiter = RateLimiter(requests_per_minute=600)  # 10/s after a one-request burst
+        limiter.requests.drain()
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.25
+
+
+def test_rate_limiter_does_not_spend_a_full_minute_up_front():
+    async def run():
+        limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=60000)  # 100 req/s, 1000 tok/s
+        start = time.monotonic()
+        for _ in range(30):
+            await limiter.acquire()
+        requests_elapsed = time.monotonic() - start
+        limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=60000)
+        start = time.monotonic()
+        await limiter.acquire(200)
+        return requests_elapsed, time.monotonic() - start
+
+    requests_elapsed, tokens_elapsed = asyncio.run(run())
+    # a bucket that started full would let all 30 requests (and the 200 tokens) through at once
+    assert requests_elapsed >= 0.25
+    assert tokens_elapsed >= 0.1
+
+
+def test_stream_scoring_overlaps_with_producer(fake_endpoint, monkeypatch):
+    monkeypatch.setattr(job_fit_analyzer, "BACKOFF_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(job_fit_analyzer, "USE_CACHE", False)
+    analyzer = StubbedAnalyzer(
+        fake_endpoint, max_concurrency=5, requests_per_minute=6000, prefilter_min_score=0
+    )
+    produce_interval = 0.1
+    jobs = [{"title": f"Developer {i}", "company": "Acme", "description": f"job-{i}"} for i in range(10)]
+
+    async def run():
+        queue = asyncio.Queue()
+
+        async def produce():
+            for job in jobs:
+                await asyncio.sleep(produce_interval)  # e.g. browser waits in the scraper
+                await queue.put(job)
+            await queue.put(job_fit_analyzer.STREAM_END)
+
+        start = time.monotonic()
+        _, results = await asyncio.gather(produce(), analyzer.analyze_job_stream("resume", queue))
+        return results, time.monotonic() - start
+
+    results, elapsed = asyncio.run(run())
+
+    assert [r["matchScore"] for r in results] == list(range(len(jobs)))
+    # Batch handoff would take produce time + scoring time; streaming hides most of the scoring
+    assert elapsed < len(jobs) * produce_interval + len(jobs) * FakeLLMHandler.latency / 2
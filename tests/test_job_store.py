@@ -0,0 +1,109 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from job_store.near_duplicates import NearDuplicateIndex
+from job_store.store import JobStore, dedup_key
+
+DESCRIPTION = (
+    "We are hiring a full stack developer to build React and Node.js services on AWS. "
+    "You will design REST APIs, write TypeScript, review pull requests and ship features weekly "
+    "with a small product team in Toronto."
+)
+
+
+def job(job_id, title="Full Stack Developer", company="Shopify", description=DESCRIPTION):
+    return {"job_id": job_id, "title": title, "company": company, "description": description}
+
+
+def test_dedup_key_ignores_company_suffixes_and_title_decorations():
+    assert dedup_key("Shopify Inc.", "Full Stack Developer (Remote)") == dedup_key("shopify", "Full-Stack  Developer")
+
+
+def test_same_role_on_two_boards_is_stored_once_as_pending(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    assert store.add_job(job("li-1"), "linkedin") is None
+    reposted = DESCRIPTION.replace("Toronto", "Toronto, Ontario") + " Apply on Indeed!"
+    duplicate_of = store.add_job(job("in-1", title="Full Stack Developer [Hybrid]", company="Shopify Inc", description=reposted), "indeed")
+
+    assert duplicate_of is not None
+    # Adding the same posting again keeps the earlier decision
+    assert store.add_job(job("in-1"), "indeed") == duplicate_of
+    assert [j["job_id"] for j in store.pending_jobs()] == ["li-1"]
+    assert store.stats() == {"jobs": 2, "duplicates": 1, "pending": 1}
+    store.close()
+
+
+def test_same_title_with_a_different_description_is_a_different_role(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    store.add_job(job("1"), "linkedin")
+    other = "Maintain our Android app in Kotlin, own the mobile release train and on-call rotation for payments."
+
+    assert store.add_job(job("2", description=other), "linkedin") is None
+    assert len(store.pending_jobs()) == 2
+    store.close()
+
+
+def test_repost_under_another_company_and_title_is_a_near_duplicate(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    original = store.add_job(job("li-1"), "linkedin")
+    repost = job("in-7", title="Software Developer - Contract", company="Randstad", description=DESCRIPTION + " Ref 4411.")
+
+    assert original is None
+    assert store.add_job(repost, "indeed") == store.pending_jobs()[0]["store_id"]
+    store.close()
+
+
+def test_analyzed_and_cleaned_jobs_round_trip(tmp_path):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    store.add_job(job("1"), "linkedin")
+    qa = "Automate end to end tests for our TypeScript web app with Playwright and keep the CI pipeline green."
+    store.add_job(job("2", title="QA Engineer", description=qa), "indeed")
+
+    pending = store.pending_jobs()
+    pending[0]["cleaned_description"] = "React, Node.js, AWS"
+    store.set_cleaned_descriptions(pending)
+    store.mark_analyzed([pending[1], {"source": "linkedin", "job_id": "unknown"}])
+
+    assert [(j["job_id"], j["cleaned_description"]) for j in store.pending_jobs()] == [("1", "React, Node.js, AWS")]
+    assert {row["title"] for row in store.search("typescript")} == {"Full Stack Developer", "QA Engineer"}
+    assert store.search("kotlin") == []
+    store.close()
+
+
+def test_jobs_stored_before_the_near_duplicate_index_are_backfilled_once(tmp_path, monkeypatch):
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    store.add_job(job("li-1"), "linkedin")
+    store.add_job(job("li-2", title="Intern", description="job-2"), "linkedin")  # too short to index
+    store.close()
+    # Simulate a database written before MinHash signatures were kept
+    conn = sqlite3.connect(str(tmp_path / "jobs.sqlite3"))
+    with conn:
+        conn.execute("DELETE FROM minhash_signatures")
+        conn.execute("DELETE FROM minhash_bands")
+        conn.execute("DELETE FROM meta")
+    conn.close()
+
+    added = []
+    original_add = NearDuplicateIndex.add
+
+    def counting_add(self, doc_id, description):
+        added.append(doc_id)
+        return original_add(self, doc_id, description)
+
+    monkeypatch.setattr(NearDuplicateIndex, "add", counting_add)
+
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    assert sorted(added) == ["1", "2"]
+    assert store.near_duplicates.doc_ids() == {"1"}
+    store.close()
+
+    added.clear()
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    assert added == []  # neither the indexed nor the short posting is scanned again
+    repost = job("in-7", title="Software Developer - Contract", company="Randstad", description=DESCRIPTION + " Ref 4411.")
+    assert store.add_job(repost, "indeed") == 1
+    store.close()
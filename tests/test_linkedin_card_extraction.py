@@ -0,0 +1,101 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from linkedin_scraper import LinkedInJobScraper
+from checkpoint import ScrapeCheckpoint
+from seen_jobs import SeenJobIndex
+from job_store.store import JobStore
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "linkedin_search_results.html"
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen_jobs.sqlite3")
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.sqlite3")
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    yield LinkedInJobScraper(seen_index=index, checkpoint=checkpoint, job_store=store)
+    index.close()
+    checkpoint.close()
+    store.close()
+
+
+def card(title, company, location):
+    return {"index": 0, "job_id": "1", "title": title, "company": company, "location": location, "href": None}
+
+
+def test_card_filters_run_on_list_fields(scraper):
+    scraper.config.BLACKLIST_COMPANIES = ["Jerry"]
+    scraper.config.TITLE_KEYWORDS_BLACKLIST = ["Data Engineer"]
+
+    assert scraper.card_skip_reason(card("Software Developer", "Shopify", "Toronto, ON (Hybrid)")) is None
+    assert scraper.card_skip_reason(card("Frontend Developer", "Jerry", "Toronto, ON")) == "Company in blacklist"
+    assert scraper.card_skip_reason(card("Senior Data Engineer", "RBC", "Toronto, ON")) == "Title contains keyword in blacklist"
+    assert scraper.card_skip_reason(card("Backend Developer", "Ecobee", "Vancouver, BC")) == "Location not in GTA"
+
+
+def test_bulk_extraction_reads_all_cards_in_one_evaluate(scraper):
+    async_api = pytest.importorskip("playwright.async_api")
+
+    async def run():
+        async with async_api.async_playwright() as playwright:
+            try:
+                browser = await playwright.chromium.launch()
+            except Exception as exc:
+                pytest.skip(f"Chromium not available: {exc}")
+            page = await browser.new_page()
+            await page.set_content(FIXTURE.read_text(encoding="utf-8"))
+            cards = await scraper.adapter.extract_card_summaries(page)
+            await browser.close()
+            return cards
+
+    cards = asyncio.run(run())
+
+    # <li data-job-id> cards also match through their inner wrapper; both resolve to the same id
+    assert len({c["job_id"] for c in cards}) == 25
+    first = next(c for c in cards if c["job_id"] == "4100000001")
+    assert (first["title"], first["company"], first["location"]) == (
+        "Full Stack Developer", "Wealthsimple", "Toronto, ON (Remote)"
+    )
+    assert cards[0]["job_id"] == "4100000000"  # id taken from the currentJobId link when there is no attribute
+
+
+class LazyList:
+    """Results list that attaches a batch of cards per scroll step until its end is reached"""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.count = 0
+        self.scrolls = 0
+
+    async def wait_for_selector(self, selector, timeout=None):
+        return self
+
+    async def evaluate(self, script, args):
+        self.scrolls += 1
+        if self.batches:
+            self.count += self.batches.pop(0)
+        return {"count": self.count, "atBottom": not self.batches}
+
+
+def test_scroll_stops_once_card_count_stops_growing(scraper):
+    scraper.config.SCROLL_POLL_INTERVAL = 0.01
+    lazy = LazyList([7, 7, 7, 4])
+
+    count = asyncio.run(scraper.adapter.scroll_visually_down(lazy, ".semantic-search-results-list", max_duration=5))
+    assert count == 25
+    assert lazy.scrolls == 4 + scraper.config.SCROLL_STABLE_POLLS
+
+
+def test_scroll_is_capped_by_max_duration(scraper):
+    scraper.config.SCROLL_POLL_INTERVAL = 0.01
+    lazy = LazyList([1] * 10_000)
+
+    count = asyncio.run(scraper.adapter.scroll_visually_down(lazy, ".semantic-search-results-list", max_duration=0.1))
+    assert 0 < count < 10_000
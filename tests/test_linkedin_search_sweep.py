@@ -0,0 +1,130 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from linkedin_scraper import LinkedInJobScraper
+from scraper_helpers import DomainPacer
+from checkpoint import ScrapeCheckpoint
+from seen_jobs import SeenJobIndex
+from job_store.store import JobStore
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    async def new_page(self):
+        return FakePage()
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    index = SeenJobIndex(tmp_path / "seen_jobs.sqlite3")
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.sqlite3")
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    yield LinkedInJobScraper(seen_index=index, checkpoint=checkpoint, job_store=store)
+    index.close()
+    checkpoint.close()
+    store.close()
+
+
+def test_sweep_runs_searches_concurrently_and_merges_in_task_order(scraper):
+    scraper.config.KEYWORDS = {f"keyword {i}": 1 for i in range(6)}
+    scraper.config.LOCATIONS = ["Toronto", "Ottawa"]
+    scraper.config.SEARCH_TABS = 3
+    scraper.search_pacer = DomainPacer(min_interval=0)
+    running = 0
+    max_running = 0
+
+    async def fake_search(page, keyword, location, max_pages):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # later tasks finish first, so merging must not follow completion order
+        await asyncio.sleep(0.05 if keyword.endswith("0") else 0.01)
+        running -= 1
+        return [{"job_id": f"{keyword}|{location}"}]
+
+    scraper.search_jobs = fake_search
+    asyncio.run(scraper.sweep_searches(FakeContext()))
+
+    assert max_running == 3
+    assert [job["job_id"] for job in scraper.jobs_data] == [
+        f"keyword {i}|{location}" for i in range(6) for location in ("Toronto", "Ottawa")
+    ]
+
+
+def test_search_url_carries_keyword_location_time_range_and_offset(scraper):
+    scraper.config.TIME_LIMIT = 24
+    url = scraper.adapter.build_search_url("next.js developer not senior", "Ontario, Canada", start=50)
+
+    assert url == (
+        "https://www.linkedin.com/jobs/search/?keywords=next.js+developer+not+senior"
+        "&location=Ontario%2C+Canada&f_TPR=r86400&start=50"
+    )
+    assert "start=" not in scraper.adapter.build_search_url("developer", "Toronto")
+
+
+def test_search_falls_back_to_ui_only_when_results_list_is_missing(scraper):
+    adapter = scraper.adapter
+    calls = []
+
+    class Surface(FakePage):
+        async def wait_for_selector(self, selector, **kwargs):
+            return self
+
+        async def query_selector(self, selector):
+            return None  # no Next button
+
+    async def open_search_url(page, keyword, location, start=0):
+        calls.append(("url", start))
+        return None if keyword == "broken" else page
+
+    async def search_via_ui(page, keyword):
+        calls.append(("ui", 0))
+        return page
+
+    async def scroll_visually_down(surface, selector):
+        return 25
+
+    async def extract_card_summaries(surface):
+        return []
+
+    adapter.open_search_url = open_search_url
+    adapter.search_via_ui = search_via_ui
+    adapter.scroll_visually_down = scroll_visually_down
+    adapter.extract_card_summaries = extract_card_summaries
+
+    async def pages(keyword, first_page):
+        return [number async for number, _, _ in adapter.result_pages(Surface(), keyword, "Toronto", 3, first_page)]
+
+    # direct URL, resumed at page 2; an empty page ends URL pagination
+    assert asyncio.run(pages("developer", first_page=2)) == [2]
+    assert calls == [("url", 25)]
+
+    calls.clear()
+    assert asyncio.run(pages("broken", first_page=2)) == [1]
+    assert calls == [("url", 25), ("ui", 0)]
+
+
+def test_sweep_skips_searches_finished_before_a_resume(scraper):
+    scraper.config.KEYWORDS = {"react developer": 1, "node developer": 1}
+    scraper.config.LOCATIONS = ["Toronto"]
+    scraper.search_pacer = DomainPacer(min_interval=0)
+    scraper.checkpoint.mark_search_done("react developer", "Toronto")
+    searched = []
+
+    async def fake_search(page, keyword, location, max_pages):
+        searched.append(keyword)
+        return []
+
+    scraper.search_jobs = fake_search
+    asyncio.run(scraper.sweep_searches(FakeContext()))
+    assert searched == ["node developer"]
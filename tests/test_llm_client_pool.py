@@ -0,0 +1,89 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from LLMClients import clients
+from LLMClients.clients import Model, generate_many
+
+
+class ChatCompletionsStub(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible endpoint that records which TCP connection served each call."""
+
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    connections = set()
+
+    def do_POST(self):
+        with type(self).lock:
+            type(self).connections.add(self.client_address)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+        payload = json.dumps({
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": f"echo: {prompt}"},
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def openai_stub(monkeypatch):
+    ChatCompletionsStub.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChatCompletionsStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    clients.reset_clients()
+    yield
+    clients.reset_clients()
+    server.shutdown()
+
+
+def test_sync_calls_reuse_one_connection(openai_stub):
+    responses = [Model("OPENAI", f"prompt {i}").get_response_from_client() for i in range(5)]
+    assert responses == [f"echo: prompt {i}" for i in range(5)]
+    assert len(ChatCompletionsStub.connections) == 1
+
+
+def test_generate_many_fans_out_over_bounded_pool(openai_stub):
+    prompts = [f"prompt {i}" for i in range(12)]
+    responses = generate_many(prompts, LLM_name="OPENAI", max_concurrency=4)
+    assert responses == [f"echo: {p}" for p in prompts]
+    assert 1 <= len(ChatCompletionsStub.connections) <= 4
+
+
+def test_batches_share_one_async_client_until_reset(openai_stub):
+    async def current_client():
+        return clients.get_async_client("OPENAI")
+
+    generate_many([f"first {i}" for i in range(8)], LLM_name="OPENAI", max_concurrency=4)
+    client = clients.run_batch(current_client())
+    generate_many([f"second {i}" for i in range(8)], LLM_name="OPENAI", max_concurrency=4)
+
+    assert clients.run_batch(current_client()) is client
+    # the second batch reuses the first batch's keep-alive connections
+    assert len(ChatCompletionsStub.connections) <= 4
+
+    clients.reset_clients()
+    assert client.is_closed()
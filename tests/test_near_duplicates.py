@@ -0,0 +1,95 @@
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import job_fit_analysis.job_fit_analyzer as job_fit_analyzer
+from job_fit_analysis.job_fit_analyzer import JobFitAnalyzer
+from job_store.near_duplicates import NearDuplicateIndex
+
+POSTING = (
+    "Our client, a leading Canadian bank, is hiring a Full Stack Developer to join its digital payments team. "
+    "You will build React front ends and Node.js microservices on AWS, write TypeScript, design REST APIs, "
+    "take part in code reviews and agile ceremonies, and work closely with product owners and QA. "
+    "Requirements: three or more years of JavaScript experience, PostgreSQL, Docker and CI/CD pipelines. "
+    "Hybrid role, three days a week in the downtown Toronto office."
+)
+REPOST = (
+    "Our client, a leading Canadian bank, is hiring a Full Stack Developer to join its digital payments team! "
+    "You will build React front ends and Node.js microservices on AWS, write TypeScript, design REST APIs, "
+    "take part in code reviews and agile ceremonies, and work closely with product owners and QA. "
+    "Requirements: five or more years of JavaScript experience, PostgreSQL, Docker and CI/CD pipelines. "
+    "Hybrid role, three days a week in the downtown Toronto office. Job ref #88213."
+)
+WORDS = (
+    "kotlin android payments compliance data warehouse kafka terraform golang security audit mobile design "
+    "research analytics embedded firmware sales support network linux salesforce marketing finance legal"
+).split()
+
+
+def unrelated_posting(seed):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(80))
+
+
+def test_repost_under_a_new_id_is_a_near_duplicate(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "near_duplicates.sqlite3")
+    assert index.check_and_add("li-1", POSTING) is None
+
+    assert index.check_and_add("agency-9", REPOST) == "li-1"
+    assert "agency-9" not in index
+    assert index.find(unrelated_posting(1)) is None
+    index.close()
+
+
+def test_index_persists_and_only_compares_bucket_candidates(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "near_duplicates.sqlite3")
+    for i in range(200):
+        index.add(f"job-{i}", unrelated_posting(i))
+    index.add("li-1", POSTING)
+    index.close()
+
+    reopened = NearDuplicateIndex(tmp_path / "near_duplicates.sqlite3")
+    assert len(reopened) == 201
+    # LSH buckets narrow the history down to a handful of candidates instead of all 201 signatures
+    candidates = reopened.candidates(reopened.signature(REPOST))
+    assert "li-1" in candidates
+    assert len(candidates) < 20
+    assert reopened.similar(REPOST)[0][0] == "li-1"
+    reopened.close()
+
+
+def test_short_descriptions_are_never_near_duplicates(tmp_path):
+    index = NearDuplicateIndex(tmp_path / "near_duplicates.sqlite3")
+    assert index.check_and_add("1", "job-1") is None
+    assert index.check_and_add("2", "job-2") is None
+    index.close()
+
+
+def test_analyzer_scores_each_reposted_job_once(monkeypatch):
+    monkeypatch.setattr(job_fit_analyzer, "USE_CACHE", False)
+
+    class CountingAnalyzer(JobFitAnalyzer):
+        def __init__(self):
+            super().__init__(api_key="test-key", prefilter_min_score=0)
+            self.prompts = []
+
+        async def generate_async(self, prompt):
+            self.prompts.append(prompt)
+            return '{"matchScore": 80}'
+
+    analyzer = CountingAnalyzer()
+    jobs = [
+        {"title": "Full Stack Developer", "company": "Bank", "description": POSTING},
+        {"title": "Developer (Contract)", "company": "Agency", "description": REPOST},
+        {"title": "Android Developer", "company": "Bank", "description": unrelated_posting(7)},
+    ]
+
+    results = asyncio.run(analyzer.analyze_jobs_async("resume", jobs))
+
+    assert [r["status"] for r in results] == ["success", "duplicate", "success"]
+    assert results[1]["duplicateOf"] == 0
+    assert len(analyzer.prompts) == 2
@@ -0,0 +1,256 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from main import JobAutomationOrchestrator, StreamInterrupted
+
+
+def good_job(job_id, company="Shopify", title="Full Stack Developer"):
+    return {"job": {"job_id": job_id, "company": company, "title": title, "description": f"Posting {job_id}"}}
+
+
+@pytest.fixture
+def orchestrator(tmp_path, monkeypatch):
+    orchestrator = JobAutomationOrchestrator(max_workers=2)
+    orchestrator.runs_dir = tmp_path / "application_runs"
+    orchestrator.additional_info_path = str(tmp_path / "additional_info.txt")
+    orchestrator.exports = 0
+
+    def export():
+        orchestrator.exports += 1
+
+    monkeypatch.setattr(orchestrator, "get_application_builder", lambda: None)
+    monkeypatch.setattr(orchestrator, "export_application_journal_in_process", export)
+    return orchestrator
+
+
+def test_worker_pool_never_exceeds_max_workers(orchestrator, monkeypatch):
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def build(job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix=None):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    monkeypatch.setattr(orchestrator, "load_good_jobs", lambda: [good_job(str(i)) for i in range(6)])
+    monkeypatch.setattr(orchestrator, "build_application_in_process", build)
+
+    results = asyncio.run(orchestrator.process_all_jobs())
+
+    assert [r["status"] for r in results] == ["success"] * 6
+    assert peak[0] == 2
+    assert orchestrator.exports == 1
+
+
+def test_journal_is_exported_when_a_job_raises(orchestrator, monkeypatch):
+    def build(job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix=None):
+        if job_index == 1:
+            raise RuntimeError("resume customizer crashed")
+
+    monkeypatch.setattr(orchestrator, "load_good_jobs", lambda: [good_job("1"), good_job("2")])
+    monkeypatch.setattr(orchestrator, "build_application", build)
+    results = asyncio.run(orchestrator.process_all_jobs())
+    assert [r["status"] for r in results] == ["success", "failed"]
+    assert results[1]["error"] == "resume customizer crashed"
+    assert orchestrator.exports == 1
+
+    # Even an error escaping the worker itself still syncs the journal
+    def crash(*args):
+        raise RuntimeError("worker thread died")
+
+    monkeypatch.setattr(orchestrator, "process_job", crash)
+    with pytest.raises(RuntimeError):
+        asyncio.run(orchestrator.process_all_jobs())
+    assert orchestrator.exports == 2
+
+
+def test_jobs_with_the_same_company_and_title_get_their_own_folder(orchestrator, monkeypatch):
+    suffixes = []
+
+    def build(job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix=None):
+        suffixes.append(folder_suffix)
+
+    jobs = [good_job("4011"), good_job("4012"), good_job(None)]
+    monkeypatch.setattr(orchestrator, "load_good_jobs", lambda: jobs)
+    monkeypatch.setattr(orchestrator, "build_application_in_process", build)
+    asyncio.run(orchestrator.process_all_jobs())
+
+    assert sorted(suffixes) == ["003", "4011", "4012"]
+
+
+def test_additional_info_is_taken_for_one_run_only(orchestrator, monkeypatch):
+    Path(orchestrator.additional_info_path).write_text("Referred by Jane", encoding="utf-8")
+    workdirs = []
+
+    def build(job_index, total_jobs, company, title, easy_apply, jd_source_path, folder_suffix=None):
+        workdirs.append(Path(jd_source_path).parent)
+
+    monkeypatch.setattr(orchestrator, "load_good_jobs", lambda: [good_job("1"), good_job("2")])
+    monkeypatch.setattr(orchestrator, "build_application_in_process", build)
+    asyncio.run(orchestrator.process_all_jobs())
+
+    assert [(w / "additional_info.txt").read_text(encoding="utf-8") for w in workdirs] == ["Referred by Jane"] * 2
+    assert Path(orchestrator.additional_info_path).read_text(encoding="utf-8") == ""
+
+    workdirs.clear()
+    orchestrator.runs_dir = orchestrator.runs_dir.with_name("next_runs")
+    asyncio.run(orchestrator.process_all_jobs())
+    assert not any((w / "additional_info.txt").exists() for w in workdirs)
+
+
+def test_failed_in_process_import_falls_back_to_test_py_subprocesses(orchestrator, monkeypatch):
+    def broken_import():
+        raise ImportError("No module named 'docx'")
+
+    scripts = []
+    monkeypatch.setattr(orchestrator, "get_application_builder", broken_import)
+    monkeypatch.setattr(orchestrator, "run_test_script", lambda *args: scripts.append(args[0]))
+    monkeypatch.setattr(orchestrator, "load_good_jobs", lambda: [good_job("1"), good_job("2")])
+
+    results = asyncio.run(orchestrator.process_all_jobs())
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    assert sorted(scripts) == [0, 1]
+
+
+def test_failed_in_process_calls_fall_back_to_subprocesses(orchestrator, monkeypatch):
+    calls = []
+
+    def build(job_index, *args):
+        raise RuntimeError("customizer crashed")
+
+    def export():
+        raise PermissionError("Job Tracker.xlsx is open")
+
+    monkeypatch.setattr(orchestrator, "build_application_in_process", build)
+    monkeypatch.setattr(orchestrator, "run_test_script", lambda *args: calls.append("test.py"))
+    monkeypatch.setattr(orchestrator, "export_application_journal_in_process", export)
+    monkeypatch.setattr(orchestrator, "export_application_journal", lambda: calls.append("export"))
+    monkeypatch.setattr(orchestrator, "load_good_jobs", lambda: [good_job("1")])
+
+    results = asyncio.run(orchestrator.process_all_jobs())
+
+    assert results[0]["status"] == "success"
+    assert calls == ["test.py", "export"]
+
+
+def test_failed_streaming_stages_fall_back_to_subprocess_stages(orchestrator, monkeypatch):
+    calls = []
+
+    async def streaming():
+        raise ImportError("No module named 'playwright'")
+
+    async def process_all_jobs():
+        calls.append("applications")
+
+    monkeypatch.setattr(orchestrator, "run_streaming_stages", streaming)
+    for stage in ("run_scraper", "run_jd_cleaning", "run_analyzer"):
+        monkeypatch.setattr(orchestrator, stage, lambda stage=stage, **options: calls.append((stage, options)))
+    monkeypatch.setattr(orchestrator, "process_all_jobs", process_all_jobs)
+
+    asyncio.run(orchestrator.run_complete_workflow())
+
+    # Nothing was streamed yet, so this is a fresh scrape and a fresh analysis
+    assert calls == [
+        ("run_scraper", {"resume": False}), ("run_jd_cleaning", {}), ("run_analyzer", {"merge": False}), "applications"
+    ]
+
+
+@pytest.fixture
+def streaming(orchestrator, tmp_path, monkeypatch):
+    """In-process streaming stages with a scraper that crashes after streaming three jobs"""
+    sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+    import linkedin_scraper
+    import job_description_cleaner.jd_cleaning as jd_cleaning
+    import job_fit_analysis.job_fit_analyzer as job_fit_analyzer
+    import job_store.store as job_store
+    from job_fit_analysis.job_fit_analyzer import JobFitAnalyzer
+
+    jobs = [
+        {"source": "linkedin", "job_id": str(i), "title": f"Developer {i}", "company": "Acme", "description": f"job {i}"}
+        for i in range(3)
+    ]
+
+    class FakeScraper:
+        def __init__(self, job_queue=None):
+            self.job_queue = job_queue
+            self.published_job_ids = set()
+
+        async def run_scraper(self):
+            try:
+                for job in jobs:
+                    self.published_job_ids.add(job["job_id"])
+                    await self.job_queue.put(dict(job))
+                raise RuntimeError("browser crashed")
+            finally:
+                await self.job_queue.put(None)
+
+    class FakeModel:
+        def __init__(self, llm_name, prompt):
+            pass
+
+        async def agenerate(self):
+            return "cleaned"
+
+    class ScoringAnalyzer(JobFitAnalyzer):
+        async def generate_async(self, prompt):
+            return '{"matchScore": 80}'
+
+    analyzer = ScoringAnalyzer(api_key="test-key", prefilter_min_score=0)
+    monkeypatch.setattr(analyzer, "load_resume", lambda path: "resume")
+    monkeypatch.setattr(analyzer, "filter_already_applied", lambda matches: matches)
+    monkeypatch.setattr(orchestrator, "get_analyzer", lambda: analyzer)
+    monkeypatch.setattr(orchestrator, "good_jobs_path", tmp_path / "good_score_jobs.json")
+    monkeypatch.setattr(job_fit_analyzer, "USE_CACHE", False)
+    monkeypatch.setattr(linkedin_scraper, "LinkedInJobScraper", FakeScraper)
+    monkeypatch.setattr(jd_cleaning, "Model", FakeModel)
+    cache_class, store_class = jd_cleaning.CleanedDescriptionCache, job_store.JobStore
+    monkeypatch.setattr(jd_cleaning, "CleanedDescriptionCache", lambda: cache_class(tmp_path / "jd_cache.sqlite3"))
+    monkeypatch.setattr(job_store, "JobStore", lambda: store_class(tmp_path / "jobs.sqlite3"))
+    return analyzer
+
+
+def test_stream_end_stops_every_stage_when_the_scraper_fails(orchestrator, streaming):
+    with pytest.raises(StreamInterrupted, match="after 3 jobs: browser crashed"):
+        asyncio.run(asyncio.wait_for(orchestrator.run_streaming_stages(), timeout=10))
+
+    good_jobs = orchestrator.load_good_jobs()
+    assert [match["job"]["job_id"] for match in good_jobs] == ["0", "1", "2"]
+    assert {match["job"]["cleaned_description"] for match in good_jobs} == {"cleaned"}
+
+
+def test_stream_failing_midway_resumes_and_keeps_earlier_matches(orchestrator, streaming, monkeypatch):
+    from job_fit_analysis.job_fit_analyzer import finish_analysis
+
+    calls = []
+
+    def run_analyzer(merge=False):
+        # Stands in for the analyzer subprocess scoring the jobs the resumed scrape added
+        calls.append(("run_analyzer", merge))
+        later = {"source": "linkedin", "job_id": "3", "title": "Developer 3", "company": "Acme", "description": "job 3"}
+        results = [{"job": later, "matchScore": 90, "analysis": {}, "status": "success"}]
+        finish_analysis(streaming, results, str(orchestrator.good_jobs_path), merge=merge)
+
+    async def process_all_jobs():
+        calls.append(("applications", None))
+
+    monkeypatch.setattr(orchestrator, "run_scraper", lambda resume=False: calls.append(("run_scraper", resume)))
+    monkeypatch.setattr(orchestrator, "run_jd_cleaning", lambda: calls.append(("run_jd_cleaning", None)))
+    monkeypatch.setattr(orchestrator, "run_analyzer", run_analyzer)
+    monkeypatch.setattr(orchestrator, "process_all_jobs", process_all_jobs)
+
+    asyncio.run(orchestrator.run_complete_workflow())
+
+    assert calls == [("run_scraper", True), ("run_jd_cleaning", None), ("run_analyzer", True), ("applications", None)]
+    assert [match["job"]["job_id"] for match in orchestrator.load_good_jobs()] == ["0", "1", "2", "3"]
@@ -0,0 +1,71 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import job_fit_analysis.job_fit_analyzer as job_fit_analyzer
+from job_fit_analysis.job_fit_analyzer import JobFitAnalyzer
+from job_fit_analysis.prefilter import LexicalPrefilter
+from job_store.store import JobStore
+
+RESUME = "Full stack developer: React, TypeScript, Node.js, Next.js, AWS Lambda, PostgreSQL, REST APIs"
+
+
+def test_unrelated_jobs_are_rejected_and_scores_kept():
+    jobs = [
+        {"title": "React Developer", "description": "Build React and TypeScript front ends backed by Node.js REST APIs."},
+        {"title": "Registered Nurse", "description": "Provide patient care, administer medication, ICU shifts."},
+        {"title": "Backend Developer", "description": "Node.js services on AWS Lambda with PostgreSQL."},
+    ]
+    kept, rejected, scores = LexicalPrefilter(min_score=0.05).split(RESUME, jobs)
+    assert kept == [0, 2]
+    assert rejected == [1]
+    assert len(scores) == len(jobs)
+    assert scores[0] > scores[1] and scores[2] > scores[1]
+
+
+def test_cleaned_description_is_preferred():
+    job = {"title": "Developer", "description": "benefits perks culture", "cleaned_description": "React TypeScript"}
+    assert "React TypeScript" in LexicalPrefilter.job_text(job)
+
+
+def test_a_job_gets_the_same_score_in_stream_and_batch_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_fit_analyzer, "USE_CACHE", False)
+    jobs = [
+        {"title": "React Developer", "description": "Build React and TypeScript front ends backed by Node.js REST APIs."},
+        {"title": "Registered Nurse", "description": "Provide patient care, administer medication, ICU shifts."},
+        {"title": "Backend Developer", "description": "Node.js services on AWS Lambda with PostgreSQL."},
+    ]
+    store = JobStore(tmp_path / "jobs.sqlite3")
+    for i, job in enumerate(jobs):
+        store.add_job({"job_id": str(i), **job}, "linkedin")
+
+    class StubbedAnalyzer(JobFitAnalyzer):
+        async def generate_async(self, prompt):
+            return '{"matchScore": 80}'
+
+    analyzer = StubbedAnalyzer(
+        api_key="test-key", requests_per_minute=6000, prefilter_min_score=0.05, near_duplicate_similarity=0
+    )
+    audits = []
+    monkeypatch.setattr(analyzer, "save_prefilter_audit", lambda jobs, scores: audits.append([float(s) for s in scores]))
+    analyzer.fit_prefilter(store)
+    store.close()
+
+    async def stream(job):
+        queue = asyncio.Queue()
+        await queue.put(job)
+        await queue.put(job_fit_analyzer.STREAM_END)
+        return await analyzer.analyze_job_stream(RESUME, queue)
+
+    asyncio.run(analyzer.analyze_jobs_async(RESUME, jobs))
+    for job in jobs:
+        asyncio.run(stream(job))
+
+    batch_scores, stream_scores = audits[0], [audit[0] for audit in audits[1:]]
+    assert batch_scores == pytest.approx(stream_scores)
+    assert batch_scores[1] < 0.05 <= min(batch_scores[0], batch_scores[2])
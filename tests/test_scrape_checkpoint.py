@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from checkpoint import ScrapeCheckpoint
+
+
+def job(job_id):
+    return {"job_id": job_id, "title": f"Developer {job_id}", "description": "Build things"}
+
+
+def test_resume_reloads_finished_pages_and_their_jobs(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.sqlite3")
+    checkpoint.record_page("react developer", "Toronto", 1, [job("1"), job("2")])
+    checkpoint.record_page("react developer", "Toronto", 2, [job("3")])
+    checkpoint.mark_search_done("react developer", "Toronto")
+    checkpoint.record_page("node developer", "Toronto", 1, [job("2"), job("4")])
+    checkpoint.close()  # the run crashed here
+
+    resumed = ScrapeCheckpoint(tmp_path / "checkpoint.sqlite3")
+    assert [j["job_id"] for j in resumed.restore(resume=True)] == ["1", "2", "3", "4"]
+    assert resumed.is_done("react developer", "Toronto")
+    assert not resumed.is_done("node developer", "Toronto")
+    assert resumed.finished_pages("node developer", "Toronto") == {1}
+    resumed.close()
+
+
+def test_fresh_run_starts_from_an_empty_checkpoint(tmp_path):
+    checkpoint = ScrapeCheckpoint(tmp_path / "checkpoint.sqlite3")
+    checkpoint.record_page("react developer", "Toronto", 1, [job("1")])
+
+    assert checkpoint.restore(resume=False) == []
+    assert not checkpoint.is_done("react developer", "Toronto", 1)
+    assert checkpoint.restore(resume=True) == []
+    checkpoint.close()
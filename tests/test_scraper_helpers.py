@@ -0,0 +1,131 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from config import Config
+from scraper_helpers import DomainPacer, PagePool, ResourcePolicy, ScraperHelpers
+
+
+def test_pacer_spaces_navigations_per_domain_across_tabs():
+    pacer = DomainPacer(min_interval=0.1)
+    starts = {}
+
+    async def navigate(tab, url):
+        await pacer.wait(url)
+        starts[tab] = time.monotonic()
+
+    async def run():
+        begin = time.monotonic()
+        await asyncio.gather(
+            *(navigate(f"linkedin-{i}", "https://www.linkedin.com/jobs/view/1/") for i in range(3)),
+            navigate("other", "https://ca.indeed.com/viewjob?jk=1"),
+        )
+        return begin
+
+    begin = asyncio.run(run())
+    linkedin = sorted(starts[f"linkedin-{i}"] - begin for i in range(3))
+    assert linkedin[1] - linkedin[0] >= 0.09 and linkedin[2] - linkedin[1] >= 0.09
+    assert linkedin[2] < 0.3  # tabs waited for their slots concurrently, not one full delay each
+    assert starts["other"] - begin < 0.05  # other domains are not held back
+
+
+class FakePage:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        self.pages.append(FakePage(len(self.pages)))
+        return self.pages[-1]
+
+
+def test_page_pool_reuses_tabs_and_recycles_after_max_navigations():
+    context = FakeContext()
+
+    async def run():
+        pool = await PagePool(context, size=2, max_navigations=3).start()
+        in_use = 0
+        max_in_use = 0
+
+        async def navigate():
+            nonlocal in_use, max_in_use
+            async with pool.page() as page:
+                assert not page.closed
+                in_use += 1
+                max_in_use = max(max_in_use, in_use)
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        await asyncio.gather(*(navigate() for _ in range(12)))
+        await pool.close()
+        return pool, max_in_use
+
+    pool, max_in_use = asyncio.run(run())
+    assert max_in_use == 2
+    assert pool.recycled == 4  # 12 navigations / 3 per tab
+    assert len(context.pages) == 2 + 4
+    assert all(page.closed for page in context.pages)
+
+
+def test_resource_policy_blocks_by_type_and_host():
+    policy = ResourcePolicy(
+        blocked_types=["image", "font"],
+        first_party_hosts=["linkedin.com", "licdn.com"],
+        blocked_hosts=["doubleclick.net"],
+    )
+    assert policy.should_block("image", "https://media.licdn.com/logo.png")
+    assert policy.should_block("script", "https://stats.g.doubleclick.net/dc.js")
+    assert not policy.should_block("script", "https://static.licdn.com/app.js")
+    assert not policy.should_block("script", "https://cdn.example.com/widget.js")
+    assert not policy.should_block("document", "https://www.linkedin.com/jobs/view/1/")
+
+    policy.block_third_party = True
+    assert policy.should_block("script", "https://cdn.example.com/widget.js")
+    assert not policy.should_block("xhr", "https://www.linkedin.com/voyager/api/jobs")
+    assert not policy.should_block("document", "https://challenge.example.com/captcha")
+
+
+class GrowingList:
+    """Results list that lazy-loads cards in batches, then stops growing"""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.count = 0
+        self.polls = 0
+
+    async def evaluate(self, script, selector):
+        self.polls += 1
+        if self.batches:
+            self.count += self.batches.pop(0)
+        return self.count
+
+
+def test_wait_for_stable_count_returns_once_cards_stop_loading():
+    helpers = ScraperHelpers(Config)
+    surface = GrowingList([7, 7, 0, 7, 4])
+
+    count = asyncio.run(helpers.wait_for_stable_count(surface, ".job-card", poll_interval=0.01, stable_polls=2))
+    assert count == 25
+    assert surface.polls == 7  # five batches (one empty) + two unchanged polls
+
+
+def test_wait_for_stable_count_gives_up_at_timeout():
+    helpers = ScraperHelpers(Config)
+    surface = GrowingList([1] * 1000)
+
+    start = time.monotonic()
+    count = asyncio.run(helpers.wait_for_stable_count(surface, ".job-card", timeout=0.1, poll_interval=0.01))
+    assert time.monotonic() - start < 0.5
+    assert 0 < count < 1000
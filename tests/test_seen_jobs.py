@@ -0,0 +1,33 @@
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "job_scrape"))
+
+from seen_jobs import SeenJobIndex
+
+
+def write_batch(path: Path, job_ids):
+    path.write_text(json.dumps([{"job_id": job_id, "title": "Developer"} for job_id in job_ids]))
+
+
+def test_batch_files_are_imported_once_and_new_batches_incrementally(tmp_path):
+    batches = tmp_path / "linkedin_jobs"
+    batches.mkdir()
+    write_batch(batches / "linkedin_jobs_batch_1.json", ["101", "102"])
+
+    index = SeenJobIndex(batches / "seen_jobs.sqlite3")
+    assert index.sync_batch_files(batches) == 1
+    assert "101" in index and "999" not in index
+
+    # A new batch saved by the scraper is recorded without re-reading old files
+    write_batch(batches / "linkedin_jobs_batch_2.json", ["103"])
+    index.add_many(["103"], batch_file="linkedin_jobs_batch_2.json")
+    assert index.sync_batch_files(batches) == 0
+    assert len(index) == 3
+    index.close()
+
+    reopened = SeenJobIndex(batches / "seen_jobs.sqlite3")
+    assert "103" in reopened
+    reopened.close()